@@ -60,7 +60,7 @@ def _validate_export_params(model, format_type: str, **kwargs) -> Dict[str, Any]
     """Validate export parameters for different formats"""
     
     if format_type == 'torch':
-        valid_params = {'input_shape', 'use_onnx_fallback'}
+        valid_params = {'input_shape', 'onnx_first', 'use_onnx_fallback'}
         # Set default input shape if not provided
         if 'input_shape' not in kwargs:
             kwargs['input_shape'] = (1, 3, 224, 224)
@@ -69,7 +69,7 @@ def _validate_export_params(model, format_type: str, **kwargs) -> Dict[str, Any]
         valid_params = {'use_concrete_function'}
     
     elif format_type == 'onnx':
-        valid_params = {'optimize'}
+        valid_params = {'optimize', 'validate', 'precision'}
         # Set default optimization
         if 'optimize' not in kwargs:
             kwargs['optimize'] = True
@@ -259,7 +259,8 @@ def get_supported_formats() -> Dict[str, Dict[str, Any]]:
             'file_extensions': ['.pth', '.pt'],
             'parameters': {
                 'input_shape': 'Input tensor shape for tracing (default: (1,3,224,224))',
-                'use_onnx_fallback': 'Use ONNX export if direct conversion fails'
+                'onnx_first': 'Convert through ONNX export first, capturing the graph directly only if it fails (default: True)',
+                'use_onnx_fallback': 'Deprecated alias for onnx_first'
             },
             'supported_ops': ['conv2d', 'linear', 'relu', 'max_pool2d', 'batch_norm', 'dropout']
         },
@@ -275,7 +276,9 @@ def get_supported_formats() -> Dict[str, Dict[str, Any]]:
             'description': 'ONNX models',
             'file_extensions': ['.onnx'],
             'parameters': {
-                'optimize': 'Apply basic graph optimizations (default: True)'
+                'optimize': 'Apply basic graph optimizations (default: True)',
+                'validate': 'Run the full onnx.checker pass on the model (default: False)',
+                'precision': "Weight storage precision: 'fp32', 'fp16' or 'bf16' (default: 'fp32')"
             },
             'supported_ops': ['Conv', 'Relu', 'MaxPool', 'MatMul', 'Add', 'BatchNormalization']
         }
@@ -122,10 +122,19 @@ Examples:
         help='Input shape for PyTorch models (e.g., "1,3,224,224")'
     )
     
-    parser.add_argument(
+    fallback_group = parser.add_mutually_exclusive_group()
+    fallback_group.add_argument(
         '--use-onnx-fallback',
+        dest='onnx_first',
         action='store_true',
-        help='Use ONNX export fallback for PyTorch models'
+        default=True,
+        help='Convert PyTorch models through ONNX export first, capturing the graph directly only if export fails (default: True)'
+    )
+    fallback_group.add_argument(
+        '--no-onnx-fallback', '--direct',
+        dest='onnx_first',
+        action='store_false',
+        help='Capture the PyTorch graph directly first, using ONNX export only if that fails'
     )
     
     parser.add_argument(
@@ -358,8 +367,7 @@ def main() -> int:
         if format_type == 'torch':
             if args.input_shape:
                 export_kwargs['input_shape'] = args.input_shape
-            if args.use_onnx_fallback:
-                export_kwargs['use_onnx_fallback'] = True
+            export_kwargs['onnx_first'] = args.onnx_first
         
         elif format_type == 'tf':
             if args.use_concrete_function:
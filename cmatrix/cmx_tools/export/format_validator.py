@@ -7,6 +7,7 @@ Validates model structure, operations, and compatibility for embedded deployment
 
 import numpy as np
 from typing import Dict, List, Any, Set, Tuple, Optional
+from collections import namedtuple, Counter
 import re
 
 class CMXGraph:
@@ -34,6 +35,59 @@ class ValidationWarning(Exception):
     """Custom exception for validation warnings"""
     pass
 
+# Structured validation finding; rendered to a message only at the API boundary
+Issue = namedtuple('Issue', 'code severity node_id detail')
+
+# Default cap on issues collected per severity; bounds work on badly broken graphs
+MAX_ISSUES = 100
+
+# Sentinel distinguishing an absent key from an explicit None value
+_MISSING = object()
+
+# Message templates for each issue code
+ISSUE_MESSAGES = {
+    'NO_NODES': "Graph has no computational nodes",
+    'NO_INPUTS': "Graph has no defined inputs",
+    'NO_OUTPUTS': "Graph has no defined outputs",
+    'INVALID_METADATA': "Graph metadata must be a dictionary",
+    'INVALID_NODE_ID': "Invalid node ID: {node_id}",
+    'INVALID_OP_TYPE': "Node {node_id}: Missing or invalid op_type",
+    'INVALID_INPUTS': "Node {node_id}: Inputs must be a list or tuple",
+    'INVALID_OUTPUTS': "Node {node_id}: Outputs must be a list or tuple",
+    'INVALID_ATTRIBUTES': "Node {node_id}: Attributes must be a dictionary",
+    'UNSUPPORTED_OPERATION': "Node {node_id}: Unsupported operation '{detail}'",
+    'TOO_FEW_INPUTS': "Node {node_id}: Too few inputs ({detail[0]} < {detail[1]})",
+    'TOO_MANY_INPUTS': "Node {node_id}: Too many inputs ({detail[0]} > {detail[1]})",
+    'OUTPUT_COUNT': "Node {node_id}: Expected {detail[1]} outputs, got {detail[0]}",
+    'MISSING_ATTRIBUTE': "Node {node_id}: Missing required attribute '{detail}'",
+    'MISSING_WEIGHT': "Missing weight: '{detail}'",
+    'DANGLING_INPUT': "Dangling input: '{detail}'",
+    'OUTPUT_NOT_PRODUCED': "Graph output not produced: '{detail}'",
+    'WEIGHT_NOT_ARRAY': "Weight '{detail[0]}': Must be numpy array, got {detail[1]}",
+    'EMPTY_WEIGHT': "Weight '{detail}': Empty weight tensor",
+    'NON_FINITE_WEIGHT': "Weight '{detail}': Contains non-finite values (NaN/Inf)",
+    'MISSING_IO_NAME': "{detail[0]} {detail[1]}: Missing 'name' field",
+    'MISSING_IO_SHAPE': "{detail[0]} {detail[1]}: Missing 'shape' field",
+    'INVALID_IO_SHAPE': "{detail[0]} {detail[1]}: Shape must be list or tuple",
+    'INVALID_IO_SPEC': "{detail[0]} {detail[1]}: Must be string or dictionary",
+    'NODE_NAMING': "Node ID '{node_id}' doesn't follow naming convention",
+    'WEIGHT_NAMING': "Weight name '{detail}' doesn't follow naming convention",
+    'LARGE_MODEL_PARAMS': "Large model: {detail:,} parameters may be challenging for embedded deployment",
+    'LARGE_MODEL_SIZE': "Large model size: {detail:.1f}MB may exceed embedded memory constraints",
+    'DYNAMIC_INPUT_SHAPES': "Dynamic input shapes may not be supported in embedded deployment",
+    'EMBEDDED_UNSUPPORTED_OP': "Operation '{detail}' may not be optimized for embedded deployment",
+}
+
+def _error(code: str, node_id: Optional[str] = None, detail: Any = None) -> Issue:
+    return Issue(code, 'error', node_id, detail)
+
+def _warning(code: str, node_id: Optional[str] = None, detail: Any = None) -> Issue:
+    return Issue(code, 'warning', node_id, detail)
+
+def render_issue(issue: Issue) -> str:
+    """Render a structured issue as a human-readable message"""
+    return ISSUE_MESSAGES[issue.code].format(node_id=issue.node_id, detail=issue.detail)
+
 # Supported operations and their requirements
 SUPPORTED_OPERATIONS = {
     'conv2d': {
@@ -199,64 +253,76 @@ SUPPORTED_OPERATIONS = {
     }
 }
 
-def _validate_basic_structure(cmx_graph: CMXGraph) -> List[str]:
+def _validate_basic_structure(cmx_graph: CMXGraph, max_errors: int = MAX_ISSUES) -> List[Issue]:
     """Validate basic graph structure"""
     errors = []
     
     # Check if graph has nodes
     if not cmx_graph.nodes:
-        errors.append("Graph has no computational nodes")
+        errors.append(_error('NO_NODES'))
     
     # Check if graph has inputs
     if not cmx_graph.inputs:
-        errors.append("Graph has no defined inputs")
+        errors.append(_error('NO_INPUTS'))
     
     # Check if graph has outputs
     if not cmx_graph.outputs:
-        errors.append("Graph has no defined outputs")
+        errors.append(_error('NO_OUTPUTS'))
     
     # Check metadata
     if not isinstance(cmx_graph.metadata, dict):
-        errors.append("Graph metadata must be a dictionary")
+        errors.append(_error('INVALID_METADATA'))
     
-    return errors
+    return errors[:max_errors]
 
-def _validate_node_structure(node_id: str, node: CMXOp) -> List[str]:
+def _validate_node_structure(node_id: str, node: CMXOp) -> List[Issue]:
     """Validate individual node structure"""
     errors = []
     
     # Check node ID
     if not node_id or not isinstance(node_id, str):
-        errors.append(f"Invalid node ID: {node_id}")
+        errors.append(_error('INVALID_NODE_ID', node_id))
     
     # Check op_type
     if not node.op_type or not isinstance(node.op_type, str):
-        errors.append(f"Node {node_id}: Missing or invalid op_type")
+        errors.append(_error('INVALID_OP_TYPE', node_id))
     
     # Check inputs
-    if not isinstance(node.inputs, list):
-        errors.append(f"Node {node_id}: Inputs must be a list")
+    if not isinstance(node.inputs, (list, tuple)):
+        errors.append(_error('INVALID_INPUTS', node_id))
     
     # Check outputs
-    if not isinstance(node.outputs, list):
-        errors.append(f"Node {node_id}: Outputs must be a list")
+    if not isinstance(node.outputs, (list, tuple)):
+        errors.append(_error('INVALID_OUTPUTS', node_id))
     
     # Check attributes
     if not isinstance(node.attributes, dict):
-        errors.append(f"Node {node_id}: Attributes must be a dictionary")
+        errors.append(_error('INVALID_ATTRIBUTES', node_id))
     
     return errors
 
-def _validate_supported_operations(cmx_graph: CMXGraph) -> List[str]:
+def _validate_all_node_structures(cmx_graph: CMXGraph, max_errors: int = MAX_ISSUES) -> List[Issue]:
+    """Validate the structure of every node in the graph"""
+    errors = []
+    for node_id, node in cmx_graph.nodes.items():
+        if len(errors) >= max_errors:
+            break
+        errors.extend(_validate_node_structure(node_id, node))
+    return errors[:max_errors]
+
+def _validate_supported_operations(cmx_graph: CMXGraph, max_errors: int = MAX_ISSUES) -> List[Issue]:
     """Validate that all operations are supported"""
     errors = []
     warnings = []
     
     for node_id, node in cmx_graph.nodes.items():
+        if len(errors) >= max_errors:
+            break
+        
         op_type = node.op_type
         
         if op_type not in SUPPORTED_OPERATIONS:
-            errors.append(f"Node {node_id}: Unsupported operation '{op_type}'")
+            errors.append(_error('UNSUPPORTED_OPERATION', node_id, op_type))
             continue
         
         op_spec = SUPPORTED_OPERATIONS[op_type]
@@ -264,19 +330,19 @@ def _validate_supported_operations(cmx_graph: CMXGraph) -> List[str]:
         # Check number of inputs
         num_inputs = len(node.inputs)
         if num_inputs < op_spec['min_inputs']:
-            errors.append(f"Node {node_id}: Too few inputs ({num_inputs} < {op_spec['min_inputs']})")
+            errors.append(_error('TOO_FEW_INPUTS', node_id, (num_inputs, op_spec['min_inputs'])))
         elif num_inputs > op_spec['max_inputs']:
-            errors.append(f"Node {node_id}: Too many inputs ({num_inputs} > {op_spec['max_inputs']})")
+            errors.append(_error('TOO_MANY_INPUTS', node_id, (num_inputs, op_spec['max_inputs'])))
         
         # Check number of outputs
         num_outputs = len(node.outputs)
         if num_outputs != op_spec['outputs']:
-            errors.append(f"Node {node_id}: Expected {op_spec['outputs']} outputs, got {num_outputs}")
+            errors.append(_error('OUTPUT_COUNT', node_id, (num_outputs, op_spec['outputs'])))
         
         # Check required attributes
         for required_attr in op_spec['required_attributes']:
             if required_attr not in node.attributes:
-                errors.append(f"Node {node_id}: Missing required attribute '{required_attr}'")
+                errors.append(_error('MISSING_ATTRIBUTE', node_id, required_attr))
         
         # Check for unknown attributes
         known_attrs = set(op_spec['required_attributes'] + op_spec['optional_attributes'])
@@ -284,33 +350,38 @@ def _validate_supported_operations(cmx_graph: CMXGraph) -> List[str]:
         if unknown_attrs:
             warnings.extend([f"Node {node_id}: Unknown attribute '{attr}'" for attr in unknown_attrs])
     
-    return errors
+    return errors[:max_errors]
 
-def _validate_weight_references(cmx_graph: CMXGraph) -> List[str]:
+def _validate_weight_references(cmx_graph: CMXGraph, max_errors: int = MAX_ISSUES) -> List[Issue]:
     """Validate that all weight references are valid"""
     errors = []
     
-    # Collect all weight references from nodes
-    referenced_weights = set()
-    for node in cmx_graph.nodes.values():
-        for input_name in node.inputs:
-            if input_name in cmx_graph.weights:
-                referenced_weights.add(input_name)
+    weights = cmx_graph.weights
+    if not weights:
+        return errors
+    
+    # Collect all weight references from nodes; dict_keys gives O(1) membership
+    # without copying the key set
+    weight_view = weights.keys()
+    referenced_weights = {input_name
+                          for node in cmx_graph.nodes.values()
+                          for input_name in node.inputs
+                          if input_name in weight_view}
     
     # Check for missing weights
-    available_weights = set(cmx_graph.weights.keys())
+    available_weights = set(weight_view)
     missing_weights = referenced_weights - available_weights
     if missing_weights:
-        errors.extend([f"Missing weight: '{weight}'" for weight in missing_weights])
+        errors.extend([_error('MISSING_WEIGHT', detail=weight) for weight in missing_weights])
     
     # Check for unused weights (warning, not error)
     unused_weights = available_weights - referenced_weights
     if unused_weights:
         print(f"Warning: Unused weights found: {list(unused_weights)[:5]}")
     
-    return errors
+    return errors[:max_errors]
 
-def _validate_data_flow(cmx_graph: CMXGraph) -> List[str]:
+def _validate_data_flow(cmx_graph: CMXGraph, max_errors: int = MAX_ISSUES) -> List[Issue]:
     """Validate data flow connectivity"""
     errors = []
     
@@ -336,7 +407,10 @@ def _validate_data_flow(cmx_graph: CMXGraph) -> List[str]:
     # Check for dangling inputs
     dangling_inputs = all_inputs - valid_sources
     if dangling_inputs:
-        errors.extend([f"Dangling input: '{inp}'" for inp in dangling_inputs])
+        errors.extend([_error('DANGLING_INPUT', detail=inp) for inp in dangling_inputs])
+    
+    if len(errors) >= max_errors:
+        return errors[:max_errors]
     
     # Check graph outputs are available
     graph_output_names = set()
@@ -348,81 +422,105 @@ def _validate_data_flow(cmx_graph: CMXGraph) -> List[str]:
     
     missing_outputs = graph_output_names - valid_sources
     if missing_outputs:
-        errors.extend([f"Graph output not produced: '{out}'" for out in missing_outputs])
+        errors.extend([_error('OUTPUT_NOT_PRODUCED', detail=out) for out in missing_outputs])
     
-    return errors
+    return errors[:max_errors]
 
-def _validate_weight_data(cmx_graph: CMXGraph) -> List[str]:
+def _validate_weight_data(cmx_graph: CMXGraph, max_errors: int = MAX_ISSUES) -> List[Issue]:
     """Validate weight data integrity"""
     errors = []
     
     for weight_name, weight_data in cmx_graph.weights.items():
+        if len(errors) >= max_errors:
+            break
+        
         # Check if weight is numpy array
         if not isinstance(weight_data, np.ndarray):
-            errors.append(f"Weight '{weight_name}': Must be numpy array, got {type(weight_data)}")
+            errors.append(_error('WEIGHT_NOT_ARRAY', detail=(weight_name, type(weight_data))))
             continue
         
         # Check for empty weights
         if weight_data.size == 0:
-            errors.append(f"Weight '{weight_name}': Empty weight tensor")
+            errors.append(_error('EMPTY_WEIGHT', detail=weight_name))
         
         # Check for invalid values
         if not np.isfinite(weight_data).all():
-            errors.append(f"Weight '{weight_name}': Contains non-finite values (NaN/Inf)")
+            errors.append(_error('NON_FINITE_WEIGHT', detail=weight_name))
         
         # Check data type
         if weight_data.dtype not in [np.float32, np.float16, np.int32, np.int8, np.uint8]:
             print(f"Warning: Weight '{weight_name}' has unusual dtype: {weight_data.dtype}")
     
-    return errors
+    return errors[:max_errors]
+
+def _check_io_dict_spec(item: dict, kind: str, i: int, errors: List[Issue]) -> None:
+    """Check a {'name': ..., 'shape': [...]} I/O specification"""
+    if 'name' not in item:
+        errors.append(_error('MISSING_IO_NAME', detail=(kind, i)))
+    shape = item.get('shape', _MISSING)
+    if shape is _MISSING:
+        errors.append(_error('MISSING_IO_SHAPE', detail=(kind, i)))
+    elif not isinstance(shape, (list, tuple)):
+        errors.append(_error('INVALID_IO_SHAPE', detail=(kind, i)))
+
+def _check_io_name_spec(item: str, kind: str, i: int, errors: List[Issue]) -> None:
+    """A bare tensor name is a valid I/O specification"""
 
-def _validate_input_output_shapes(cmx_graph: CMXGraph) -> List[str]:
+def _check_invalid_io_spec(item: Any, kind: str, i: int, errors: List[Issue]) -> None:
+    errors.append(_error('INVALID_IO_SPEC', detail=(kind, i)))
+
+# I/O specification checks keyed by item type; subclasses resolve through
+# their MRO, anything else is invalid
+_IO_SPEC_CHECKS = {
+    dict: _check_io_dict_spec,
+    str: _check_io_name_spec,
+}
+
+def _io_spec_check(item_type: type):
+    """Return the check for an I/O specification type"""
+    check = _IO_SPEC_CHECKS.get(item_type)
+    if check is None:
+        check = next((_IO_SPEC_CHECKS[base] for base in item_type.__mro__ if base in _IO_SPEC_CHECKS),
+                     _check_invalid_io_spec)
+    return check
+
+def _validate_io_specs(items: list, kind: str, errors: List[Issue], max_errors: int) -> None:
+    """Validate graph input or output specifications, appending to errors"""
+    for i, item in enumerate(items):
+        if len(errors) >= max_errors:
+            break
+        _io_spec_check(type(item))(item, kind, i, errors)
+
+def _validate_input_output_shapes(cmx_graph: CMXGraph, max_errors: int = MAX_ISSUES) -> List[Issue]:
     """Validate input and output shape specifications"""
     errors = []
     
-    # Validate inputs
-    for i, inp in enumerate(cmx_graph.inputs):
-        if isinstance(inp, dict):
-            if 'name' not in inp:
-                errors.append(f"Input {i}: Missing 'name' field")
-            if 'shape' not in inp:
-                errors.append(f"Input {i}: Missing 'shape' field")
-            elif not isinstance(inp['shape'], (list, tuple)):
-                errors.append(f"Input {i}: Shape must be list or tuple")
-        elif not isinstance(inp, str):
-            errors.append(f"Input {i}: Must be string or dictionary")
-    
-    # Validate outputs
-    for i, out in enumerate(cmx_graph.outputs):
-        if isinstance(out, dict):
-            if 'name' not in out:
-                errors.append(f"Output {i}: Missing 'name' field")
-            if 'shape' not in out:
-                errors.append(f"Output {i}: Missing 'shape' field")
-            elif not isinstance(out['shape'], (list, tuple)):
-                errors.append(f"Output {i}: Shape must be list or tuple")
-        elif not isinstance(out, str):
-            errors.append(f"Output {i}: Must be string or dictionary")
+    _validate_io_specs(cmx_graph.inputs, 'Input', errors, max_errors)
+    _validate_io_specs(cmx_graph.outputs, 'Output', errors, max_errors)
     
-    return errors
+    return errors[:max_errors]
 
-def _validate_naming_conventions(cmx_graph: CMXGraph) -> List[str]:
+def _validate_naming_conventions(cmx_graph: CMXGraph, max_errors: int = MAX_ISSUES) -> List[Issue]:
     """Validate naming conventions"""
     warnings = []
     
     # Check node naming
     for node_id in cmx_graph.nodes.keys():
+        if len(warnings) >= max_errors:
+            break
         if not re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', node_id):
-            warnings.append(f"Node ID '{node_id}' doesn't follow naming convention")
+            warnings.append(_warning('NODE_NAMING', node_id))
     
     # Check weight naming
     for weight_name in cmx_graph.weights.keys():
+        if len(warnings) >= max_errors:
+            break
         if not re.match(r'^[a-zA-Z][a-zA-Z0-9_./]*$', weight_name):
-            warnings.append(f"Weight name '{weight_name}' doesn't follow naming convention")
+            warnings.append(_warning('WEIGHT_NAMING', detail=weight_name))
     
-    return warnings
+    return warnings[:max_errors]
 
-def _check_embedded_compatibility(cmx_graph: CMXGraph) -> List[str]:
+def _check_embedded_compatibility(cmx_graph: CMXGraph, max_errors: int = MAX_ISSUES) -> List[Issue]:
     """Check compatibility for embedded deployment"""
     warnings = []
     
@@ -431,29 +529,86 @@ def _check_embedded_compatibility(cmx_graph: CMXGraph) -> List[str]:
     total_size_mb = sum(w.nbytes for w in cmx_graph.weights.values() if hasattr(w, 'nbytes')) / (1024 * 1024)
     
     if total_params > 10_000_000:  # 10M parameters
-        warnings.append(f"Large model: {total_params:,} parameters may be challenging for embedded deployment")
+        warnings.append(_warning('LARGE_MODEL_PARAMS', detail=total_params))
     
     if total_size_mb > 100:  # 100MB
-        warnings.append(f"Large model size: {total_size_mb:.1f}MB may exceed embedded memory constraints")
+        warnings.append(_warning('LARGE_MODEL_SIZE', detail=total_size_mb))
     
     # Check for dynamic shapes
     for inp in cmx_graph.inputs:
         if isinstance(inp, dict) and 'shape' in inp:
             if any(dim == -1 or isinstance(dim, str) for dim in inp['shape']):
-                warnings.append("Dynamic input shapes may not be supported in embedded deployment")
+                warnings.append(_warning('DYNAMIC_INPUT_SHAPES'))
     
     # Check for unsupported operations in embedded context
     embedded_unsupported = {'lstm', 'gru', 'attention', 'transformer'}
     used_ops = {node.op_type for node in cmx_graph.nodes.values()}
     unsupported = used_ops & embedded_unsupported
     if unsupported:
-        warnings.extend([f"Operation '{op}' may not be optimized for embedded deployment" for op in unsupported])
+        warnings.extend([_warning('EMBEDDED_UNSUPPORTED_OP', detail=op) for op in unsupported])
+    
+    return warnings[:max_errors]
+
+# Validation stages in execution order: (check name, stage function, issue severity)
+VALIDATION_STAGES = [
+    ('basic_structure', _validate_basic_structure, 'error'),
+    ('node_structure', _validate_all_node_structures, 'error'),
+    ('operation_support', _validate_supported_operations, 'error'),
+    ('weight_references', _validate_weight_references, 'error'),
+    ('data_flow', _validate_data_flow, 'error'),
+    ('weight_data', _validate_weight_data, 'error'),
+    ('input_output_shapes', _validate_input_output_shapes, 'error'),
+    ('naming_conventions', _validate_naming_conventions, 'warning'),
+]
+
+def _run_all_stages(cmx_graph: CMXGraph,
+                    check_embedded: bool = False,
+                    checks_performed: Optional[List[str]] = None,
+                    max_errors: int = MAX_ISSUES) -> List[Issue]:
+    """
+    Run every validation stage once and collect structured issues
+    
+    Args:
+        cmx_graph: CMatrix graph to validate
+        check_embedded: Whether to check embedded deployment compatibility
+        checks_performed: Optional list that receives the name of each stage run
+        max_errors: Maximum number of issues to collect per severity; stages
+            whose severity has reached the cap are skipped
+        
+    Returns:
+        List of issues (errors and warnings) in stage order
+    """
+    
+    stages = VALIDATION_STAGES
+    if check_embedded:
+        stages = stages + [('embedded_compatibility', _check_embedded_compatibility, 'warning')]
+    
+    issues = []
+    counts = {'error': 0, 'warning': 0}
+    for check_name, stage, severity in stages:
+        remaining = max_errors - counts[severity]
+        if remaining <= 0:
+            continue
+        if checks_performed is not None:
+            checks_performed.append(check_name)
+        found = stage(cmx_graph, remaining)
+        counts[severity] += len(found)
+        issues.extend(found)
     
-    return warnings
+    return issues
+
+def _format_issue_summary(messages: List[str], kind: str, heading: str, max_errors: int) -> str:
+    """Format the first ten messages of a list for an exception or log line"""
+    count = f"{len(messages)}+" if len(messages) >= max_errors else str(len(messages))
+    msg = f"{heading} with {count} {kind}:\n" + "\n".join(f"  - {m}" for m in messages[:10])
+    if len(messages) > 10:
+        msg += f"\n  ... and {len(messages) - 10} more {kind}"
+    return msg
 
 def validate_model_format(cmx_graph: CMXGraph, 
                          strict: bool = True,
-                         check_embedded: bool = False) -> bool:
+                         check_embedded: bool = False,
+                         max_errors: int = MAX_ISSUES) -> bool:
     """
     Validate CMatrix graph format
     
@@ -461,6 +616,7 @@ def validate_model_format(cmx_graph: CMXGraph,
         cmx_graph: CMatrix graph to validate
         strict: Whether to treat warnings as errors
         check_embedded: Whether to check embedded deployment compatibility
+        max_errors: Stop collecting errors (and warnings) once this many are found
         
     Returns:
         bool: True if validation passes
@@ -470,50 +626,18 @@ def validate_model_format(cmx_graph: CMXGraph,
         ValidationWarning: If validation fails with warnings in strict mode
     """
     
-    all_errors = []
-    all_warnings = []
-    
     try:
-        # Basic structure validation
-        all_errors.extend(_validate_basic_structure(cmx_graph))
-        
-        # Node structure validation
-        for node_id, node in cmx_graph.nodes.items():
-            all_errors.extend(_validate_node_structure(node_id, node))
-        
-        # Operation support validation
-        all_errors.extend(_validate_supported_operations(cmx_graph))
-        
-        # Weight reference validation
-        all_errors.extend(_validate_weight_references(cmx_graph))
-        
-        # Data flow validation
-        all_errors.extend(_validate_data_flow(cmx_graph))
+        issues = _run_all_stages(cmx_graph, check_embedded, max_errors=max_errors)
         
-        # Weight data validation
-        all_errors.extend(_validate_weight_data(cmx_graph))
-        
-        # Input/output shape validation
-        all_errors.extend(_validate_input_output_shapes(cmx_graph))
-        
-        # Naming convention validation (warnings only)
-        all_warnings.extend(_validate_naming_conventions(cmx_graph))
-        
-        # Embedded compatibility check
-        if check_embedded:
-            all_warnings.extend(_check_embedded_compatibility(cmx_graph))
+        all_errors = [render_issue(i) for i in issues if i.severity == 'error']
+        all_warnings = [render_issue(i) for i in issues if i.severity == 'warning']
         
         # Report results
         if all_errors:
-            error_msg = f"Validation failed with {len(all_errors)} errors:\n" + "\n".join(f"  - {err}" for err in all_errors[:10])
-            if len(all_errors) > 10:
-                error_msg += f"\n  ... and {len(all_errors) - 10} more errors"
-            raise ValidationError(error_msg)
+            raise ValidationError(_format_issue_summary(all_errors, 'errors', "Validation failed", max_errors))
         
         if all_warnings:
-            warning_msg = f"Validation completed with {len(all_warnings)} warnings:\n" + "\n".join(f"  - {warn}" for warn in all_warnings[:10])
-            if len(all_warnings) > 10:
-                warning_msg += f"\n  ... and {len(all_warnings) - 10} more warnings"
+            warning_msg = _format_issue_summary(all_warnings, 'warnings', "Validation completed", max_errors)
             
             if strict:
                 raise ValidationWarning(warning_msg)
@@ -527,84 +651,81 @@ def validate_model_format(cmx_graph: CMXGraph,
     except Exception as e:
         raise ValidationError(f"Validation failed with unexpected error: {str(e)}") from e
 
-def get_validation_report(cmx_graph: CMXGraph, check_embedded: bool = False) -> Dict[str, Any]:
+def _graph_summary(cmx_graph: CMXGraph) -> Dict[str, Any]:
+    """Summarize a graph for a validation report in one pass over weights and nodes"""
+    total_parameters = 0
+    total_bytes = 0
+    for w in cmx_graph.weights.values():
+        if isinstance(w, np.ndarray):
+            total_parameters += w.size
+        if hasattr(w, 'nbytes'):
+            total_bytes += w.nbytes
+    
+    op_counts = Counter(node.op_type for node in cmx_graph.nodes.values())
+    
+    return {
+        'num_nodes': len(cmx_graph.nodes),
+        'num_weights': len(cmx_graph.weights),
+        'num_inputs': len(cmx_graph.inputs),
+        'num_outputs': len(cmx_graph.outputs),
+        'total_parameters': total_parameters,
+        'total_size_mb': total_bytes / (1024 * 1024),
+        'operation_types': list(op_counts),
+        'op_type_counts': dict(op_counts),
+        'framework': cmx_graph.metadata.get('framework', 'unknown')
+    }
+
+def _build_report(cmx_graph: CMXGraph,
+                  issues: List[Issue],
+                  checks_performed: List[str]) -> Dict[str, Any]:
+    """Assemble a validation report from already collected issues"""
+    
+    report = {
+        'valid': False,
+        'errors': [render_issue(i) for i in issues if i.severity == 'error'],
+        'warnings': [render_issue(i) for i in issues if i.severity == 'warning'],
+        'summary': {},
+        'checks_performed': checks_performed
+    }
+    
+    # Generate summary as a plain dict, so the report stays JSON-serializable
+    # and does not keep the graph alive
+    report['summary'] = _graph_summary(cmx_graph)
+    
+    # Set validation status
+    report['valid'] = len(report['errors']) == 0
+    
+    return report
+
+def get_validation_report(cmx_graph: CMXGraph,
+                          check_embedded: bool = False,
+                          max_errors: int = MAX_ISSUES) -> Dict[str, Any]:
     """
     Get detailed validation report without raising exceptions
     
     Args:
         cmx_graph: CMatrix graph to validate
         check_embedded: Whether to check embedded deployment compatibility
+        max_errors: Stop collecting errors (and warnings) once this many are found
         
     Returns:
         Dictionary with detailed validation results
     """
     
-    report = {
-        'valid': False,
-        'errors': [],
-        'warnings': [],
-        'summary': {},
-        'checks_performed': []
-    }
+    checks_performed = []
     
     try:
-        # Basic structure validation
-        report['checks_performed'].append('basic_structure')
-        report['errors'].extend(_validate_basic_structure(cmx_graph))
-        
-        # Node structure validation
-        report['checks_performed'].append('node_structure')
-        for node_id, node in cmx_graph.nodes.items():
-            report['errors'].extend(_validate_node_structure(node_id, node))
-        
-        # Operation support validation
-        report['checks_performed'].append('operation_support')
-        report['errors'].extend(_validate_supported_operations(cmx_graph))
-        
-        # Weight reference validation
-        report['checks_performed'].append('weight_references')
-        report['errors'].extend(_validate_weight_references(cmx_graph))
-        
-        # Data flow validation
-        report['checks_performed'].append('data_flow')
-        report['errors'].extend(_validate_data_flow(cmx_graph))
-        
-        # Weight data validation
-        report['checks_performed'].append('weight_data')
-        report['errors'].extend(_validate_weight_data(cmx_graph))
-        
-        # Input/output shape validation
-        report['checks_performed'].append('input_output_shapes')
-        report['errors'].extend(_validate_input_output_shapes(cmx_graph))
-        
-        # Naming convention validation
-        report['checks_performed'].append('naming_conventions')
-        report['warnings'].extend(_validate_naming_conventions(cmx_graph))
-        
-        # Embedded compatibility check
-        if check_embedded:
-            report['checks_performed'].append('embedded_compatibility')
-            report['warnings'].extend(_check_embedded_compatibility(cmx_graph))
-        
-        # Generate summary
-        report['summary'] = {
-            'num_nodes': len(cmx_graph.nodes),
-            'num_weights': len(cmx_graph.weights),
-            'num_inputs': len(cmx_graph.inputs),
-            'num_outputs': len(cmx_graph.outputs),
-            'total_parameters': sum(w.size for w in cmx_graph.weights.values() if isinstance(w, np.ndarray)),
-            'total_size_mb': sum(w.nbytes for w in cmx_graph.weights.values() if hasattr(w, 'nbytes')) / (1024 * 1024),
-            'operation_types': list(set(node.op_type for node in cmx_graph.nodes.values())),
-            'framework': cmx_graph.metadata.get('framework', 'unknown')
-        }
-        
-        # Set validation status
-        report['valid'] = len(report['errors']) == 0
+        issues = _run_all_stages(cmx_graph, check_embedded, checks_performed, max_errors)
+        return _build_report(cmx_graph, issues, checks_performed)
         
     except Exception as e:
-        report['errors'].append(f"Validation failed with unexpected error: {str(e)}")
-    
-    return report
+        return {
+            'valid': False,
+            'errors': [f"Validation failed with unexpected error: {str(e)}"],
+            'warnings': [],
+            'summary': {},
+            'checks_performed': checks_performed
+        }
 
 def validate_operation_compatibility(op_type: str, attributes: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -666,66 +787,66 @@ def suggest_fixes(cmx_graph: CMXGraph) -> List[Dict[str, Any]]:
     suggestions = []
     
     try:
-        # Get validation report
-        report = get_validation_report(cmx_graph)
+        # Run validation once and work from structured issues
+        issues = _run_all_stages(cmx_graph)
         
-        # Analyze errors and suggest fixes
-        for error in report['errors']:
-            if 'Missing weight' in error:
-                weight_name = error.split("'")[1]
+        # Dispatch on issue codes; messages are rendered only for the report
+        for issue in issues:
+            code = issue.code
+            
+            if code == 'MISSING_WEIGHT':
+                weight_name = issue.detail
                 suggestions.append({
-                    'issue': error,
+                    'issue': render_issue(issue),
                     'suggestion': f"Add weight '{weight_name}' to cmx_graph.weights dictionary",
                     'severity': 'high',
                     'fix_type': 'add_weight'
                 })
             
-            elif 'Dangling input' in error:
-                input_name = error.split("'")[1]
+            elif code == 'DANGLING_INPUT':
+                input_name = issue.detail
                 suggestions.append({
-                    'issue': error,
+                    'issue': render_issue(issue),
                     'suggestion': f"Either add '{input_name}' as graph input or connect it to a node output",
                     'severity': 'high',
                     'fix_type': 'connect_input'
                 })
             
-            elif 'Unsupported operation' in error:
-                op_type = error.split("'")[1]
+            elif code == 'UNSUPPORTED_OPERATION':
+                op_type = issue.detail
                 similar_ops = _find_similar_operations(op_type)
                 suggestion = f"Replace '{op_type}' with supported operation"
                 if similar_ops:
                     suggestion += f". Similar supported ops: {', '.join(similar_ops[:3])}"
                 
                 suggestions.append({
-                    'issue': error,
+                    'issue': render_issue(issue),
                     'suggestion': suggestion,
                     'severity': 'high',
                     'fix_type': 'replace_operation',
                     'alternatives': similar_ops
                 })
             
-            elif 'Missing required attribute' in error:
-                attr_name = error.split("'")[1]
+            elif code == 'MISSING_ATTRIBUTE':
+                attr_name = issue.detail
                 suggestions.append({
-                    'issue': error,
+                    'issue': render_issue(issue),
                     'suggestion': f"Add required attribute '{attr_name}' to node attributes",
                     'severity': 'high',
                     'fix_type': 'add_attribute'
                 })
-        
-        # Analyze warnings and suggest improvements
-        for warning in report['warnings']:
-            if 'Large model' in warning:
+            
+            elif code in ('LARGE_MODEL_PARAMS', 'LARGE_MODEL_SIZE'):
                 suggestions.append({
-                    'issue': warning,
+                    'issue': render_issue(issue),
                     'suggestion': "Consider model compression techniques like quantization or pruning",
                     'severity': 'medium',
                     'fix_type': 'optimize_model'
                 })
             
-            elif 'Dynamic input shapes' in warning:
+            elif code == 'DYNAMIC_INPUT_SHAPES':
                 suggestions.append({
-                    'issue': warning,
+                    'issue': render_issue(issue),
                     'suggestion': "Define fixed input shapes for embedded deployment",
                     'severity': 'medium',
                     'fix_type': 'fix_input_shapes'
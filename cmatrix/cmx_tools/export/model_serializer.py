@@ -6,17 +6,60 @@ for storage, transmission, and loading in embedded environments.
 """
 
 import json
+import base64
 import pickle
-import gzip
+import pickletools
+import io
 import os
+import sys
+import mmap
+import threading
 import numpy as np
-from typing import Dict, Any, Union, Optional
+from typing import Dict, Any, Union, Optional, BinaryIO
 import struct
 import hashlib
+from collections import Counter
+from itertools import chain
+from operator import attrgetter
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# zlib-ng provides a drop-in, SIMD-accelerated gzip implementation
+try:
+    from zlib_ng import gzip_ng as gzip
+    HAS_ZLIB_NG = True
+except ImportError:
+    import gzip
+    HAS_ZLIB_NG = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+try:
+    import blosc2
+    HAS_BLOSC2 = True
+except ImportError:
+    HAS_BLOSC2 = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 class CMXGraph:
     """CMatrix internal graph representation"""
+    __slots__ = ('nodes', 'weights', 'inputs', 'outputs', 'metadata')
+    
     def __init__(self):
         self.nodes = {}
         self.weights = {}
@@ -26,8 +69,11 @@ class CMXGraph:
 
 class CMXOp:
     """CMatrix operation representation"""
+    __slots__ = ('op_type', 'inputs', 'outputs', 'attributes')
+    
     def __init__(self, op_type: str, inputs: list, outputs: list, attributes: dict = None):
-        self.op_type = op_type
+        # Op types come from a small vocabulary; interning shares one string per type
+        self.op_type = sys.intern(op_type) if isinstance(op_type, str) else op_type
         self.inputs = inputs
         self.outputs = outputs
         self.attributes = attributes or {}
@@ -36,39 +82,233 @@ class SerializationError(Exception):
     """Custom exception for serialization errors"""
     pass
 
+# Version of the serialized graph dictionary schema
+SERIALIZATION_VERSION = '1.0.0'
+
+# Binary layout versions:
+#   100 - header followed by an in-band pickle of the graph dictionary
+#   101 - header, buffer table, protocol 5 pickle, then out-of-band weight buffers
+#   102 - as 101, with a buffer codec byte in the buffer table
+#   200 - header, JSON manifest with weight descriptors, then an aligned raw
+#         tensor region (no pickle)
+#   201 - as 200, with tuples, arrays, numpy scalars and bytes in the manifest
+#         stored as tagged values so they load back with their original types
+PICKLE_FORMAT_VERSION = 102
+BINARY_FORMAT_VERSION = 201
+
+# Pickle protocol for the pickle format; out-of-band buffers need protocol 5+
+PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# Globals a pickled graph dictionary may reference; anything else is refused
+# so loading a model file cannot run arbitrary code
+_PICKLE_SAFE_GLOBALS = {
+    ('builtins', 'complex'), ('builtins', 'set'), ('builtins', 'frozenset'),
+    ('builtins', 'bytearray'), ('builtins', 'slice'), ('builtins', 'range'),
+    ('_codecs', 'encode'), ('collections', 'OrderedDict'),
+    ('numpy', 'dtype'), ('numpy', 'ndarray'),
+    ('numpy.core.multiarray', '_reconstruct'), ('numpy.core.multiarray', 'scalar'),
+    ('numpy._core.multiarray', '_reconstruct'), ('numpy._core.multiarray', 'scalar'),
+    ('numpy.core.numeric', '_frombuffer'), ('numpy._core.numeric', '_frombuffer'),
+}
+
+# Tensor offsets in the flat layout are aligned for direct np.frombuffer views
+TENSOR_ALIGNMENT = 64
+
+# Codecs applied to individual out-of-band weight buffers
+BUFFER_CODEC_NONE = 0
+BUFFER_CODEC_BLOSC = 1
+
+# Default gzip levels: weight bytes gain little from slow match searches,
+# while the text JSON format still compresses well at a moderate level
+GZIP_LEVELS = {
+    'binary': 1,
+    'pickle': 1,
+    'json': 6
+}
+
+# Blosc2 settings for weight buffers: byte shuffle groups the bytes of each
+# element, which ZSTD compresses far better than interleaved float bytes
+BLOSC_CLEVEL = 3
+
+def _normalize_compression(compress: Union[bool, str, None], format_type: str) -> Optional[str]:
+    """Map the compress argument to None, 'gzip' or 'blosc'"""
+    
+    if compress is True:
+        return 'gzip'
+    if not compress:
+        return None
+    if compress not in ('gzip', 'blosc'):
+        raise SerializationError(f"Unsupported compression: {compress}")
+    if compress == 'blosc':
+        if format_type not in ('binary', 'pickle'):
+            raise SerializationError("Blosc compression is only supported for binary formats")
+        if not HAS_BLOSC2:
+            raise ImportError("blosc2 is required for blosc compression")
+    return compress
+
+def _compress_buffer(data, typesize: int) -> bytes:
+    """Compress one weight buffer with Blosc2, shuffling by element size"""
+    
+    return blosc2.compress(data, typesize=typesize, clevel=BLOSC_CLEVEL,
+                           filter=blosc2.Filter.SHUFFLE, codec=blosc2.Codec.ZSTD)
+
+def _align(offset: int) -> int:
+    """Round offset up to the tensor alignment"""
+    return -(-offset // TENSOR_ALIGNMENT) * TENSOR_ALIGNMENT
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON, using orjson when available"""
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON text or UTF-8 bytes, using orjson when available"""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+_JSON_NATIVE_TYPES = (str, int, float, bool, type(None))
+
+def _to_native(obj: Any) -> Any:
+    """
+    Recursively convert a value to types the JSON encoders handle natively
+    
+    Done once before encoding so no per-value default callback is needed:
+    numpy scalars and arrays become Python numbers and lists, and any other
+    unsupported object is stored as its string form.
+    """
+    if type(obj) in _JSON_NATIVE_TYPES:
+        return obj
+    if isinstance(obj, dict):
+        return {k: _to_native(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_native(x) for x in obj]
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, _JSON_NATIVE_TYPES):
+        return obj
+    return str(obj)
+
+# Key marking a tagged value in the flat manifest
+_TYPE_TAG = '__cmx__'
+
+def _encode_value(obj: Any) -> Any:
+    """
+    Encode a value for the flat manifest, keeping types JSON cannot express
+    
+    Tuples, arrays, numpy scalars and bytes become tagged dictionaries that
+    _decode_value turns back into the original types; other unsupported
+    objects are stored as their string form.
+    """
+    if type(obj) in _JSON_NATIVE_TYPES:
+        return obj
+    if isinstance(obj, dict):
+        return {k: _encode_value(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_encode_value(x) for x in obj]
+    if isinstance(obj, tuple):
+        return {_TYPE_TAG: 'tuple', 'items': [_encode_value(x) for x in obj]}
+    if isinstance(obj, (np.ndarray, np.generic)):
+        if obj.dtype.hasobject:
+            return _encode_value(obj.tolist())
+        arr = np.asarray(obj, order='C')
+        return {
+            _TYPE_TAG: 'scalar' if isinstance(obj, np.generic) else 'ndarray',
+            'dtype': arr.dtype.str,
+            'shape': list(arr.shape),
+            'data': base64.b64encode(arr).decode('ascii')
+        }
+    if isinstance(obj, (bytes, bytearray)):
+        return {_TYPE_TAG: 'bytes', 'data': base64.b64encode(obj).decode('ascii')}
+    if isinstance(obj, _JSON_NATIVE_TYPES):
+        return obj
+    return str(obj)
+
+def _decode_value(obj: Any) -> Any:
+    """Restore values encoded by _encode_value"""
+    if isinstance(obj, list):
+        return [_decode_value(x) for x in obj]
+    if not isinstance(obj, dict):
+        return obj
+    
+    tag = obj.get(_TYPE_TAG)
+    if tag is None:
+        return {k: _decode_value(v) for k, v in obj.items()}
+    if tag == 'tuple':
+        return tuple(_decode_value(x) for x in obj['items'])
+    if tag == 'bytes':
+        return base64.b64decode(obj['data'])
+    if tag in ('ndarray', 'scalar'):
+        arr = _array_from_buffer(base64.b64decode(obj['data']), obj['dtype'], obj['shape'])
+        return arr[()] if tag == 'scalar' else arr
+    raise SerializationError(f"Unknown manifest value type: {tag}")
+
 def _numpy_to_dict(arr: np.ndarray) -> Dict[str, Any]:
-    """Convert numpy array to serializable dictionary"""
+    """Convert numpy array to JSON-serializable dictionary (base64 data)"""
     return {
-        'data': arr.tobytes(),
+        'data': base64.b64encode(np.ascontiguousarray(arr)).decode('ascii'),
+        'encoding': 'base64',
         'dtype': str(arr.dtype),
-        'shape': arr.shape
+        'shape': list(arr.shape)
     }
 
+# Parsed dtypes by their serialized name; models repeat a handful of dtypes
+_DTYPE_CACHE = {}
+
+def _dtype(name: str) -> np.dtype:
+    """Return the numpy dtype for a serialized dtype name, parsing it only once"""
+    dtype = _DTYPE_CACHE.get(name)
+    if dtype is None:
+        dtype = _DTYPE_CACHE.setdefault(name, np.dtype(name))
+    return dtype
+
+def _array_from_buffer(data, dtype_name: str, shape) -> np.ndarray:
+    """View a buffer as an array, reshaping only when the flat view does not already match"""
+    arr = np.frombuffer(data, dtype=_dtype(dtype_name))
+    return arr if arr.shape == tuple(shape) else arr.reshape(shape)
+
 def _dict_to_numpy(data_dict: Dict[str, Any]) -> np.ndarray:
     """Convert dictionary back to numpy array"""
-    arr = np.frombuffer(data_dict['data'], dtype=data_dict['dtype'])
-    return arr.reshape(data_dict['shape'])
+    data = data_dict['data']
+    if data_dict.get('encoding') == 'base64':
+        data = base64.b64decode(data)
+    return _array_from_buffer(data, data_dict['dtype'], data_dict['shape'])
 
-def _graph_to_dict(cmx_graph: CMXGraph) -> Dict[str, Any]:
-    """Convert CMXGraph to serializable dictionary"""
+def _graph_to_dict(cmx_graph: CMXGraph, encode_weights: bool = True,
+                   timestamp: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Convert CMXGraph to serializable dictionary
+    
+    Args:
+        cmx_graph: CMatrix graph to convert
+        encode_weights: Convert numpy weights to byte dictionaries. Pass False
+            to keep arrays as-is for pickle protocol 5 out-of-band buffers.
+        timestamp: ISO serialization timestamp (None = current time)
+    """
     
-    # Convert nodes
-    nodes_dict = {}
-    for node_id, node in cmx_graph.nodes.items():
-        nodes_dict[node_id] = {
+    # Convert nodes; comprehensions keep the per-node work in a single frame
+    nodes_dict = {
+        node_id: {
             'op_type': node.op_type,
             'inputs': node.inputs,
             'outputs': node.outputs,
             'attributes': node.attributes
         }
+        for node_id, node in cmx_graph.nodes.items()
+    }
     
     # Convert weights
-    weights_dict = {}
-    for weight_name, weight_data in cmx_graph.weights.items():
-        if isinstance(weight_data, np.ndarray):
-            weights_dict[weight_name] = _numpy_to_dict(weight_data)
-        else:
-            weights_dict[weight_name] = weight_data
+    if encode_weights:
+        weights_dict = {
+            weight_name: _numpy_to_dict(weight_data) if isinstance(weight_data, np.ndarray) else weight_data
+            for weight_name, weight_data in cmx_graph.weights.items()
+        }
+    else:
+        weights_dict = dict(cmx_graph.weights)
     
     return {
         'nodes': nodes_dict,
@@ -76,8 +316,8 @@ def _graph_to_dict(cmx_graph: CMXGraph) -> Dict[str, Any]:
         'inputs': cmx_graph.inputs,
         'outputs': cmx_graph.outputs,
         'metadata': cmx_graph.metadata,
-        'version': '1.0.0',
-        'serialization_timestamp': datetime.now().isoformat()
+        'version': SERIALIZATION_VERSION,
+        'serialization_timestamp': timestamp or datetime.now().isoformat()
     }
 
 def _dict_to_graph(data_dict: Dict[str, Any]) -> CMXGraph:
@@ -85,22 +325,19 @@ def _dict_to_graph(data_dict: Dict[str, Any]) -> CMXGraph:
     
     cmx_graph = CMXGraph()
     
-    # Restore nodes
-    for node_id, node_data in data_dict['nodes'].items():
-        node = CMXOp(
-            op_type=node_data['op_type'],
-            inputs=node_data['inputs'],
-            outputs=node_data['outputs'],
-            attributes=node_data['attributes']
-        )
-        cmx_graph.nodes[node_id] = node
+    # Restore nodes (positional arguments avoid keyword matching per node)
+    cmx_graph.nodes = {
+        node_id: CMXOp(node_data['op_type'], node_data['inputs'],
+                       node_data['outputs'], node_data['attributes'])
+        for node_id, node_data in data_dict['nodes'].items()
+    }
     
     # Restore weights
-    for weight_name, weight_data in data_dict['weights'].items():
-        if isinstance(weight_data, dict) and 'data' in weight_data:
-            cmx_graph.weights[weight_name] = _dict_to_numpy(weight_data)
-        else:
-            cmx_graph.weights[weight_name] = weight_data
+    cmx_graph.weights = {
+        weight_name: _dict_to_numpy(weight_data)
+        if isinstance(weight_data, dict) and 'data' in weight_data else weight_data
+        for weight_name, weight_data in data_dict['weights'].items()
+    }
     
     cmx_graph.inputs = data_dict['inputs']
     cmx_graph.outputs = data_dict['outputs']
@@ -108,62 +345,283 @@ def _dict_to_graph(data_dict: Dict[str, Any]) -> CMXGraph:
     
     return cmx_graph
 
+# BLAKE3 hashes with SIMD and multiple threads; SHA-256 uses SHA-NI where available
+CHECKSUM_ALGORITHM = 'blake3' if HAS_BLAKE3 else 'sha256'
+
+def _new_checksum():
+    """Create the hash object used for serialization checksums"""
+    if HAS_BLAKE3:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.sha256()
+
 def _calculate_checksum(data: bytes) -> str:
-    """Calculate MD5 checksum of data"""
-    return hashlib.md5(data).hexdigest()
+    """Calculate BLAKE3 (or SHA-256) checksum of data"""
+    checksum = _new_checksum()
+    checksum.update(data)
+    return checksum.hexdigest()
 
-def _create_binary_header(metadata: Dict[str, Any]) -> bytes:
-    """Create binary header for CMX format"""
+class _HashingWriter:
+    """File wrapper that feeds every written block into a checksum"""
     
-    # Magic number for CMX format
-    magic = b'CMX\x01'
+    def __init__(self, f, checksum):
+        self.f = f
+        self.checksum = checksum
+        self.size = 0
     
-    # Version
-    version = struct.pack('<H', 100)  # Version 1.00
+    def write(self, data) -> int:
+        self.checksum.update(data)
+        self.size += len(data)
+        return self.f.write(data)
+    
+    def flush(self) -> None:
+        self.f.flush()
+
+def _write_chunks(f, chunks: list) -> None:
+    """Write chunks to a file object one after another"""
+    for chunk in chunks:
+        f.write(chunk)
+
+def _write_output(writer: _HashingWriter, chunks: list, codec: Optional[str],
+                  compresslevel: Optional[int]) -> None:
+    """Write serialized chunks, gzip-compressing them on the fly if requested"""
+    if codec == 'gzip':
+        with gzip.open(writer, 'wb', compresslevel=compresslevel) as gz:
+            _write_chunks(gz, chunks)
+    else:
+        _write_chunks(writer, chunks)
+
+# Fixed header prefix: magic number, format version, metadata JSON size
+CMX_MAGIC = b'CMX\x01'
+_BINARY_HEADER = struct.Struct('<4sHI')
+
+def _create_binary_header(metadata: Dict[str, Any], format_version: int = BINARY_FORMAT_VERSION) -> bytes:
+    """Create binary header for CMX format"""
     
     # Metadata as JSON
-    metadata_json = json.dumps(metadata).encode('utf-8')
-    metadata_size = struct.pack('<I', len(metadata_json))
+    metadata_json = _json_dumps(_to_native(metadata))
     
-    return magic + version + metadata_size + metadata_json
+    return _BINARY_HEADER.pack(CMX_MAGIC, format_version, len(metadata_json)) + metadata_json
 
 def _parse_binary_header(data: bytes) -> tuple:
-    """Parse binary header and return metadata and offset"""
+    """Parse binary header and return metadata, offset and format version"""
     
     # Check magic number
-    if data[:4] != b'CMX\x01':
+    if data[:4] != CMX_MAGIC:
         raise SerializationError("Invalid CMX file format")
     
-    # Parse version
-    version = struct.unpack('<H', data[4:6])[0]
-    
-    # Parse metadata size
-    metadata_size = struct.unpack('<I', data[6:10])[0]
+    _, version, metadata_size = _BINARY_HEADER.unpack_from(data, 0)
     
     # Parse metadata
-    metadata_json = data[10:10+metadata_size].decode('utf-8')
-    metadata = json.loads(metadata_json)
+    offset = _BINARY_HEADER.size
+    metadata = _json_loads(data[offset:offset + metadata_size])
+    
+    return metadata, offset + metadata_size, version
+
+def _create_buffer_table(pickle_size: int, buffers: list, codec: int = BUFFER_CODEC_NONE) -> bytes:
+    """Create the table describing the pickle stream and out-of-band buffers"""
+    
+    lengths = [memoryview(buf).nbytes for buf in buffers]
+    return struct.pack(f'<QIB{len(lengths)}Q', pickle_size, len(lengths), codec, *lengths)
+
+def _flat_chunks(graph_dict: Dict[str, Any], start_offset: int, use_blosc: bool = False) -> list:
+    """
+    Build the manifest and tensor region of the flat binary layout
+    
+    Args:
+        graph_dict: Graph dictionary with numpy weights left in place
+        start_offset: File offset at which the returned chunks begin
+        use_blosc: Compress each tensor with Blosc2
+        
+    Returns:
+        List of byte chunks: manifest size, manifest, then padded tensor data
+    """
+    
+    descriptors = {}
+    payloads = []
+    offset = 0
+    
+    # Tensors whose bytes match an earlier tensor share its stored data; only
+    # tensors whose byte size occurs more than once need to be hashed
+    size_counts = Counter(
+        weight_data.nbytes for weight_data in graph_dict['weights'].values()
+        if isinstance(weight_data, (np.ndarray, np.generic))
+    )
+    stored = {}
+    
+    for weight_name, weight_data in graph_dict['weights'].items():
+        is_scalar = isinstance(weight_data, np.generic)
+        if not (is_scalar or isinstance(weight_data, np.ndarray)) or weight_data.dtype.hasobject:
+            # Non-tensor weights are stored inline in the manifest
+            descriptors[weight_name] = {'value': _encode_value(weight_data)}
+            continue
+        
+        arr = np.asarray(weight_data, order='C')
+        data = memoryview(arr.reshape(-1).view(np.uint8))
+        
+        digest = None
+        if size_counts[arr.nbytes] > 1:
+            checksum = _new_checksum()
+            checksum.update(data)
+            digest = checksum.digest()
+        
+        if digest in stored:
+            tensor_offset, nbytes = stored[digest]
+        else:
+            if use_blosc:
+                data = _compress_buffer(data, arr.dtype.itemsize)
+            offset = tensor_offset = _align(offset)
+            nbytes = len(data)
+            payloads.append((tensor_offset, data))
+            offset += nbytes
+            if digest is not None:
+                stored[digest] = (tensor_offset, nbytes)
+        
+        descriptor = {
+            'dtype': arr.dtype.str,
+            'shape': list(arr.shape),
+            'offset': tensor_offset,
+            'nbytes': nbytes
+        }
+        if use_blosc:
+            descriptor['codec'] = 'blosc'
+        if is_scalar:
+            descriptor['scalar'] = True
+        descriptors[weight_name] = descriptor
+    
+    manifest = _encode_value(dict(graph_dict, weights={}))
+    manifest['weights'] = descriptors
+    manifest_json = _json_dumps(manifest)
+    
+    chunks = [struct.pack('<I', len(manifest_json)), manifest_json]
+    position = start_offset + 4 + len(manifest_json)
+    region_start = _align(position)
+    chunks.append(b'\x00' * (region_start - position))
+    
+    position = 0
+    for tensor_offset, data in payloads:
+        if tensor_offset > position:
+            chunks.append(b'\x00' * (tensor_offset - position))
+        chunks.append(data)
+        position = tensor_offset + len(data)
+    
+    return chunks
+
+def _load_flat_graph(data: bytes, offset: int, version: int = BINARY_FORMAT_VERSION) -> Dict[str, Any]:
+    """Rebuild the graph dictionary from the flat binary layout"""
+    
+    view = memoryview(data)
+    manifest_size = struct.unpack_from('<I', view, offset)[0]
+    offset += 4
+    graph_dict = _json_loads(bytes(view[offset:offset + manifest_size]))
+    region_start = _align(offset + manifest_size)
+    
+    # Version 200 manifests hold plain JSON values
+    decode = _decode_value if version >= 201 else (lambda value: value)
+    descriptors = graph_dict.pop('weights')
+    graph_dict = decode(graph_dict)
+    graph_dict['weights'] = descriptors
+    
+    # Tensors are read-only views over the file data
+    weights = {}
+    for weight_name, descriptor in graph_dict['weights'].items():
+        if 'value' in descriptor:
+            weights[weight_name] = decode(descriptor['value'])
+            continue
+        
+        start = region_start + descriptor['offset']
+        raw = view[start:start + descriptor['nbytes']]
+        if descriptor.get('codec') == 'blosc':
+            if not HAS_BLOSC2:
+                raise ImportError("blosc2 is required to load blosc-compressed models")
+            raw = blosc2.decompress(raw)
+        
+        arr = _array_from_buffer(raw, descriptor['dtype'], descriptor['shape'])
+        weights[weight_name] = arr[()] if descriptor.get('scalar') else arr
     
-    return metadata, 10 + metadata_size
+    graph_dict['weights'] = weights
+    return graph_dict
 
-def serialize_model(cmx_graph: CMXGraph, output_path: str, 
-                   format_type: str = 'binary', compress: bool = True) -> Dict[str, Any]:
+class _GraphUnpickler(pickle.Unpickler):
+    """Unpickler limited to the builtin and numpy types graph dictionaries contain"""
+    
+    def find_class(self, module, name):
+        if module == '__builtin__':
+            module = 'builtins'
+        if (module, name) not in _PICKLE_SAFE_GLOBALS:
+            raise SerializationError(f"Refusing to unpickle global {module}.{name}")
+        return super().find_class(module, name)
+
+def _safe_pickle_loads(data, buffers=None) -> Any:
+    """Unpickle a graph dictionary without allowing arbitrary globals"""
+    return _GraphUnpickler(io.BytesIO(data), buffers=buffers).load()
+
+def _load_pickled_graph(data: bytes, offset: int, version: int) -> Dict[str, Any]:
+    """Unpickle the graph dictionary stored after the binary header"""
+    
+    if version < 101:
+        return _safe_pickle_loads(memoryview(data)[offset:])
+    
+    view = memoryview(data)
+    pickle_size, num_buffers = struct.unpack_from('<QI', view, offset)
+    offset += 12
+    codec = BUFFER_CODEC_NONE
+    if version >= 102:
+        codec = view[offset]
+        offset += 1
+    lengths = struct.unpack_from(f'<{num_buffers}Q', view, offset)
+    offset += 8 * num_buffers
+    
+    graph_data = view[offset:offset + pickle_size]
+    offset += pickle_size
+    
+    # Weight arrays are rebuilt as views over the file data, without copies
+    buffers = []
+    for length in lengths:
+        buffers.append(view[offset:offset + length])
+        offset += length
+    
+    if codec == BUFFER_CODEC_BLOSC:
+        if not HAS_BLOSC2:
+            raise ImportError("blosc2 is required to load blosc-compressed models")
+        buffers = [blosc2.decompress(buf) for buf in buffers]
+    elif codec != BUFFER_CODEC_NONE:
+        raise SerializationError(f"Unknown buffer codec: {codec}")
+    
+    return _safe_pickle_loads(graph_data, buffers=buffers)
+
+def serialize_model(cmx_graph: CMXGraph, output_path: Union[str, BinaryIO], 
+                   format_type: str = 'binary', compress: Union[bool, str] = True,
+                   compresslevel: Optional[int] = None,
+                   optimize: bool = False, pretty: bool = False) -> Dict[str, Any]:
     """
     Serialize CMatrix graph to file
     
     Args:
         cmx_graph: CMatrix graph to serialize
-        output_path: Output file path
-        format_type: 'binary' or 'json'
-        compress: Whether to compress the output (gzip)
+        output_path: Output file path, or a writable binary file object
+            (written as-is, without adding a .gz suffix or closing it)
+        format_type: 'binary' (flat manifest plus raw tensors), 'pickle'
+            (protocol 5 pickle with out-of-band weights; loading only accepts
+            builtin and numpy types) or 'json'
+        compress: False for no compression, True or 'gzip' to gzip the whole
+            file, 'blosc' to compress each weight buffer with Blosc2/ZSTD
+            (binary formats only, requires blosc2)
+        compresslevel: gzip level (None = 1 for binary, 6 for JSON)
+        optimize: Strip unused memo opcodes from the pickle stream with
+            pickletools.optimize (pickle format only)
+        pretty: Indent JSON output for human reading (JSON format only)
         
     Returns:
         Dictionary with serialization info
     """
     
     try:
-        # Convert graph to dictionary
-        graph_dict = _graph_to_dict(cmx_graph)
+        codec = _normalize_compression(compress, format_type)
+        
+        timestamp = datetime.now().isoformat()
+        
+        # Convert graph to dictionary; binary formats keep arrays to write them raw
+        graph_dict = _graph_to_dict(cmx_graph, encode_weights=(format_type == 'json'), timestamp=timestamp)
         
         # Add serialization metadata
         serialization_info = {
@@ -171,50 +629,113 @@ def serialize_model(cmx_graph: CMXGraph, output_path: str,
             'compressed': compress,
             'file_size_bytes': 0,
             'checksum': '',
-            'serialization_time': datetime.now().isoformat()
+            'checksum_algorithm': CHECKSUM_ALGORITHM,
+            'serialization_time': timestamp
         }
         
         if format_type == 'json':
             # JSON serialization
-            json_data = json.dumps(graph_dict, indent=2, default=str)
-            data_bytes = json_data.encode('utf-8')
+            chunks = [_json_dumps(_to_native(graph_dict), indent=pretty)]
             
         elif format_type == 'binary':
-            # Binary serialization
-            # Create header
+            # Flat binary serialization: manifest plus aligned raw tensors
             header = _create_binary_header(graph_dict['metadata'])
+            chunks = [header] + _flat_chunks(graph_dict, len(header), codec == 'blosc')
+            
+        elif format_type == 'pickle':
+            # Pickle serialization
+            # Create header
+            header = _create_binary_header(graph_dict['metadata'], PICKLE_FORMAT_VERSION)
             
-            # Serialize graph data
-            graph_data = pickle.dumps(graph_dict)
+            if PICKLE_PROTOCOL < 5:
+                raise SerializationError("Pickle format requires pickle protocol 5 (Python 3.8+)")
             
-            # Combine header and data
-            data_bytes = header + graph_data
+            # Serialize graph data; weight arrays are handed out as zero-copy buffers
+            buffers = []
+            graph_data = pickle.dumps(graph_dict, protocol=PICKLE_PROTOCOL, buffer_callback=buffers.append)
+            if optimize:
+                graph_data = pickletools.optimize(graph_data)
+            
+            if codec == 'blosc':
+                buffers = [_compress_buffer(buf.raw(), memoryview(buf).itemsize) for buf in buffers]
+                buffer_codec = BUFFER_CODEC_BLOSC
+            else:
+                buffers = [buf.raw() for buf in buffers]
+                buffer_codec = BUFFER_CODEC_NONE
+            
+            # Header, buffer table, pickle stream and weight buffers are written
+            # one after another rather than joined into a single file-sized blob
+            table = _create_buffer_table(len(graph_data), buffers, buffer_codec)
+            chunks = [header, table, graph_data] + buffers
             
         else:
             raise SerializationError(f"Unsupported format: {format_type}")
         
-        # Calculate checksum
-        serialization_info['checksum'] = _calculate_checksum(data_bytes)
+        is_file = hasattr(output_path, 'write')
+        
+        if codec == 'gzip':
+            if compresslevel is None:
+                compresslevel = GZIP_LEVELS.get(format_type, 6)
+            if not is_file:
+                output_path += '.gz' if not output_path.endswith('.gz') else ''
         
-        # Compress if requested
-        if compress:
-            data_bytes = gzip.compress(data_bytes)
-            output_path += '.gz' if not output_path.endswith('.gz') else ''
+        # Stream to file, compressing on the fly if requested; the checksum is
+        # taken over the bytes as they reach the file, so it covers exactly
+        # what is on disk and needs no second pass over the data
+        if is_file:
+            writer = _HashingWriter(output_path, _new_checksum())
+            _write_output(writer, chunks, codec, compresslevel)
+        else:
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            # Write beside the target and swap it in: the graph being saved may
+            # hold weights mapped from output_path, which truncating in place
+            # would pull out from under it
+            tmp_path = f"{output_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    writer = _HashingWriter(f, _new_checksum())
+                    _write_output(writer, chunks, codec, compresslevel)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
         
-        # Write to file
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'wb') as f:
-            f.write(data_bytes)
+        serialization_info['checksum'] = writer.checksum.hexdigest()
         
         # Update serialization info
-        serialization_info['file_size_bytes'] = len(data_bytes)
-        serialization_info['output_path'] = output_path
+        serialization_info['file_size_bytes'] = writer.size
+        serialization_info['output_path'] = getattr(output_path, 'name', None) if is_file else output_path
         
         return serialization_info
         
     except Exception as e:
         raise SerializationError(f"Serialization failed: {str(e)}") from e
 
+def _map_file(file_path: str) -> Union[mmap.mmap, bytes]:
+    """
+    Map a file read-only into memory
+    
+    The mapping stays valid after the file is closed and is released once no
+    array views reference it. Empty files return b'' since they cannot be mapped.
+    Where madvise is available the kernel is told the file will be read front
+    to back and asked to start reading it ahead right away.
+    """
+    
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    if hasattr(mapped, 'madvise'):
+        for advice in ('MADV_SEQUENTIAL', 'MADV_WILLNEED'):
+            if hasattr(mmap, advice):
+                mapped.madvise(getattr(mmap, advice))
+    
+    return mapped
+
 def deserialize_model(file_path: str) -> CMXGraph:
     """
     Deserialize CMatrix graph from file
@@ -230,26 +751,27 @@ def deserialize_model(file_path: str) -> CMXGraph:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Model file not found: {file_path}")
         
-        # Read file
-        with open(file_path, 'rb') as f:
-            data_bytes = f.read()
-        
-        # Check if compressed
+        # Read file: compressed files are decompressed as a stream, plain files
+        # are memory-mapped so weights become views paged in on demand
         is_compressed = file_path.endswith('.gz')
         if is_compressed:
-            data_bytes = gzip.decompress(data_bytes)
+            with gzip.open(file_path, 'rb') as gz:
+                data_bytes = gz.read()
+        else:
+            data_bytes = _map_file(file_path)
         
         # Determine format
-        if data_bytes.startswith(b'CMX\x01'):
+        if data_bytes[:4] == CMX_MAGIC:
             # Binary format
-            metadata, offset = _parse_binary_header(data_bytes)
-            graph_data = data_bytes[offset:]
-            graph_dict = pickle.loads(graph_data)
+            metadata, offset, version = _parse_binary_header(data_bytes)
+            if version >= 200:
+                graph_dict = _load_flat_graph(data_bytes, offset, version)
+            else:
+                graph_dict = _load_pickled_graph(data_bytes, offset, version)
             
-        elif data_bytes.startswith(b'{'):
+        elif data_bytes[:1] == b'{':
             # JSON format
-            json_data = data_bytes.decode('utf-8')
-            graph_dict = json.loads(json_data)
+            graph_dict = _json_loads(data_bytes[:])
             
         else:
             raise SerializationError("Unknown file format")
@@ -262,6 +784,14 @@ def deserialize_model(file_path: str) -> CMXGraph:
     except Exception as e:
         raise SerializationError(f"Deserialization failed: {str(e)}") from e
 
+def _read_json_metadata(f) -> Dict[str, Any]:
+    """Read the metadata field of a JSON model, parsing incrementally if ijson is available"""
+    
+    if HAS_IJSON:
+        # Only the metadata object is built; weights are skipped as tokens
+        return next(ijson.items(f, 'metadata', use_float=True), {})
+    return _json_loads(f.read()).get('metadata', {})
+
 def get_model_info(file_path: str) -> Dict[str, Any]:
     """
     Get information about serialized model without full deserialization
@@ -286,43 +816,35 @@ def get_model_info(file_path: str) -> Dict[str, Any]:
             'modified_time': datetime.fromtimestamp(file_stats.st_mtime).isoformat()
         }
         
-        # Read file header
-        with open(file_path, 'rb') as f:
-            data_bytes = f.read(1024)  # Read first 1KB for header
-        
         # Check if compressed
         is_compressed = file_path.endswith('.gz')
         info['compressed'] = is_compressed
         
-        if is_compressed:
-            try:
-                data_bytes = gzip.decompress(data_bytes)
-            except:
-                # If partial decompression fails, read full file
-                with open(file_path, 'rb') as f:
-                    data_bytes = gzip.decompress(f.read())
-        
-        # Parse format and metadata
-        if data_bytes.startswith(b'CMX\x01'):
-            info['format'] = 'binary'
-            try:
-                metadata, _ = _parse_binary_header(data_bytes)
-                info['metadata'] = metadata
-            except:
-                info['metadata'] = {}
-                
-        elif data_bytes.startswith(b'{'):
-            info['format'] = 'json'
-            try:
-                # Try to parse JSON metadata
-                json_str = data_bytes.decode('utf-8')
-                partial_data = json.loads(json_str)
-                info['metadata'] = partial_data.get('metadata', {})
-            except:
+        # Open as a stream so compressed files are only decompressed as far
+        # as the header reaches
+        with (gzip.open(file_path, 'rb') if is_compressed else open(file_path, 'rb')) as f:
+            data_bytes = f.read(_BINARY_HEADER.size)
+            
+            # Parse format and metadata
+            if data_bytes.startswith(CMX_MAGIC):
+                info['format'] = 'binary'
+                try:
+                    metadata_size = _BINARY_HEADER.unpack(data_bytes)[2]
+                    metadata, _, _ = _parse_binary_header(data_bytes + f.read(metadata_size))
+                    info['metadata'] = metadata
+                except:
+                    info['metadata'] = {}
+                    
+            elif data_bytes.startswith(b'{'):
+                info['format'] = 'json'
+                try:
+                    f.seek(0)
+                    info['metadata'] = _read_json_metadata(f)
+                except:
+                    info['metadata'] = {}
+            else:
+                info['format'] = 'unknown'
                 info['metadata'] = {}
-        else:
-            info['format'] = 'unknown'
-            info['metadata'] = {}
         
         return info
         
@@ -426,30 +948,29 @@ def validate_serialized_model(file_path: str) -> Dict[str, Any]:
             validation_result['warnings'].append("Model has no defined outputs")
         
         # Check for common issues
-        node_outputs = set()
-        node_inputs = set()
+        nodes = list(cmx_graph.nodes.values())
         
-        for node in cmx_graph.nodes.values():
-            if not node.op_type:
-                validation_result['errors'].append("Found node with empty op_type")
-            
-            node_outputs.update(node.outputs)
-            node_inputs.update(node.inputs)
+        empty_op_types = sum(1 for node in nodes if not node.op_type)
+        validation_result['errors'].extend(["Found node with empty op_type"] * empty_op_types)
         
-        # Check for dangling references
-        weight_names = set(cmx_graph.weights.keys())
-        valid_inputs = node_outputs | weight_names
+        # Check for dangling references; sets are built in one pass each and
+        # the difference is taken against the weight keys view directly
+        node_outputs = set(chain.from_iterable(node.outputs for node in nodes))
+        node_inputs = set(chain.from_iterable(node.inputs for node in nodes))
         
-        dangling = node_inputs - valid_inputs
+        dangling = node_inputs - node_outputs - cmx_graph.weights.keys()
         if dangling:
             validation_result['warnings'].append(f"Found dangling inputs: {list(dangling)[:5]}")
         
         # Validate weights
+        arrays = []
         for weight_name, weight_data in cmx_graph.weights.items():
-            if not isinstance(weight_data, np.ndarray):
+            if isinstance(weight_data, np.ndarray):
+                arrays.append(weight_data)
+                if not weight_data.size:
+                    validation_result['warnings'].append(f"Weight '{weight_name}' is empty")
+            else:
                 validation_result['warnings'].append(f"Weight '{weight_name}' is not a numpy array")
-            elif weight_data.size == 0:
-                validation_result['warnings'].append(f"Weight '{weight_name}' is empty")
         
         # If we got here without errors, the model is valid
         if not validation_result['errors']:
@@ -457,7 +978,7 @@ def validate_serialized_model(file_path: str) -> Dict[str, Any]:
             validation_result['summary'] = {
                 'num_nodes': len(cmx_graph.nodes),
                 'num_weights': len(cmx_graph.weights),
-                'total_parameters': sum(w.size for w in cmx_graph.weights.values() if isinstance(w, np.ndarray)),
+                'total_parameters': sum(map(attrgetter('size'), arrays)),
                 'framework': cmx_graph.metadata.get('framework', 'unknown')
             }
         
@@ -467,8 +988,42 @@ def validate_serialized_model(file_path: str) -> Dict[str, Any]:
         validation_result['errors'].append(f"Validation failed: {str(e)}")
         return validation_result
 
+def _serialize_jobs(jobs: Dict[str, tuple], format_type: str, compress: Union[bool, str],
+                    max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Serialize several graphs concurrently
+    
+    Threads are sufficient: compression, hashing and file writes release the
+    GIL, and graphs do not have to be pickled across process boundaries.
+    
+    Args:
+        jobs: Dictionary of {name: (cmx_graph, output_path)} pairs
+        format_type: Serialization format
+        compress: Compression setting passed to serialize_model
+        max_workers: Maximum number of worker threads (None = executor default)
+        
+    Returns:
+        Dictionary of {name: serialization_info or exception}, in job order
+    """
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(serialize_model, cmx_graph, output_path, format_type, compress): name
+            for name, (cmx_graph, output_path) in jobs.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = e
+    
+    return {name: results[name] for name in jobs}
+
 def batch_serialize(models: Dict[str, CMXGraph], output_dir: str, 
-                   format_type: str = 'binary', compress: bool = True) -> Dict[str, Dict[str, Any]]:
+                   format_type: str = 'binary', compress: Union[bool, str] = True,
+                   max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
     """
     Serialize multiple models in batch
     
@@ -477,37 +1032,38 @@ def batch_serialize(models: Dict[str, CMXGraph], output_dir: str,
         output_dir: Output directory
         format_type: Serialization format
         compress: Whether to compress files
+        max_workers: Maximum number of models serialized concurrently
         
     Returns:
         Dictionary of {name: serialization_info} pairs
     """
     
     os.makedirs(output_dir, exist_ok=True)
-    results = {}
     
-    for name, cmx_graph in models.items():
-        try:
-            # Determine file extension
-            ext = '.cmx' if format_type == 'binary' else '.json'
-            if compress:
-                ext += '.gz'
-            
-            output_path = os.path.join(output_dir, f"{name}{ext}")
-            
-            # Serialize model
-            result = serialize_model(cmx_graph, output_path, format_type, compress)
+    # Determine file extension
+    ext = '.json' if format_type == 'json' else '.cmx'
+    if _normalize_compression(compress, format_type) == 'gzip':
+        ext += '.gz'
+    
+    jobs = {
+        name: (cmx_graph, os.path.join(output_dir, f"{name}{ext}"))
+        for name, cmx_graph in models.items()
+    }
+    
+    results = {}
+    for name, result in _serialize_jobs(jobs, format_type, compress, max_workers).items():
+        if isinstance(result, Exception):
+            results[name] = {'error': str(result)}
+            print(f"Failed to serialize {name}: {str(result)}")
+        else:
             results[name] = result
-            
-            print(f"Serialized {name} -> {output_path}")
-            
-        except Exception as e:
-            results[name] = {'error': str(e)}
-            print(f"Failed to serialize {name}: {str(e)}")
+            print(f"Serialized {name} -> {result['output_path']}")
     
     return results
 
 def create_model_archive(models: Dict[str, CMXGraph], archive_path: str, 
-                        metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+                        metadata: Dict[str, Any] = None,
+                        max_workers: Optional[int] = None) -> Dict[str, Any]:
     """
     Create a compressed archive containing multiple models
     
@@ -515,45 +1071,51 @@ def create_model_archive(models: Dict[str, CMXGraph], archive_path: str,
         models: Dictionary of {name: CMXGraph} pairs
         archive_path: Output archive path
         metadata: Optional archive metadata
+        max_workers: Maximum number of models serialized concurrently
         
     Returns:
         Dictionary with archive info
     """
     
-    import tempfile
-    import shutil
     import tarfile
     
     try:
+        created_time = datetime.now()
         archive_info = {
             'archive_path': archive_path,
             'num_models': len(models),
-            'created_time': datetime.now().isoformat(),
+            'created_time': created_time.isoformat(),
             'models': {}
         }
         
-        # Create temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            
-            # Serialize each model to temp directory
-            for name, cmx_graph in models.items():
-                model_path = os.path.join(temp_dir, f"{name}.cmx")
-                result = serialize_model(cmx_graph, model_path, 'binary', False)
-                archive_info['models'][name] = {
-                    'size_bytes': result['file_size_bytes'],
-                    'checksum': result['checksum']
-                }
-            
-            # Add metadata file if provided
-            if metadata:
-                metadata_path = os.path.join(temp_dir, 'archive_metadata.json')
-                with open(metadata_path, 'w') as f:
-                    json.dump(metadata, f, indent=2)
-            
-            # Create archive
-            os.makedirs(os.path.dirname(archive_path), exist_ok=True)
-            with tarfile.open(archive_path, 'w:gz') as tar:
-                tar.add(temp_dir, arcname='models')
+        # Serialize each model into memory rather than a temporary directory
+        jobs = {name: (cmx_graph, io.BytesIO()) for name, cmx_graph in models.items()}
+        members = {}
+        for name, result in _serialize_jobs(jobs, 'binary', False, max_workers).items():
+            if isinstance(result, Exception):
+                raise result
+            archive_info['models'][name] = {
+                'size_bytes': result['file_size_bytes'],
+                'checksum': result['checksum']
+            }
+            members[f"{name}.cmx"] = jobs[name][1]
+        
+        # Add metadata file if provided
+        if metadata:
+            members['archive_metadata.json'] = io.BytesIO(_json_dumps(_to_native(metadata), indent=True))
+        
+        # Stream members straight into the compressed tarball
+        archive_dir = os.path.dirname(archive_path)
+        if archive_dir:
+            os.makedirs(archive_dir, exist_ok=True)
+        with gzip.open(archive_path, 'wb', compresslevel=GZIP_LEVELS['binary']) as gz, \
+                tarfile.open(fileobj=gz, mode='w|') as tar:
+            for filename, buf in members.items():
+                member = tarfile.TarInfo(f"models/{filename}")
+                member.size = buf.getbuffer().nbytes
+                member.mtime = created_time.timestamp()
+                buf.seek(0)
+                tar.addfile(member, buf)
         
         # Get final archive size
         archive_info['archive_size_bytes'] = os.path.getsize(archive_path)
@@ -7,11 +7,24 @@ Parses ONNX models directly into CMatrix graph IR.
 import onnx
 import onnxruntime as ort
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 import os
+import mmap
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from collections.abc import MutableMapping
+
+try:
+    import ml_dtypes
+    HAS_ML_DTYPES = True
+except ImportError:
+    HAS_ML_DTYPES = False
 
 class CMXGraph:
     """CMatrix internal graph representation"""
+    __slots__ = ('nodes', 'weights', 'inputs', 'outputs', 'metadata')
+    
     def __init__(self):
         self.nodes = {}
         self.weights = {}
@@ -21,222 +34,389 @@ class CMXGraph:
 
 class CMXOp:
     """CMatrix operation representation"""
-    def __init__(self, op_type: str, inputs: List[str], outputs: List[str], 
+    __slots__ = ('op_type', 'inputs', 'outputs', 'attributes')
+    
+    def __init__(self, op_type: str, inputs: Tuple[str, ...], outputs: Tuple[str, ...], 
                  attributes: Dict[str, Any] = None):
         self.op_type = op_type
-        self.inputs = inputs
-        self.outputs = outputs
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
         self.attributes = attributes or {}
 
-def _load_onnx_model(model_path: str) -> onnx.ModelProto:
-    """Load ONNX model from file"""
+# ONNX tensor element types with a direct numpy equivalent (raw_data is little-endian)
+_ONNX_DTYPE_TO_NP = {
+    1: np.dtype('<f4'),
+    2: np.dtype('u1'),
+    3: np.dtype('i1'),
+    4: np.dtype('<u2'),
+    5: np.dtype('<i2'),
+    6: np.dtype('<i4'),
+    7: np.dtype('<i8'),
+    9: np.dtype('bool'),
+    10: np.dtype('<f2'),
+    11: np.dtype('<f8'),
+    12: np.dtype('<u4'),
+    13: np.dtype('<u8')
+}
+
+# Repeated field holding the values of tensors stored without raw_data
+_ONNX_TYPED_FIELDS = {
+    1: 'float_data',
+    2: 'int32_data',
+    3: 'int32_data',
+    4: 'int32_data',
+    5: 'int32_data',
+    6: 'int32_data',
+    7: 'int64_data',
+    9: 'int32_data',
+    10: 'int32_data',
+    11: 'double_data',
+    12: 'uint64_data',
+    13: 'uint64_data'
+}
+
+def _map_external_file(path: str, mapped_files: Dict[str, mmap.mmap]) -> mmap.mmap:
+    """Memory-map an external data file once per conversion"""
+    mapped = mapped_files.get(path)
+    if mapped is None:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mapped_files[path] = mapped
+    return mapped
+
+def _tensor_to_array(tensor: onnx.TensorProto, base_dir: Optional[str] = None,
+                     mapped_files: Optional[Dict[str, mmap.mmap]] = None) -> np.ndarray:
+    """
+    Convert an ONNX tensor to a read-only numpy array
+    
+    Tensors with raw_data are viewed in place with np.frombuffer; typed
+    fields are converted in a single numpy call, with float16 bit patterns
+    reinterpreted rather than decoded value by value. Externally stored
+    tensors are viewed from a memory map of their data file, so pages are
+    only read when the weight is used. Other element types go through
+    onnx.numpy_helper.
+    """
+    dtype = _ONNX_DTYPE_TO_NP.get(tensor.data_type)
+    is_external = tensor.data_location == onnx.TensorProto.EXTERNAL
+    if dtype is None or (is_external and base_dir is None):
+        return onnx.numpy_helper.to_array(tensor, base_dir or '')
+    
+    if is_external:
+        info = {entry.key: entry.value for entry in tensor.external_data}
+        mapped = _map_external_file(os.path.join(base_dir, info['location']),
+                                    mapped_files if mapped_files is not None else {})
+        count = int(np.prod(tensor.dims, dtype=np.int64))
+        arr = np.frombuffer(mapped, dtype=dtype, count=count, offset=int(info.get('offset', 0)))
+    elif tensor.raw_data:
+        arr = np.frombuffer(tensor.raw_data, dtype=dtype)
+    elif tensor.data_type == onnx.TensorProto.FLOAT16:
+        arr = np.asarray(tensor.int32_data, dtype=np.uint16).view(np.float16)
+    else:
+        arr = np.asarray(getattr(tensor, _ONNX_TYPED_FIELDS[tensor.data_type]), dtype=dtype)
+    
+    arr = arr.reshape(tuple(tensor.dims))
+    arr.flags.writeable = False
+    return arr
+
+@functools.lru_cache(maxsize=32)
+def _check_model_file(model_path: str, mtime_ns: int, size: int) -> None:
+    """Run onnx.checker on a model file; passing checks are cached per path, mtime and size"""
+    onnx.checker.check_model(model_path)
+
+def _load_onnx_model(model_path: str, validate: bool = False) -> onnx.ModelProto:
+    """
+    Load ONNX model from file
+    
+    External weight data is not read here; _extract_initializers maps the
+    data files instead. The full onnx.checker pass is only run when
+    validate is set, since _validate_onnx_model covers the structural checks
+    the converter relies on.
+    """
     if not os.path.exists(model_path):
         raise FileNotFoundError(f"ONNX model file not found: {model_path}")
     
     try:
-        model = onnx.load(model_path)
-        onnx.checker.check_model(model)
+        model = onnx.load(model_path, load_external_data=False)
+        if validate:
+            stat = os.stat(model_path)
+            _check_model_file(os.path.abspath(model_path), stat.st_mtime_ns, stat.st_size)
         return model
     except Exception as e:
         raise RuntimeError(f"Failed to load ONNX model: {str(e)}")
 
-def _extract_initializers(model: onnx.ModelProto) -> Dict[str, np.ndarray]:
-    """Extract weight tensors from ONNX model initializers"""
-    weights = {}
+# Below this many initializers thread start-up costs more than parallel decoding saves
+_PARALLEL_DECODE_MIN = 64
+
+def _extract_initializers(model: onnx.ModelProto, base_dir: str = '',
+                          names: Optional[set] = None) -> Dict[str, np.ndarray]:
+    """
+    Extract weight tensors from ONNX model initializers, optionally only those in names
+    
+    Large models decode their initializers on a thread pool; the numpy
+    conversions release the GIL. External data files are mapped up front
+    so the workers only read the shared map table.
+    """
+    initializers = [initializer for initializer in model.graph.initializer
+                    if names is None or initializer.name in names]
+    
+    mapped_files = {}
+    for initializer in initializers:
+        if initializer.data_location == onnx.TensorProto.EXTERNAL:
+            for entry in initializer.external_data:
+                if entry.key == 'location':
+                    _map_external_file(os.path.join(base_dir, entry.value), mapped_files)
+    
+    def decode(initializer):
+        return initializer.name, _tensor_to_array(initializer, base_dir, mapped_files)
+    
+    if len(initializers) < _PARALLEL_DECODE_MIN:
+        return dict(map(decode, initializers))
+    
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return dict(executor.map(decode, initializers))
+
+class _LazyWeightDict(MutableMapping):
+    """
+    Weight mapping that decodes ONNX initializers on first access
+    
+    Holds the initializer protos by name and converts each one with
+    _tensor_to_array only when it is read, so weights a caller never
+    touches are never decoded. Membership tests, iteration and deletion do
+    not decode; assigned values are stored as-is.
+    """
+    
+    def __init__(self, model: onnx.ModelProto, base_dir: str = ''):
+        self._values = {initializer.name: initializer for initializer in model.graph.initializer}
+        self._pending = set(self._values)
+        self._base_dir = base_dir
+        self._mapped_files = {}
+    
+    def __getitem__(self, name: str) -> Any:
+        value = self._values[name]
+        if name in self._pending:
+            value = _tensor_to_array(value, self._base_dir, self._mapped_files)
+            self._values[name] = value
+            self._pending.discard(name)
+        return value
+    
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._values[name] = value
+        self._pending.discard(name)
+    
+    def __delitem__(self, name: str) -> None:
+        del self._values[name]
+        self._pending.discard(name)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._values
+    
+    def __iter__(self):
+        return iter(self._values)
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    def copy(self) -> '_LazyWeightDict':
+        """Independent mapping sharing decoded arrays and still-pending protos"""
+        clone = _LazyWeightDict.__new__(_LazyWeightDict)
+        clone._values = dict(self._values)
+        clone._pending = set(self._pending)
+        clone._base_dir = self._base_dir
+        clone._mapped_files = self._mapped_files
+        return clone
     
-    for initializer in model.graph.initializer:
-        # Convert ONNX tensor to numpy array
-        weight_array = onnx.numpy_helper.to_array(initializer)
-        weights[initializer.name] = weight_array
+    def __getstate__(self) -> Dict[str, Any]:
+        # Memory maps cannot be pickled or deep-copied; a restored mapping
+        # re-maps external data files when a pending weight is read
+        state = self.__dict__.copy()
+        state['_mapped_files'] = {}
+        return state
     
-    return weights
+    def close(self) -> None:
+        """
+        Release the memory maps of external data files
+        
+        Maps still viewed by weights already handed out stay open until
+        those arrays are dropped; pending weights re-map on their next read.
+        """
+        for mapped in self._mapped_files.values():
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+        self._mapped_files.clear()
 
-def _extract_graph_nodes(model: onnx.ModelProto) -> Dict[str, CMXOp]:
-    """Extract computational nodes from ONNX graph"""
+def _extract_graph_nodes(model: onnx.ModelProto, start: int = 0, end: Optional[int] = None) -> tuple:
+    """
+    Extract computational nodes from ONNX graph
+    
+    Args:
+        model: ONNX model
+        start: Index of the first node to extract
+        end: Index of the last node to extract (None = last node in the graph)
+        
+    Returns:
+        Tuple of (nodes, names of all tensors the nodes read, ONNX op type
+        counts), gathered in a single pass over the nodes
+    """
     nodes = {}
+    referenced = set()
+    op_counts = Counter()
+    op_map_get = _ONNX_TO_CMX.get
+    referenced_update = referenced.update
+    extract_attributes = _extract_node_attributes
+    graph_nodes = model.graph.node
     
-    for i, node in enumerate(model.graph.node):
+    if end is None:
+        end = len(graph_nodes) - 1
+    
+    for i in range(start, end + 1):
+        node = graph_nodes[i]
         node_id = f"node_{i}_{node.name}" if node.name else f"node_{i}"
         
         # Map ONNX op to CMatrix op
-        op_type = _map_onnx_op_to_cmx(node.op_type)
+        onnx_op = node.op_type
+        op_type = op_map_get(onnx_op) or onnx_op.lower()
+        op_counts[onnx_op] += 1
         
         # Get inputs and outputs
-        inputs = list(node.input)
-        outputs = list(node.output)
+        inputs = tuple(node.input)
+        outputs = tuple(node.output)
+        referenced_update(inputs)
         
         # Extract attributes
-        attributes = _extract_node_attributes(node)
+        attributes = extract_attributes(node)
         
         cmx_op = CMXOp(op_type, inputs, outputs, attributes)
         nodes[node_id] = cmx_op
     
-    return nodes
+    return nodes, referenced, op_counts
+
+# ONNX operation types mapped to CMatrix operation types
+_ONNX_TO_CMX = {
+    'Conv': 'conv2d',
+    'Relu': 'relu',
+    'MaxPool': 'max_pool2d',
+    'AveragePool': 'avg_pool2d',
+    'GlobalAveragePool': 'global_avg_pool2d',
+    'MatMul': 'matmul',
+    'Gemm': 'linear',  # General Matrix Multiplication (used for linear/dense layers)
+    'Add': 'add',
+    'Mul': 'mul',
+    'Sub': 'sub',
+    'Div': 'div',
+    'Softmax': 'softmax',
+    'Sigmoid': 'sigmoid',
+    'Tanh': 'tanh',
+    'Reshape': 'reshape',
+    'Transpose': 'transpose',
+    'Concat': 'concat',
+    'Split': 'split',
+    'Flatten': 'flatten',
+    'Dropout': 'dropout',
+    'BatchNormalization': 'batch_norm',
+    'LayerNormalization': 'layer_norm',
+    'InstanceNormalization': 'instance_norm',
+    'LeakyRelu': 'leaky_relu',
+    'Elu': 'elu',
+    'Selu': 'selu',
+    'PRelu': 'prelu',
+    'Clip': 'clip',
+    'Pad': 'pad',
+    'Upsample': 'upsample',
+    'Resize': 'resize',
+    'ReduceMean': 'mean',
+    'ReduceSum': 'sum',
+    'ReduceMax': 'max',
+    'ReduceMin': 'min',
+    'Slice': 'slice',
+    'Gather': 'gather',
+    'Constant': 'constant',
+    'Identity': 'identity',
+    'Cast': 'cast'
+}
 
 def _map_onnx_op_to_cmx(onnx_op: str) -> str:
     """Map ONNX operation types to CMatrix operation types"""
-    op_mapping = {
-        'Conv': 'conv2d',
-        'Relu': 'relu',
-        'MaxPool': 'max_pool2d',
-        'AveragePool': 'avg_pool2d',
-        'GlobalAveragePool': 'global_avg_pool2d',
-        'MatMul': 'matmul',
-        'Gemm': 'linear',  # General Matrix Multiplication (used for linear/dense layers)
-        'Add': 'add',
-        'Mul': 'mul',
-        'Sub': 'sub',
-        'Div': 'div',
-        'Softmax': 'softmax',
-        'Sigmoid': 'sigmoid',
-        'Tanh': 'tanh',
-        'Reshape': 'reshape',
-        'Transpose': 'transpose',
-        'Concat': 'concat',
-        'Split': 'split',
-        'Flatten': 'flatten',
-        'Dropout': 'dropout',
-        'BatchNormalization': 'batch_norm',
-        'LayerNormalization': 'layer_norm',
-        'InstanceNormalization': 'instance_norm',
-        'LeakyRelu': 'leaky_relu',
-        'Elu': 'elu',
-        'Selu': 'selu',
-        'PRelu': 'prelu',
-        'Clip': 'clip',
-        'Pad': 'pad',
-        'Upsample': 'upsample',
-        'Resize': 'resize',
-        'ReduceMean': 'mean',
-        'ReduceSum': 'sum',
-        'ReduceMax': 'max',
-        'ReduceMin': 'min',
-        'Slice': 'slice',
-        'Gather': 'gather',
-        'Constant': 'constant',
-        'Identity': 'identity',
-        'Cast': 'cast'
-    }
-    
-    return op_mapping.get(onnx_op, onnx_op.lower())
+    return _ONNX_TO_CMX.get(onnx_op) or onnx_op.lower()
+
+# Attribute value readers keyed by onnx.AttributeProto type
+_ATTR_HANDLERS = {
+    onnx.AttributeProto.INT: lambda attr: attr.i,
+    onnx.AttributeProto.FLOAT: lambda attr: attr.f,
+    onnx.AttributeProto.STRING: lambda attr: attr.s.decode('utf-8'),
+    onnx.AttributeProto.INTS: lambda attr: list(attr.ints),
+    onnx.AttributeProto.FLOATS: lambda attr: list(attr.floats),
+    onnx.AttributeProto.STRINGS: lambda attr: [s.decode('utf-8') for s in attr.strings],
+    onnx.AttributeProto.TENSOR: lambda attr: _tensor_to_array(attr.t)
+}
 
 def _extract_node_attributes(node: onnx.NodeProto) -> Dict[str, Any]:
-    """Extract attributes from ONNX node"""
+    """Extract attributes from ONNX node; unsupported types fall back to their string form"""
+    handlers_get = _ATTR_HANDLERS.get
     attributes = {}
     
     for attr in node.attribute:
-        attr_name = attr.name
-        
-        # Parse different attribute types
-        if attr.type == onnx.AttributeProto.INT:
-            attributes[attr_name] = attr.i
-        elif attr.type == onnx.AttributeProto.FLOAT:
-            attributes[attr_name] = attr.f
-        elif attr.type == onnx.AttributeProto.STRING:
-            attributes[attr_name] = attr.s.decode('utf-8')
-        elif attr.type == onnx.AttributeProto.INTS:
-            attributes[attr_name] = list(attr.ints)
-        elif attr.type == onnx.AttributeProto.FLOATS:
-            attributes[attr_name] = list(attr.floats)
-        elif attr.type == onnx.AttributeProto.STRINGS:
-            attributes[attr_name] = [s.decode('utf-8') for s in attr.strings]
-        elif attr.type == onnx.AttributeProto.TENSOR:
-            attributes[attr_name] = onnx.numpy_helper.to_array(attr.t)
-        else:
-            # Fallback for other types
-            attributes[attr_name] = str(attr)
+        handler = handlers_get(attr.type)
+        attributes[attr.name] = handler(attr) if handler is not None else str(attr)
     
     return attributes
 
+def _value_info_to_dict(value_info: onnx.ValueInfoProto) -> Dict[str, Any]:
+    """Describe a graph input or output: name, shape (dynamic dims by name, unknown as -1) and dtype"""
+    tensor_type = value_info.type.tensor_type
+    return {
+        'name': value_info.name,
+        'shape': [dim.dim_value or dim.dim_param or -1 for dim in tensor_type.shape.dim],
+        'dtype': _get_onnx_dtype(tensor_type.elem_type)
+    }
+
 def _extract_input_output_info(model: onnx.ModelProto) -> tuple:
     """Extract input and output information from ONNX model"""
-    inputs = []
-    outputs = []
-    
-    # Extract input info
-    for input_info in model.graph.input:
-        input_name = input_info.name
-        input_shape = []
-        
-        if input_info.type.tensor_type.shape:
-            for dim in input_info.type.tensor_type.shape.dim:
-                if dim.dim_value:
-                    input_shape.append(dim.dim_value)
-                elif dim.dim_param:
-                    input_shape.append(dim.dim_param)  # Dynamic dimension
-                else:
-                    input_shape.append(-1)  # Unknown dimension
-        
-        inputs.append({
-            'name': input_name,
-            'shape': input_shape,
-            'dtype': _get_onnx_dtype(input_info.type.tensor_type.elem_type)
-        })
-    
-    # Extract output info
-    for output_info in model.graph.output:
-        output_name = output_info.name
-        output_shape = []
-        
-        if output_info.type.tensor_type.shape:
-            for dim in output_info.type.tensor_type.shape.dim:
-                if dim.dim_value:
-                    output_shape.append(dim.dim_value)
-                elif dim.dim_param:
-                    output_shape.append(dim.dim_param)
-                else:
-                    output_shape.append(-1)
-        
-        outputs.append({
-            'name': output_name,
-            'shape': output_shape,
-            'dtype': _get_onnx_dtype(output_info.type.tensor_type.elem_type)
-        })
+    inputs = [_value_info_to_dict(input_info) for input_info in model.graph.input]
+    outputs = [_value_info_to_dict(output_info) for output_info in model.graph.output]
     
     return inputs, outputs
 
+# ONNX tensor element type names, indexed by TensorProto data type
+_ONNX_DTYPE_NAMES = (
+    None,
+    'float32',
+    'uint8',
+    'int8',
+    'uint16',
+    'int16',
+    'int32',
+    'int64',
+    'string',
+    'bool',
+    'float16',
+    'float64',
+    'uint32',
+    'uint64'
+)
+
 def _get_onnx_dtype(onnx_type: int) -> str:
     """Convert ONNX data type to string representation"""
-    type_mapping = {
-        1: 'float32',
-        2: 'uint8',
-        3: 'int8',
-        4: 'uint16',
-        5: 'int16',
-        6: 'int32',
-        7: 'int64',
-        8: 'string',
-        9: 'bool',
-        10: 'float16',
-        11: 'float64',
-        12: 'uint32',
-        13: 'uint64'
-    }
-    
-    return type_mapping.get(onnx_type, f'unknown_type_{onnx_type}')
+    name = _ONNX_DTYPE_NAMES[onnx_type] if 0 <= onnx_type < len(_ONNX_DTYPE_NAMES) else None
+    return name or f'unknown_type_{onnx_type}'
 
 def _validate_onnx_model(model: onnx.ModelProto) -> bool:
     """Validate ONNX model structure"""
-    try:
-        # Check if model has required components
-        if not model.graph:
-            raise ValueError("ONNX model has no graph")
-        
-        if not model.graph.node:
-            raise ValueError("ONNX model has no nodes")
-        
-        # Check for inputs and outputs
-        if not model.graph.input:
-            raise ValueError("ONNX model has no inputs defined")
-        
-        if not model.graph.output:
-            raise ValueError("ONNX model has no outputs defined")
-        
-        return True
-    except Exception as e:
-        raise RuntimeError(f"ONNX model validation failed: {str(e)}")
+    graph = model.graph
+    checks = (
+        (model.HasField('graph'), "ONNX model has no graph"),
+        (len(graph.node) > 0, "ONNX model has no nodes"),
+        (len(graph.input) > 0, "ONNX model has no inputs defined"),
+        (len(graph.output) > 0, "ONNX model has no outputs defined")
+    )
+    for passed, message in checks:
+        if not passed:
+            raise RuntimeError(f"ONNX model validation failed: {message}")
+    
+    return True
 
-def _get_model_metadata(model: onnx.ModelProto, model_path: str) -> Dict[str, Any]:
+def _get_model_metadata(model: onnx.ModelProto, model_path: Optional[str]) -> Dict[str, Any]:
     """Extract metadata from ONNX model"""
     metadata = {
         'framework': 'onnx',
@@ -256,9 +436,9 @@ def _get_model_metadata(model: onnx.ModelProto, model_path: str) -> Dict[str, An
             'version': opset.version
         })
     
-    # Calculate model size
+    # Calculate model size (serialized size for models passed in memory)
     try:
-        model_size = os.path.getsize(model_path)
+        model_size = os.path.getsize(model_path) if model_path else model.ByteSize()
         metadata['model_size_bytes'] = model_size
         metadata['model_size_mb'] = model_size / (1024 * 1024)
     except:
@@ -267,35 +447,722 @@ def _get_model_metadata(model: onnx.ModelProto, model_path: str) -> Dict[str, An
     
     return metadata
 
-def _optimize_graph(cmx_graph: CMXGraph) -> CMXGraph:
-    """Perform basic graph optimizations"""
-    # Remove identity operations
-    nodes_to_remove = []
+def _graph_captures(graph: onnx.GraphProto) -> set:
+    """Names a subgraph reads from its enclosing scope"""
+    defined = {value.name for value in graph.input}
+    defined.update(tensor.name for tensor in graph.initializer)
+    read = {value.name for value in graph.output}
+    for node in graph.node:
+        read.update(node.input)
+        read |= _subgraph_captures((node,))
+        defined.update(node.output)
+    read.discard('')
+    return read - defined
+
+def _subgraph_captures(nodes) -> set:
+    """
+    Names of outer-scope tensors read inside the If/Loop/Scan bodies of nodes
+    
+    Subgraph attributes are kept in string form, so the optimization passes
+    cannot see these reads through node inputs.
+    """
+    captured = set()
+    for node in nodes:
+        for attr in node.attribute:
+            if attr.type == onnx.AttributeProto.GRAPH:
+                captured |= _graph_captures(attr.g)
+            elif attr.type == onnx.AttributeProto.GRAPHS:
+                for graph in attr.graphs:
+                    captured |= _graph_captures(graph)
+    return captured
+
+def _tensor_consumers(cmx_graph: CMXGraph) -> Dict[str, List[str]]:
+    """Index the ids of the nodes reading each tensor"""
+    consumers = {}
     for node_id, node in cmx_graph.nodes.items():
-        if node.op_type == 'identity':
-            # Connect inputs directly to outputs of identity nodes
-            nodes_to_remove.append(node_id)
+        for name in node.inputs:
+            if name:
+                consumers.setdefault(name, []).append(node_id)
+    return consumers
+
+def _graph_output_names(cmx_graph: CMXGraph) -> set:
+    """Names of the tensors the graph exposes as outputs"""
+    return {out['name'] if isinstance(out, dict) else out for out in cmx_graph.outputs}
+
+def _sole_consumer(node: CMXOp, consumers: Dict[str, List[str]], graph_outputs: set) -> Optional[str]:
+    """
+    Return the id of the only node reading node's single output
+    
+    None if the output is read by several nodes or is a graph output, in
+    which case the intermediate tensor has to stay and the pair cannot fuse.
+    """
+    if len(node.outputs) != 1 or node.outputs[0] in graph_outputs:
+        return None
+    readers = consumers.get(node.outputs[0], [])
+    return readers[0] if len(readers) == 1 else None
+
+def _unique_weight_name(weights: Dict[str, Any], base: str) -> str:
+    """Return a weight name derived from base that is not yet in use"""
+    name = base
+    counter = 0
+    while name in weights:
+        counter += 1
+        name = f"{base}_{counter}"
+    return name
+
+def _remove_identities(cmx_graph: CMXGraph) -> None:
+    """Drop identity nodes, pointing their consumers at the identity's input"""
+    graph_outputs = _graph_output_names(cmx_graph)
+    renames = {}
+    
+    for node_id, node in list(cmx_graph.nodes.items()):
+        if (node.op_type == 'identity' and len(node.inputs) == 1 and len(node.outputs) == 1
+                and node.outputs[0] not in graph_outputs):
+            renames[node.outputs[0]] = node.inputs[0]
+            del cmx_graph.nodes[node_id]
+    
+    if not renames:
+        return
+    
+    def resolve(name):
+        while name in renames:
+            name = renames[name]
+        return name
+    
+    for node in cmx_graph.nodes.values():
+        node.inputs = tuple(resolve(name) for name in node.inputs)
+
+def _fold_reshape(inputs: List[np.ndarray], attributes: Dict[str, Any]) -> np.ndarray:
+    """Reshape with ONNX semantics: 0 copies the input dim unless allowzero is set"""
+    data, shape = inputs
+    shape = [int(d) for d in np.asarray(shape).reshape(-1)]
+    if not attributes.get('allowzero', 0):
+        shape = [data.shape[i] if d == 0 else d for i, d in enumerate(shape)]
+    return data.reshape(shape)
+
+def _fold_div(inputs: List[np.ndarray], attributes: Dict[str, Any]) -> np.ndarray:
+    """Divide with ONNX semantics: integer division truncates toward zero"""
+    a, b = inputs
+    if np.issubdtype(a.dtype, np.integer):
+        return np.trunc(np.true_divide(a, b)).astype(a.dtype)
+    return np.divide(a, b)
+
+def _fold_constant(inputs: List[np.ndarray], attributes: Dict[str, Any]) -> np.ndarray:
+    """Materialize the value of a constant node"""
+    if 'value' in attributes:
+        return attributes['value']
+    for key, dtype in (('value_float', np.float32), ('value_floats', np.float32),
+                       ('value_int', np.int64), ('value_ints', np.int64)):
+        if key in attributes:
+            return np.array(attributes[key], dtype=dtype)
+    raise ValueError("Unsupported constant value")
+
+# NumPy evaluation of ops whose inputs are all constant: (inputs, attributes) -> array
+_CONSTANT_FOLDERS = {
+    'constant': _fold_constant,
+    'add': lambda inputs, attributes: np.add(*inputs),
+    'sub': lambda inputs, attributes: np.subtract(*inputs),
+    'mul': lambda inputs, attributes: np.multiply(*inputs),
+    'div': _fold_div,
+    'reshape': _fold_reshape,
+    'transpose': lambda inputs, attributes: np.transpose(inputs[0], attributes.get('perm')),
+    'concat': lambda inputs, attributes: np.concatenate(inputs, axis=attributes.get('axis', 0)),
+    'cast': lambda inputs, attributes: inputs[0].astype(_ONNX_DTYPE_TO_NP[attributes['to']])
+}
+
+def _fold_constants(cmx_graph: CMXGraph) -> None:
+    """
+    Evaluate nodes whose inputs are all weights and store their outputs as weights
     
-    # Remove identified nodes
-    for node_id in nodes_to_remove:
+    Nodes are visited in graph order, so chains of constant ops fold in one
+    sweep; the sweep repeats until nothing more folds.
+    """
+    weights = cmx_graph.weights
+    
+    folded = True
+    while folded:
+        folded = False
+        for node_id, node in list(cmx_graph.nodes.items()):
+            folder = _CONSTANT_FOLDERS.get(node.op_type)
+            if folder is None or len(node.outputs) != 1:
+                continue
+            names = [name for name in node.inputs if name]
+            if not all(name in weights for name in names):
+                continue
+            
+            try:
+                with np.errstate(all='ignore'):
+                    value = np.asarray(folder([weights[name] for name in names], node.attributes))
+            except Exception:
+                continue
+            
+            weights[node.outputs[0]] = value
+            del cmx_graph.nodes[node_id]
+            folded = True
+
+def _eliminate_dead_code(cmx_graph: CMXGraph) -> None:
+    """
+    Drop nodes and weights that no graph output depends on
+    
+    Liveness is propagated backward from the graph outputs through the
+    node producing each live tensor. Graphs without declared outputs keep
+    all their nodes and only lose weights no node reads.
+    """
+    nodes = cmx_graph.nodes
+    live = _graph_output_names(cmx_graph)
+    
+    if live:
+        producers = {name: node_id for node_id, node in nodes.items() for name in node.outputs if name}
+        live_nodes = set()
+        pending = list(live)
+        while pending:
+            node_id = producers.get(pending.pop())
+            if node_id is None or node_id in live_nodes:
+                continue
+            live_nodes.add(node_id)
+            for name in nodes[node_id].inputs:
+                if name and name not in live:
+                    live.add(name)
+                    pending.append(name)
+        for node_id in [node_id for node_id in nodes if node_id not in live_nodes]:
+            del nodes[node_id]
+    else:
+        for node in nodes.values():
+            live.update(node.inputs)
+    
+    weights = cmx_graph.weights
+    for name in [name for name in weights if name not in live]:
+        del weights[name]
+
+# Ops that act on each element independently of its position, so a
+# transpose commutes with them (extra inputs must be scalar weights)
+_LAYOUT_AGNOSTIC_OPS = frozenset({
+    'relu', 'leaky_relu', 'sigmoid', 'tanh', 'elu', 'selu', 'clip', 'cast', 'dropout'
+})
+
+def _transpose_perm(node: CMXOp) -> Optional[tuple]:
+    """Return the explicit perm of a single-input transpose node, None otherwise"""
+    if node.op_type != 'transpose' or len(node.inputs) != 1 or len(node.outputs) != 1:
+        return None
+    perm = node.attributes.get('perm')
+    if perm is None:
+        return None
+    return tuple(int(axis) for axis in perm)
+
+def _cancel_transposes(cmx_graph: CMXGraph) -> None:
+    """
+    Push transposes down through element-wise ops and cancel inverse pairs
+    
+    A transpose feeding a layout-agnostic op swaps places with it, two
+    consecutive transposes merge into one with the composed perm, and a
+    transpose whose perm is the identity is removed. Tensor shapes are not
+    tracked, so size-1 axes stay in the perm. Sweeps repeat until
+    nothing changes; swapped nodes also swap positions so graph order
+    stays topological.
+    """
+    weights = cmx_graph.weights
+    order = list(cmx_graph.nodes)
+    position = {node_id: i for i, node_id in enumerate(order)}
+    swapped = False
+    
+    changed = True
+    while changed:
+        changed = False
+        consumers = _tensor_consumers(cmx_graph)
+        graph_outputs = _graph_output_names(cmx_graph)
+        producers = {name: node_id for node_id, node in cmx_graph.nodes.items() for name in node.outputs}
+        dirty = set()
+        
+        for node_id, node in list(cmx_graph.nodes.items()):
+            perm = _transpose_perm(node)
+            if perm is None or node.inputs[0] in dirty or node.outputs[0] in dirty:
+                continue
+            source, result = node.inputs[0], node.outputs[0]
+            
+            # Identity perm: readers take the transpose's input directly, or
+            # for a graph output the producer writes the output name itself
+            if perm == tuple(range(len(perm))):
+                if result in graph_outputs:
+                    producer_id = producers.get(source)
+                    if (producer_id is None or source in graph_outputs
+                            or consumers.get(source) != [node_id]):
+                        continue
+                    producer = cmx_graph.nodes[producer_id]
+                    producer.outputs = tuple(result if name == source else name for name in producer.outputs)
+                else:
+                    for reader_id in consumers.get(result, []):
+                        reader = cmx_graph.nodes[reader_id]
+                        reader.inputs = tuple(source if name == result else name for name in reader.inputs)
+                        dirty.update(reader.outputs)
+                del cmx_graph.nodes[node_id]
+                dirty.update((source, result))
+                changed = True
+                continue
+            
+            next_id = _sole_consumer(node, consumers, graph_outputs)
+            if next_id is None:
+                continue
+            next_node = cmx_graph.nodes[next_id]
+            if not next_node.inputs or next_node.inputs[0] != result or len(next_node.outputs) != 1:
+                continue
+            
+            next_perm = _transpose_perm(next_node)
+            if next_perm is not None:
+                # transpose(transpose(x, p), q) == transpose(x, p[q])
+                if len(next_perm) != len(perm):
+                    continue
+                next_node.inputs = (source,)
+                next_node.attributes = dict(next_node.attributes, perm=[perm[axis] for axis in next_perm])
+                del cmx_graph.nodes[node_id]
+            elif next_node.op_type in _LAYOUT_AGNOSTIC_OPS:
+                extra = [name for name in next_node.inputs[1:] if name]
+                if not all(name in weights and np.size(weights[name]) == 1 for name in extra):
+                    continue
+                # Run the element-wise op first and transpose its output
+                next_output = next_node.outputs[0]
+                next_node.inputs = (source,) + next_node.inputs[1:]
+                next_node.outputs = (result,)
+                node.inputs = (result,)
+                node.outputs = (next_output,)
+                i, j = position[node_id], position[next_id]
+                order[i], order[j] = next_id, node_id
+                position[node_id], position[next_id] = j, i
+                swapped = True
+            else:
+                continue
+            
+            dirty.update(next_node.inputs)
+            dirty.update(next_node.outputs)
+            dirty.update((source, result))
+            changed = True
+    
+    if swapped:
+        nodes = cmx_graph.nodes
+        cmx_graph.nodes = {node_id: nodes[node_id] for node_id in order if node_id in nodes}
+
+def _fold_pads_into_convs(cmx_graph: CMXGraph) -> None:
+    """Absorb a constant zero-padding pad node into the pads of the conv2d reading it"""
+    weights = cmx_graph.weights
+    consumers = _tensor_consumers(cmx_graph)
+    graph_outputs = _graph_output_names(cmx_graph)
+    
+    for node_id, node in list(cmx_graph.nodes.items()):
+        if node.op_type != 'pad' or len(node.inputs) > 3 or node.attributes.get('mode', 'constant') != 'constant':
+            continue
+        pads = weights.get(node.inputs[1]) if len(node.inputs) > 1 and node.inputs[1] else node.attributes.get('pads')
+        fill = weights.get(node.inputs[2]) if len(node.inputs) > 2 and node.inputs[2] else node.attributes.get('value', 0.0)
+        if pads is None or fill is None or np.any(np.asarray(fill) != 0):
+            continue
+        pads = [int(p) for p in np.asarray(pads).reshape(-1)]
+        
+        conv_id = _sole_consumer(node, consumers, graph_outputs)
+        if conv_id is None:
+            continue
+        conv = cmx_graph.nodes[conv_id]
+        if conv.op_type != 'conv2d' or conv.inputs[0] != node.outputs[0]:
+            continue
+        if conv.attributes.get('auto_pad', 'NOTSET') != 'NOTSET':
+            continue
+        
+        # Pad lists begins then ends for every axis; only spatial axes may be padded
+        rank = len(pads) // 2
+        spatial = rank - 2
+        begins, ends = pads[:rank], pads[rank:]
+        if spatial < 1 or any(begins[:2]) or any(ends[:2]) or min(pads) < 0:
+            continue
+        conv_pads = list(conv.attributes.get('pads', [0] * (2 * spatial)))
+        if len(conv_pads) != 2 * spatial:
+            continue
+        
+        conv.attributes = dict(conv.attributes, pads=(
+            [conv_pads[i] + begins[i + 2] for i in range(spatial)]
+            + [conv_pads[spatial + i] + ends[i + 2] for i in range(spatial)]))
+        conv.inputs = node.inputs[:1] + conv.inputs[1:]
+        del cmx_graph.nodes[node_id]
+
+def _squeeze_axes(node: CMXOp, weights: Dict[str, Any]) -> Optional[frozenset]:
+    """Return the constant axes of a squeeze/unsqueeze node, None if unknown"""
+    if len(node.inputs) > 1 and node.inputs[1]:
+        axes = weights.get(node.inputs[1])
+    else:
+        axes = node.attributes.get('axes')
+    if axes is None:
+        return None
+    return frozenset(int(axis) for axis in np.asarray(axes).reshape(-1))
+
+def _collapse_reshapes(cmx_graph: CMXGraph) -> None:
+    """
+    Collapse reshape chains and drop squeeze/unsqueeze pairs that cancel
+    
+    A reshape feeding another reshape is skipped when the second shape has
+    no 0 entries, since those would copy dims from the intermediate tensor.
+    A squeeze followed by an unsqueeze over the same axes (or the reverse)
+    is the identity; readers of the pair's output take its input instead.
+    """
+    weights = cmx_graph.weights
+    consumers = _tensor_consumers(cmx_graph)
+    graph_outputs = _graph_output_names(cmx_graph)
+    
+    for node_id, node in list(cmx_graph.nodes.items()):
+        if node_id not in cmx_graph.nodes or node.op_type not in ('reshape', 'squeeze', 'unsqueeze'):
+            continue
+        next_id = _sole_consumer(node, consumers, graph_outputs)
+        if next_id is None:
+            continue
+        next_node = cmx_graph.nodes[next_id]
+        if not next_node.inputs or next_node.inputs[0] != node.outputs[0]:
+            continue
+        source = node.inputs[0]
+        
+        if node.op_type == 'reshape':
+            shape = weights.get(next_node.inputs[1]) if len(next_node.inputs) > 1 else None
+            if (next_node.op_type != 'reshape' or shape is None
+                    or (not next_node.attributes.get('allowzero', 0) and np.any(np.asarray(shape) == 0))):
+                continue
+            next_node.inputs = (source,) + next_node.inputs[1:]
+            consumers.setdefault(source, []).append(next_id)
+        else:
+            inverse = 'unsqueeze' if node.op_type == 'squeeze' else 'squeeze'
+            if next_node.op_type != inverse or len(next_node.outputs) != 1:
+                continue
+            axes = _squeeze_axes(node, weights)
+            result = next_node.outputs[0]
+            if axes is None or axes != _squeeze_axes(next_node, weights) or result in graph_outputs:
+                continue
+            readers = consumers.pop(result, [])
+            for reader_id in readers:
+                reader = cmx_graph.nodes[reader_id]
+                reader.inputs = tuple(source if name == result else name for name in reader.inputs)
+            consumers.setdefault(source, []).extend(readers)
+            del cmx_graph.nodes[next_id]
+        
+        consumers[source].remove(node_id)
+        del cmx_graph.nodes[node_id]
+
+def _merge_constant_chains(cmx_graph: CMXGraph) -> None:
+    """Pre-combine the constants of chained add or mul nodes: (x op a) op b -> x op (a op b)"""
+    weights = cmx_graph.weights
+    consumers = _tensor_consumers(cmx_graph)
+    graph_outputs = _graph_output_names(cmx_graph)
+    
+    for node_id, node in list(cmx_graph.nodes.items()):
+        if node_id not in cmx_graph.nodes or node.op_type not in ('add', 'mul') or len(node.inputs) != 2:
+            continue
+        constants = [name for name in node.inputs if name in weights]
+        if len(constants) != 1:
+            continue
+        source = node.inputs[0] if node.inputs[1] == constants[0] else node.inputs[1]
+        
+        next_id = _sole_consumer(node, consumers, graph_outputs)
+        if next_id is None:
+            continue
+        next_node = cmx_graph.nodes[next_id]
+        if next_node.op_type != node.op_type or len(next_node.inputs) != 2:
+            continue
+        others = [name for name in next_node.inputs if name != node.outputs[0]]
+        if len(others) != 1 or others[0] not in weights:
+            continue
+        
+        a, b = np.asarray(weights[constants[0]]), np.asarray(weights[others[0]])
+        if a.dtype != b.dtype:
+            continue
+        combine = np.add if node.op_type == 'add' else np.multiply
+        name = _unique_weight_name(weights, f"{next_node.outputs[0]}_{node.op_type}_const")
+        weights[name] = combine(a, b)
+        
+        next_node.inputs = (source, name)
+        consumers[source] = [next_id if reader == node_id else reader for reader in consumers[source]]
         del cmx_graph.nodes[node_id]
+
+def _fold_batch_norms(cmx_graph: CMXGraph) -> None:
+    """
+    Fold batch_norm nodes with constant parameters into the preceding conv2d or linear
+    
+    The normalization becomes a per-output-channel scale of the kernel plus
+    a new bias, so the batch_norm node and its intermediate tensor disappear.
+    """
+    weights = cmx_graph.weights
+    consumers = _tensor_consumers(cmx_graph)
+    graph_outputs = _graph_output_names(cmx_graph)
+    
+    for node_id, node in list(cmx_graph.nodes.items()):
+        if node.op_type not in ('conv2d', 'linear') or len(node.inputs) < 2:
+            continue
+        bn_id = _sole_consumer(node, consumers, graph_outputs)
+        if bn_id is None:
+            continue
+        bn = cmx_graph.nodes[bn_id]
+        if (bn.op_type != 'batch_norm' or len(bn.inputs) < 5 or bn.inputs[0] != node.outputs[0]
+                or len([name for name in bn.outputs if name]) != 1):
+            continue
+        
+        kernel = weights.get(node.inputs[1])
+        params = [weights.get(name) for name in bn.inputs[1:5]]
+        has_bias = len(node.inputs) > 2 and bool(node.inputs[2])
+        bias = weights.get(node.inputs[2]) if has_bias else None
+        if kernel is None or any(p is None for p in params) or (has_bias and bias is None):
+            continue
+        
+        scale, shift, mean, var = (np.asarray(p, dtype=np.float64).reshape(-1) for p in params)
+        factor = scale / np.sqrt(var + bn.attributes.get('epsilon', 1e-5))
+        channels = factor.shape[0]
+        attributes = dict(node.attributes)
+        
+        if node.op_type == 'conv2d':
+            if kernel.ndim < 2 or kernel.shape[0] != channels:
+                continue
+            new_kernel = kernel * factor.reshape((-1,) + (1,) * (kernel.ndim - 1))
+            old_bias = np.zeros(channels) if bias is None else bias
+        else:
+            # Gemm: Y = alpha * A @ B (+ beta * C), B is [N, K] when transB is set
+            trans_b = attributes.get('transB', 0)
+            if kernel.ndim != 2 or kernel.shape[0 if trans_b else 1] != channels:
+                continue
+            new_kernel = kernel * (factor[:, None] if trans_b else factor[None, :])
+            old_bias = np.zeros(channels) if bias is None else attributes.get('beta', 1.0) * np.asarray(bias)
+            attributes['beta'] = 1.0
+        
+        try:
+            old_bias = np.broadcast_to(np.asarray(old_bias, dtype=np.float64).reshape(-1), (channels,))
+        except ValueError:
+            continue
+        new_bias = (old_bias - mean) * factor + shift
+        
+        kernel_name = _unique_weight_name(weights, f"{node.inputs[1]}_bn_folded")
+        weights[kernel_name] = new_kernel.astype(kernel.dtype)
+        bias_name = _unique_weight_name(weights, f"{bn.inputs[2]}_bn_folded")
+        weights[bias_name] = new_bias.astype(kernel.dtype)
+        
+        node.inputs = (node.inputs[0], kernel_name, bias_name)
+        node.outputs = tuple(name for name in bn.outputs if name)
+        node.attributes = attributes
+        del cmx_graph.nodes[bn_id]
+
+def _fuse_matmul_add(cmx_graph: CMXGraph) -> None:
+    """Turn matmul with a constant 2-D kernel followed by a constant bias add into linear"""
+    weights = cmx_graph.weights
+    consumers = _tensor_consumers(cmx_graph)
+    graph_outputs = _graph_output_names(cmx_graph)
+    
+    for node_id, node in list(cmx_graph.nodes.items()):
+        if node.op_type != 'matmul' or len(node.inputs) != 2:
+            continue
+        kernel = weights.get(node.inputs[1])
+        add_id = _sole_consumer(node, consumers, graph_outputs)
+        if kernel is None or kernel.ndim != 2 or add_id is None:
+            continue
+        add = cmx_graph.nodes[add_id]
+        if add.op_type != 'add' or len(add.inputs) != 2:
+            continue
+        
+        # The bias has to broadcast along the output features only
+        others = [name for name in add.inputs if name != node.outputs[0]]
+        bias = weights.get(others[0]) if len(others) == 1 else None
+        if bias is None:
+            continue
+        bias_shape = np.shape(bias)
+        if bias_shape[-1:] not in ((), (1,), (kernel.shape[1],)) or any(d != 1 for d in bias_shape[:-1]):
+            continue
+        
+        node.op_type = 'linear'
+        node.inputs = (node.inputs[0], node.inputs[1], others[0])
+        node.outputs = add.outputs
+        node.attributes = {'alpha': 1.0, 'beta': 1.0, 'transA': 0, 'transB': 0}
+        del cmx_graph.nodes[add_id]
+
+def _clip_bounds(node: CMXOp, weights: Dict[str, Any]) -> Optional[tuple]:
+    """Return the constant (min, max) range of a relu or clip node, None if not constant"""
+    if node.op_type == 'relu':
+        return (0.0, None)
+    if node.op_type != 'clip':
+        return None
+    
+    # Opset < 11 keeps the bounds in attributes, later opsets in optional inputs
+    bounds = [node.attributes.get('min'), node.attributes.get('max')]
+    for i, name in enumerate(node.inputs[1:3]):
+        if name:
+            value = weights.get(name)
+            if value is None or np.size(value) != 1:
+                return None
+            bounds[i] = float(np.asarray(value).reshape(-1)[0])
+    return tuple(bounds)
+
+def _merge_clips(cmx_graph: CMXGraph) -> None:
+    """Merge chains of relu/clip nodes into a single clip over the intersected range"""
+    weights = cmx_graph.weights
+    consumers = _tensor_consumers(cmx_graph)
+    graph_outputs = _graph_output_names(cmx_graph)
+    
+    for node_id, node in list(cmx_graph.nodes.items()):
+        if node_id not in cmx_graph.nodes:
+            continue
+        bounds = _clip_bounds(node, weights)
+        while bounds is not None:
+            next_id = _sole_consumer(node, consumers, graph_outputs)
+            if next_id is None:
+                break
+            next_node = cmx_graph.nodes[next_id]
+            next_bounds = _clip_bounds(next_node, weights)
+            if next_bounds is None or next_node.inputs[0] != node.outputs[0]:
+                break
+            
+            lows = [b for b in (bounds[0], next_bounds[0]) if b is not None]
+            highs = [b for b in (bounds[1], next_bounds[1]) if b is not None]
+            merged = (max(lows) if lows else None, min(highs) if highs else None)
+            
+            # Disjoint ranges do not intersect: the chain outputs a constant
+            # bound, which a single clip over the merged range would not
+            if None not in merged and merged[0] > merged[1]:
+                break
+            bounds = merged
+            
+            if bounds == (0.0, None):
+                node.op_type, node.attributes = 'relu', {}
+            else:
+                node.op_type = 'clip'
+                node.attributes = {key: value for key, value in zip(('min', 'max'), bounds) if value is not None}
+            node.inputs = node.inputs[:1]
+            node.outputs = next_node.outputs
+            del cmx_graph.nodes[next_id]
+
+def _fuse_activations(cmx_graph: CMXGraph) -> None:
+    """Fold relu, clip and leaky_relu nodes into the conv2d or linear node feeding them"""
+    weights = cmx_graph.weights
+    consumers = _tensor_consumers(cmx_graph)
+    graph_outputs = _graph_output_names(cmx_graph)
+    
+    for node_id, node in list(cmx_graph.nodes.items()):
+        if node.op_type not in ('conv2d', 'linear') or 'activation' in node.attributes:
+            continue
+        act_id = _sole_consumer(node, consumers, graph_outputs)
+        if act_id is None:
+            continue
+        act = cmx_graph.nodes[act_id]
+        if not act.inputs or act.inputs[0] != node.outputs[0]:
+            continue
+        
+        if act.op_type == 'leaky_relu':
+            fused = {'activation': 'leaky_relu', 'activation_alpha': act.attributes.get('alpha', 0.01)}
+        else:
+            bounds = _clip_bounds(act, weights)
+            if bounds is None:
+                continue
+            if act.op_type == 'relu':
+                fused = {'activation': 'relu'}
+            else:
+                fused = {'activation': 'clip'}
+                if bounds[0] is not None:
+                    fused['activation_min'] = bounds[0]
+                if bounds[1] is not None:
+                    fused['activation_max'] = bounds[1]
+        
+        node.attributes = dict(node.attributes, **fused)
+        node.outputs = act.outputs
+        del cmx_graph.nodes[act_id]
+
+# Ops whose kernel (input 1) and bias (input 2) may be stored in reduced precision
+_REDUCED_PRECISION_OPS = frozenset({'conv2d', 'linear', 'matmul'})
+
+def _reduce_weight_precision(cmx_graph: CMXGraph, precision: str) -> None:
+    """
+    Store conv2d/linear/matmul kernels and biases as float16 or bfloat16
+    
+    A weight is only converted when every node reading it uses it as the
+    kernel or bias of one of these ops, so normalization parameters and
+    shape inputs keep their precision. Nodes whose weights were converted
+    get accum_dtype='fp32' so backends accumulate in full precision.
+    """
+    if precision == 'fp16':
+        target = np.dtype(np.float16)
+    elif precision == 'bf16':
+        if not HAS_ML_DTYPES:
+            raise ImportError("bf16 precision requires the ml_dtypes package")
+        target = np.dtype(ml_dtypes.bfloat16)
+    else:
+        raise ValueError(f"Unsupported precision: {precision}")
+    
+    weights = cmx_graph.weights
+    eligible = {}
+    for node in cmx_graph.nodes.values():
+        reduced_op = node.op_type in _REDUCED_PRECISION_OPS
+        for i, name in enumerate(node.inputs):
+            if name in weights:
+                eligible[name] = eligible.get(name, True) and reduced_op and i in (1, 2)
+    
+    converted = set()
+    for name, ok in eligible.items():
+        weight = weights[name]
+        if ok and isinstance(weight, np.ndarray) and weight.dtype in (np.float32, np.float64):
+            weights[name] = weight.astype(target)
+            converted.add(name)
+    
+    for node in cmx_graph.nodes.values():
+        if node.op_type in _REDUCED_PRECISION_OPS and not converted.isdisjoint(node.inputs[1:3]):
+            node.attributes = dict(node.attributes, accum_dtype='fp32')
+
+def _optimize_graph(cmx_graph: CMXGraph, captured: set = frozenset()) -> CMXGraph:
+    """
+    Perform graph optimizations
+    
+    Identity nodes are removed, constant subgraphs are evaluated into
+    weights, transposes are pushed through element-wise ops so inverse
+    pairs cancel, zero pads are absorbed into conv2d, reshape chains and
+    cancelling squeeze/unsqueeze pairs collapse, constants of chained
+    add/mul nodes are pre-combined, batch_norm is folded into the preceding
+    conv2d/linear, matmul plus bias add becomes linear, relu/clip chains
+    are merged and the remaining activations are fused into the op
+    producing their input. Each
+    fusion only applies when the intermediate tensor has a single reader and
+    is not a graph output. Nodes and weights no graph output depends on are
+    dropped at the end.
+    
+    Tensors in captured (read by control-flow subgraphs) are treated as
+    graph outputs while the passes run, so they are neither renamed nor
+    removed.
+    """
+    outputs = cmx_graph.outputs
+    cmx_graph.outputs = outputs + sorted(captured)
+    try:
+        _remove_identities(cmx_graph)
+        _fold_constants(cmx_graph)
+        _cancel_transposes(cmx_graph)
+        _fold_pads_into_convs(cmx_graph)
+        _collapse_reshapes(cmx_graph)
+        _merge_constant_chains(cmx_graph)
+        _fold_batch_norms(cmx_graph)
+        _fuse_matmul_add(cmx_graph)
+        _merge_clips(cmx_graph)
+        _fuse_activations(cmx_graph)
+        _eliminate_dead_code(cmx_graph)
+    finally:
+        cmx_graph.outputs = outputs
     
     return cmx_graph
 
-def convert_from_onnx(model_path: str, optimize: bool = True) -> CMXGraph:
+def convert_from_onnx(model_path: Union[str, onnx.ModelProto], optimize: bool = True,
+                      validate: bool = False, precision: str = 'fp32') -> CMXGraph:
     """
     Convert ONNX model to CMatrix internal format
     
     Args:
-        model_path: Path to ONNX model file
+        model_path: Path to ONNX model file, or an already loaded ModelProto
+            (external data is then resolved relative to the working directory)
         optimize: Whether to apply basic graph optimizations
+        validate: Whether to run the full onnx.checker pass on the model
+        precision: Storage precision for conv/linear/matmul weights
+            ('fp32', 'fp16' or 'bf16'; bf16 requires ml_dtypes)
         
     Returns:
         CMXGraph: CMatrix internal graph representation
     """
     
     # Load ONNX model
-    model = _load_onnx_model(model_path)
+    if isinstance(model_path, onnx.ModelProto):
+        model, model_path = model_path, None
+        if validate:
+            onnx.checker.check_model(model)
+    else:
+        model = _load_onnx_model(model_path, validate)
     
     # Validate model
     _validate_onnx_model(model)
@@ -304,29 +1171,35 @@ def convert_from_onnx(model_path: str, optimize: bool = True) -> CMXGraph:
     cmx_graph = CMXGraph()
     
     # Extract components
-    cmx_graph.weights = _extract_initializers(model)
-    cmx_graph.nodes = _extract_graph_nodes(model)
+    cmx_graph.nodes, _, op_counts = _extract_graph_nodes(model)
+    cmx_graph.weights = _LazyWeightDict(model, os.path.dirname(model_path) if model_path else '')
     
     # Extract input/output information
     inputs, outputs = _extract_input_output_info(model)
     cmx_graph.inputs = inputs
     cmx_graph.outputs = outputs
     
+    # Apply optimizations if requested
+    if optimize:
+        cmx_graph = _optimize_graph(cmx_graph, _subgraph_captures(model.graph.node))
+    
+    # Reduce weight precision after folding, which needs the full-precision values
+    if precision != 'fp32':
+        _reduce_weight_precision(cmx_graph, precision)
+    
     # Set metadata
     cmx_graph.metadata = _get_model_metadata(model, model_path)
+    cmx_graph.metadata['precision'] = precision
     
     # Add graph statistics
     cmx_graph.metadata.update({
         'num_nodes': len(cmx_graph.nodes),
         'num_weights': len(cmx_graph.weights),
         'num_inputs': len(cmx_graph.inputs),
-        'num_outputs': len(cmx_graph.outputs)
+        'num_outputs': len(cmx_graph.outputs),
+        'onnx_op_counts': dict(op_counts)
     })
     
-    # Apply optimizations if requested
-    if optimize:
-        cmx_graph = _optimize_graph(cmx_graph)
-    
     return cmx_graph
 
 def get_onnx_model_info(model_path: str) -> Dict[str, Any]:
@@ -384,15 +1257,16 @@ def extract_subgraph(model_path: str, start_node: str, end_node: str) -> CMXGrap
     """Extract a subgraph from ONNX model between specified nodes"""
     model = _load_onnx_model(model_path)
     
-    # Find start and end node indices
-    start_idx = None
-    end_idx = None
-    
+    # Index nodes by name and by position once; later nodes win on duplicate names
+    node_index = {}
     for i, node in enumerate(model.graph.node):
-        if node.name == start_node or f"node_{i}" == start_node:
-            start_idx = i
-        if node.name == end_node or f"node_{i}" == end_node:
-            end_idx = i
+        node_index[f"node_{i}"] = i
+        if node.name:
+            node_index[node.name] = i
+    
+    # Find start and end node indices
+    start_idx = node_index.get(start_node)
+    end_idx = node_index.get(end_node)
     
     if start_idx is None or end_idx is None:
         raise ValueError(f"Could not find start node '{start_node}' or end node '{end_node}'")
@@ -403,28 +1277,26 @@ def extract_subgraph(model_path: str, start_node: str, end_node: str) -> CMXGrap
     # Create subgraph
     cmx_graph = CMXGraph()
     
-    # Extract nodes in range
-    for i in range(start_idx, end_idx + 1):
-        node = model.graph.node[i]
-        node_id = f"node_{i}_{node.name}" if node.name else f"node_{i}"
-        
-        op_type = _map_onnx_op_to_cmx(node.op_type)
-        inputs = list(node.input)
-        outputs = list(node.output)
-        attributes = _extract_node_attributes(node)
-        
-        cmx_op = CMXOp(op_type, inputs, outputs, attributes)
-        cmx_graph.nodes[node_id] = cmx_op
+    # Extract nodes in range and keep those the end node depends on
+    cmx_graph.nodes, _, _ = _extract_graph_nodes(model, start_idx, end_idx)
+    outputs = [name for name in model.graph.node[end_idx].output if name]
+    
+    # Tensors control-flow bodies read are kept alive like outputs
+    captured = _subgraph_captures(model.graph.node[start_idx:end_idx + 1])
+    cmx_graph.outputs = outputs + sorted(captured)
+    _eliminate_dead_code(cmx_graph)
+    cmx_graph.outputs = outputs
     
-    # Extract relevant weights
-    node_inputs = set()
-    for i in range(start_idx, end_idx + 1):
-        node_inputs.update(model.graph.node[i].input)
+    # Only decode the weights the surviving nodes read
+    node_inputs = {name for node in cmx_graph.nodes.values() for name in node.inputs}
+    cmx_graph.weights = _extract_initializers(model, os.path.dirname(model_path), node_inputs | captured)
     
-    for initializer in model.graph.initializer:
-        if initializer.name in node_inputs:
-            weight_array = onnx.numpy_helper.to_array(initializer)
-            cmx_graph.weights[initializer.name] = weight_array
+    # Tensors read but not produced inside the subgraph become its inputs
+    produced = {name for node in cmx_graph.nodes.values() for name in node.outputs}
+    read = dict.fromkeys(name for node in cmx_graph.nodes.values() for name in node.inputs)
+    read.update(dict.fromkeys(sorted(captured)))
+    cmx_graph.inputs = [name for name in read
+                        if name and name not in produced and name not in cmx_graph.weights]
     
     # Set metadata
     cmx_graph.metadata = {
@@ -432,7 +1304,7 @@ def extract_subgraph(model_path: str, start_node: str, end_node: str) -> CMXGrap
         'original_model': model_path,
         'start_node': start_node,
         'end_node': end_node,
-        'num_nodes': end_idx - start_idx + 1
+        'num_nodes': len(cmx_graph.nodes)
     }
     
     return cmx_graph
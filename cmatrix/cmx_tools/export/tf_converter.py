@@ -11,6 +11,8 @@ import json
 
 class CMXGraph:
     """CMatrix internal graph representation"""
+    __slots__ = ('nodes', 'weights', 'inputs', 'outputs', 'metadata')
+    
     def __init__(self):
         self.nodes = {}
         self.weights = {}
@@ -20,26 +22,53 @@ class CMXGraph:
 
 class CMXOp:
     """CMatrix operation representation"""
-    def __init__(self, op_type: str, inputs: List[str], outputs: List[str], 
+    __slots__ = ('op_type', 'inputs', 'outputs', 'attributes')
+    
+    def __init__(self, op_type: str, inputs: Tuple[str, ...], outputs: Tuple[str, ...], 
                  attributes: Dict[str, Any] = None):
         self.op_type = op_type
-        self.inputs = inputs
-        self.outputs = outputs
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
         self.attributes = attributes or {}
 
+def _keras_layer_inputs(layer: tf.keras.layers.Layer, layer_index: Dict[int, int]) -> Union[List[str], None]:
+    """Resolve a layer's input names from its inbound nodes, or None if it has no connectivity"""
+    inbound_nodes = getattr(layer, '_inbound_nodes', None)
+    if not inbound_nodes:
+        return None
+    
+    inputs = []
+    for node in inbound_nodes:
+        tensors = getattr(node, 'keras_inputs', None)
+        if tensors is None:
+            tensors = getattr(node, 'input_tensors', ())
+        for tensor in tf.nest.flatten(tensors):
+            history = getattr(tensor, '_keras_history', None)
+            if history is None:
+                continue
+            producer = layer_index.get(id(history[0]))
+            if producer is not None:
+                inputs.append(f"layer_{producer}_output")
+    
+    return inputs
+
 def _extract_keras_layers(model: tf.keras.Model) -> CMXGraph:
-    """Extract layers from Keras model"""
+    """Extract layers and weights from Keras model in a single pass"""
     cmx_graph = CMXGraph()
     
-    # Get model configuration
-    config = model.get_config()
+    layers = model.layers
+    layer_index = {id(layer): i for i, layer in enumerate(layers)}
+    weight_names = []
+    weight_vars = []
     
     # Process each layer
-    for i, layer in enumerate(model.layers):
+    layer_map_get = _TF_LAYER_TO_CMX.get
+    for i, layer in enumerate(layers):
         node_id = f"layer_{i}_{layer.name}"
         
         # Map layer type to CMatrix op
-        op_type = _map_tf_layer_to_cmx(layer.__class__.__name__)
+        layer_type = layer.__class__.__name__
+        op_type = layer_map_get(layer_type) or layer_type.lower()
         
         # Get layer configuration
         layer_config = layer.get_config()
@@ -47,12 +76,26 @@ def _extract_keras_layers(model: tf.keras.Model) -> CMXGraph:
         # Extract attributes
         attributes = _extract_layer_attributes(layer, layer_config)
         
-        # Determine inputs and outputs
-        inputs = [f"input_{i}"] if i == 0 else [f"layer_{i-1}_output"]
+        # Determine inputs from the layer's inbound nodes; layers without
+        # recorded connectivity (subclassed models) fall back to chaining
+        inputs = _keras_layer_inputs(layer, layer_index)
+        if inputs is None:
+            inputs = [f"input_{i}"] if i == 0 else [f"layer_{i-1}_output"]
+        elif not inputs:
+            inputs = [f"input_{i}"]
         outputs = [f"layer_{i}_output"]
         
         cmx_op = CMXOp(op_type, inputs, outputs, attributes)
         cmx_graph.nodes[node_id] = cmx_op
+        
+        for j, weight in enumerate(layer.weights):
+            weight_names.append(f"{layer.name}_weight_{j}")
+            weight_vars.append(weight)
+    
+    # Fetch every weight in one backend call instead of one per layer
+    if weight_vars:
+        values = tf.keras.backend.batch_get_value(weight_vars)
+        cmx_graph.weights = dict(zip(weight_names, values))
     
     return cmx_graph
 
@@ -74,79 +117,82 @@ def _extract_concrete_function(model: Union[tf.keras.Model, tf.Module]) -> CMXGr
     graph_def = func.graph.as_graph_def()
     
     # Process nodes
+    op_map_get = _TF_OP_TO_CMX.get
+    parse_attr = _parse_tf_attr
     for i, node in enumerate(graph_def.node):
         node_id = f"node_{i}_{node.name}"
         
         # Map TF op to CMatrix op
-        op_type = _map_tf_op_to_cmx(node.op)
+        tf_op = node.op
+        op_type = op_map_get(tf_op) or tf_op.lower()
         
         # Get inputs and outputs
-        inputs = list(node.input)
-        outputs = [node.name]
+        inputs = tuple(node.input)
+        outputs = (node.name,)
         
         # Extract attributes
-        attributes = {}
-        for attr_name, attr_value in node.attr.items():
-            attributes[attr_name] = _parse_tf_attr(attr_value)
+        attributes = {attr_name: parse_attr(attr_value) for attr_name, attr_value in node.attr.items()}
         
         cmx_op = CMXOp(op_type, inputs, outputs, attributes)
         cmx_graph.nodes[node_id] = cmx_op
     
     return cmx_graph
 
+# Keras layer class names mapped to CMatrix operation types
+_TF_LAYER_TO_CMX = {
+    'Dense': 'linear',
+    'Conv2D': 'conv2d',
+    'Conv1D': 'conv1d',
+    'MaxPooling2D': 'max_pool2d',
+    'AveragePooling2D': 'avg_pool2d',
+    'GlobalAveragePooling2D': 'global_avg_pool2d',
+    'Flatten': 'flatten',
+    'Reshape': 'reshape',
+    'Dropout': 'dropout',
+    'BatchNormalization': 'batch_norm',
+    'LayerNormalization': 'layer_norm',
+    'ReLU': 'relu',
+    'Softmax': 'softmax',
+    'Sigmoid': 'sigmoid',
+    'Tanh': 'tanh',
+    'Add': 'add',
+    'Multiply': 'mul',
+    'Concatenate': 'concat',
+    'LSTM': 'lstm',
+    'GRU': 'gru',
+    'Embedding': 'embedding'
+}
+
 def _map_tf_layer_to_cmx(layer_type: str) -> str:
     """Map TensorFlow/Keras layer types to CMatrix operation types"""
-    layer_mapping = {
-        'Dense': 'linear',
-        'Conv2D': 'conv2d',
-        'Conv1D': 'conv1d',
-        'MaxPooling2D': 'max_pool2d',
-        'AveragePooling2D': 'avg_pool2d',
-        'GlobalAveragePooling2D': 'global_avg_pool2d',
-        'Flatten': 'flatten',
-        'Reshape': 'reshape',
-        'Dropout': 'dropout',
-        'BatchNormalization': 'batch_norm',
-        'LayerNormalization': 'layer_norm',
-        'ReLU': 'relu',
-        'Softmax': 'softmax',
-        'Sigmoid': 'sigmoid',
-        'Tanh': 'tanh',
-        'Add': 'add',
-        'Multiply': 'mul',
-        'Concatenate': 'concat',
-        'LSTM': 'lstm',
-        'GRU': 'gru',
-        'Embedding': 'embedding'
-    }
-    
-    return layer_mapping.get(layer_type, layer_type.lower())
+    return _TF_LAYER_TO_CMX.get(layer_type) or layer_type.lower()
+
+# TensorFlow graph operation types mapped to CMatrix operation types
+_TF_OP_TO_CMX = {
+    'MatMul': 'matmul',
+    'Conv2D': 'conv2d',
+    'Relu': 'relu',
+    'MaxPool': 'max_pool2d',
+    'AvgPool': 'avg_pool2d',
+    'Add': 'add',
+    'Mul': 'mul',
+    'Sub': 'sub',
+    'Div': 'div',
+    'Softmax': 'softmax',
+    'Sigmoid': 'sigmoid',
+    'Tanh': 'tanh',
+    'Reshape': 'reshape',
+    'Transpose': 'transpose',
+    'Concat': 'concat',
+    'Split': 'split',
+    'Pad': 'pad',
+    'Mean': 'mean',
+    'Sum': 'sum'
+}
 
 def _map_tf_op_to_cmx(tf_op: str) -> str:
     """Map TensorFlow operation types to CMatrix operation types"""
-    op_mapping = {
-        'MatMul': 'matmul',
-        'Conv2D': 'conv2d',
-        'Relu': 'relu',
-        'MaxPool': 'max_pool2d',
-        'AvgPool': 'avg_pool2d',
-        'Add': 'add',
-        'Mul': 'mul',
-        'Sub': 'sub',
-        'Div': 'div',
-        'Softmax': 'softmax',
-        'Sigmoid': 'sigmoid',
-        'Tanh': 'tanh',
-        'Reshape': 'reshape',
-        'Transpose': 'transpose',
-        'Concat': 'concat',
-        'Split': 'split',
-        'Pad': 'pad',
-        'Mean': 'mean',
-        'Sum': 'sum'
-    }
-    
-    return op_mapping.get(tf_op, tf_op.lower())
+    return _TF_OP_TO_CMX.get(tf_op) or tf_op.lower()
 
 def _extract_layer_attributes(layer: tf.keras.layers.Layer, config: Dict) -> Dict[str, Any]:
     """Extract attributes from Keras layer"""
@@ -175,48 +221,65 @@ def _extract_layer_attributes(layer: tf.keras.layers.Layer, config: Dict) -> Dic
     
     return attributes
 
+def _parse_tf_attr_list(attr_value) -> Any:
+    """Parse the list variant of a TensorFlow attribute value"""
+    values = attr_value.list
+    if values.i:
+        return list(values.i)
+    if values.f:
+        return list(values.f)
+    if values.s:
+        return [s.decode('utf-8') for s in values.s]
+    return str(attr_value)
+
+# AttrValue readers keyed by the name of the set 'value' oneof field
+_TF_ATTR_DISPATCH = {
+    'i': lambda attr_value: attr_value.i,
+    'f': lambda attr_value: attr_value.f,
+    's': lambda attr_value: attr_value.s.decode('utf-8'),
+    'b': lambda attr_value: attr_value.b,
+    'list': _parse_tf_attr_list
+}
+
 def _parse_tf_attr(attr_value) -> Any:
-    """Parse TensorFlow attribute value"""
-    if attr_value.HasField('i'):
-        return attr_value.i
-    elif attr_value.HasField('f'):
-        return attr_value.f
-    elif attr_value.HasField('s'):
-        return attr_value.s.decode('utf-8')
-    elif attr_value.HasField('b'):
-        return attr_value.b
-    elif attr_value.list.i:
-        return list(attr_value.list.i)
-    elif attr_value.list.f:
-        return list(attr_value.list.f)
-    elif attr_value.list.s:
-        return [s.decode('utf-8') for s in attr_value.list.s]
-    else:
-        return str(attr_value)
+    """Parse TensorFlow attribute value; other kinds fall back to their string form"""
+    handler = _TF_ATTR_DISPATCH.get(attr_value.WhichOneof('value'))
+    return handler(attr_value) if handler is not None else str(attr_value)
 
 def _extract_weights(model: tf.keras.Model) -> Dict[str, np.ndarray]:
     """Extract weights from TensorFlow/Keras model"""
-    weights = {}
+    weight_names = []
+    weight_vars = []
     
     for layer in model.layers:
-        layer_weights = layer.get_weights()
-        if layer_weights:
-            for i, weight in enumerate(layer_weights):
-                weight_name = f"{layer.name}_weight_{i}"
-                weights[weight_name] = weight
+        for i, weight in enumerate(layer.weights):
+            weight_names.append(f"{layer.name}_weight_{i}")
+            weight_vars.append(weight)
     
-    return weights
+    if not weight_vars:
+        return {}
+    
+    return dict(zip(weight_names, tf.keras.backend.batch_get_value(weight_vars)))
 
-def _extract_saved_model_weights(saved_model_path: str) -> Dict[str, np.ndarray]:
+def _extract_saved_model_weights(saved_model_path: str, loaded_model=None) -> Dict[str, np.ndarray]:
     """Extract weights from saved model"""
     weights = {}
     
-    # Load the saved model
-    loaded_model = tf.saved_model.load(saved_model_path)
+    # Load the saved model unless the caller already has it
+    if loaded_model is None:
+        loaded_model = tf.saved_model.load(saved_model_path)
     
-    # Extract variables
+    # Group variables by device so each device does one host transfer
+    by_device = {}
     for variable in loaded_model.variables:
-        weights[variable.name] = variable.numpy()
+        by_device.setdefault(variable.device, []).append(variable)
+    
+    for variables in by_device.values():
+        values = [variable.value() for variable in variables]
+        with tf.device('/cpu:0'):
+            host_values = tf.identity_n(values)
+        for variable, value in zip(variables, host_values):
+            weights[variable.name] = value.numpy()
     
     return weights
 
@@ -237,15 +300,15 @@ def convert_from_tf(tf_model: Union[tf.keras.Model, str],
         # Load saved model
         model = tf.saved_model.load(tf_model)
         cmx_graph = _extract_concrete_function(model)
-        cmx_graph.weights = _extract_saved_model_weights(tf_model)
+        cmx_graph.weights = _extract_saved_model_weights(tf_model, model)
         framework_info = 'tensorflow_saved_model'
     elif isinstance(tf_model, tf.keras.Model):
         if use_concrete_function:
             cmx_graph = _extract_concrete_function(tf_model)
+            cmx_graph.weights = _extract_weights(tf_model)
         else:
+            # Layer extraction collects weights in the same pass
             cmx_graph = _extract_keras_layers(tf_model)
-        
-        cmx_graph.weights = _extract_weights(tf_model)
         framework_info = 'tensorflow_keras'
     else:
         raise TypeError("Input must be a tf.keras.Model or path to saved model")
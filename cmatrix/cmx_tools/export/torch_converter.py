@@ -5,14 +5,22 @@ Converts PyTorch models to CMatrix internal graph representation.
 """
 
 import torch
-import torch.onnx
-import tempfile
-import os
-from typing import Dict, List, Any, Tuple
+import torch.fx
+import torch.nn.functional as F
+import operator
+import io
+import weakref
+import functools
+import warnings
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple, Optional
 import numpy as np
 
 class CMXGraph:
     """CMatrix internal graph representation"""
+    __slots__ = ('nodes', 'weights', 'inputs', 'outputs', 'metadata')
+    
     def __init__(self):
         self.nodes = {}
         self.weights = {}
@@ -22,135 +30,521 @@ class CMXGraph:
 
 class CMXOp:
     """CMatrix operation representation"""
-    def __init__(self, op_type: str, inputs: List[str], outputs: List[str], 
+    __slots__ = ('op_type', 'inputs', 'outputs', 'attributes')
+    
+    def __init__(self, op_type: str, inputs: Tuple[str, ...], outputs: Tuple[str, ...], 
                  attributes: Dict[str, Any] = None):
         self.op_type = op_type
-        self.inputs = inputs
-        self.outputs = outputs
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
         self.attributes = attributes or {}
 
+# Dummy inputs keyed by (shape, dtype, device); tracing and export only look
+# at shapes, so zero-filled tensors for the few most recent keys are reused
+# across conversions
+@functools.lru_cache(maxsize=4)
+def _zeros_input(shape: Tuple, dtype: torch.dtype, device: str) -> torch.Tensor:
+    """Zero-filled tensor for a hashable shape, dtype and device"""
+    return torch.zeros(shape, dtype=dtype, device=device)
+
+def _get_dummy_input(shape: Tuple, dtype: torch.dtype = torch.float32, device: str = 'cpu') -> torch.Tensor:
+    """Return the cached zero-filled tracing input for a shape, dtype and device"""
+    return _zeros_input(tuple(shape), dtype, str(device))
+
 def _trace_model(model: torch.nn.Module, input_shape: Tuple) -> torch.jit.ScriptModule:
-    """Trace PyTorch model using TorchScript"""
+    """
+    Trace PyTorch model using TorchScript
+    
+    Only the static graph is needed, so the profiling executor is disabled,
+    autograd is off and the validation re-run of the trace is skipped. The
+    traced module is frozen, which inlines submodule calls and folds
+    parameters into constants before graph extraction; the optional
+    numerics-changing optimizations freezing would run are skipped.
+    """
     model.eval()
     
-    # Create dummy input
-    dummy_input = torch.randn(*input_shape)
+    # Get dummy input
+    dummy_input = _get_dummy_input(input_shape)
     
     try:
         # Trace the model
-        traced_model = torch.jit.trace(model, dummy_input)
-        return traced_model
+        with torch.jit.optimized_execution(False), torch.no_grad():
+            traced_model = torch.jit.trace(model, dummy_input, check_trace=False, strict=False)
+        return torch.jit.freeze(traced_model.eval(), optimize_numerics=False)
     except Exception as e:
         raise RuntimeError(f"Failed to trace PyTorch model: {str(e)}")
 
+def _constant_tensor_to_numpy(tensor: torch.Tensor) -> np.ndarray:
+    """Convert a graph constant tensor to numpy (bfloat16 has no numpy dtype and widens to float32)"""
+    tensor = tensor.detach().cpu()
+    if tensor.dtype == torch.bfloat16:
+        tensor = tensor.float()
+    return tensor.numpy()
+
+# TorchScript attribute kinds mapped to their typed Node accessors; tensor
+# attributes (folded constants in frozen graphs) are returned as numpy arrays
+_TORCH_ATTR_GETTERS = {
+    'i': lambda node, name: node.i(name),
+    'f': lambda node, name: node.f(name),
+    's': lambda node, name: node.s(name),
+    'is': lambda node, name: node.is_(name),
+    'fs': lambda node, name: node.fs(name),
+    'ss': lambda node, name: node.ss(name),
+    't': lambda node, name: _constant_tensor_to_numpy(node.t(name)),
+    'ts': lambda node, name: [_constant_tensor_to_numpy(tensor) for tensor in node.ts(name)]
+}
+
+def _read_node_attribute(node: torch._C.Node, name: str) -> Any:
+    """Read a node attribute through its typed accessor, falling back to the generic getter"""
+    getter = _TORCH_ATTR_GETTERS.get(node.kindOf(name))
+    return getter(node, name) if getter is not None else node[name]
+
 def _extract_graph_structure(traced_model: torch.jit.ScriptModule) -> CMXGraph:
     """Extract graph structure from traced PyTorch model"""
     cmx_graph = CMXGraph()
     
     # Get the graph from traced model
     graph = traced_model.graph
+    graph_nodes = list(graph.nodes())
+    
+    # Graph inputs, skipping the module's own 'self' argument
+    cmx_graph.inputs = [value.debugName() for value in graph.inputs()
+                        if value.type().kind() != 'ClassType']
+    cmx_graph.outputs = [value.debugName() for value in graph.outputs()]
     
     # Extract nodes
-    node_counter = 0
-    for node in graph.nodes():
-        node_id = f"node_{node_counter}"
-        
+    nodes = {}
+    op_map_get = _TORCH_OP_TO_CMX.get
+    read_attribute = _read_node_attribute
+    for node_counter, node in enumerate(graph_nodes):
         # Map PyTorch ops to CMatrix ops
-        op_type = _map_torch_op_to_cmx(node.kind())
+        kind = node.kind()
+        op_type = op_map_get(kind) or kind.removeprefix('aten::')
         
-        # Get inputs and outputs
-        inputs = [str(inp) for inp in node.inputs()]
-        outputs = [str(out) for out in node.outputs()]
+        # Get inputs and outputs by SSA name
+        inputs = [inp.debugName() for inp in node.inputs()]
+        outputs = [out.debugName() for out in node.outputs()]
         
         # Extract attributes
-        attributes = {}
-        for attr_name in node.attributeNames():
-            attributes[attr_name] = node[attr_name]
+        attributes = {attr_name: read_attribute(node, attr_name) for attr_name in node.attributeNames()}
         
-        cmx_op = CMXOp(op_type, inputs, outputs, attributes)
-        cmx_graph.nodes[node_id] = cmx_op
-        node_counter += 1
+        nodes[f"node_{node_counter}"] = CMXOp(op_type, inputs, outputs, attributes)
     
+    cmx_graph.nodes = nodes
     return cmx_graph
 
+# TorchScript op kinds mapped to CMatrix operation types
+_TORCH_OP_TO_CMX = {
+    'aten::conv2d': 'conv2d',
+    'aten::relu': 'relu',
+    'aten::max_pool2d': 'max_pool2d',
+    'aten::adaptive_avg_pool2d': 'adaptive_avg_pool2d',
+    'aten::linear': 'linear',
+    'aten::add': 'add',
+    'aten::mul': 'mul',
+    'aten::flatten': 'flatten',
+    'aten::dropout': 'dropout',
+    'aten::batch_norm': 'batch_norm',
+    'aten::softmax': 'softmax',
+    'aten::sigmoid': 'sigmoid',
+    'aten::tanh': 'tanh'
+}
+
 def _map_torch_op_to_cmx(torch_op: str) -> str:
     """Map PyTorch operation types to CMatrix operation types"""
-    op_mapping = {
-        'aten::conv2d': 'conv2d',
-        'aten::relu': 'relu',
-        'aten::max_pool2d': 'max_pool2d',
-        'aten::adaptive_avg_pool2d': 'adaptive_avg_pool2d',
-        'aten::linear': 'linear',
-        'aten::add': 'add',
-        'aten::mul': 'mul',
-        'aten::flatten': 'flatten',
-        'aten::dropout': 'dropout',
-        'aten::batch_norm': 'batch_norm',
-        'aten::softmax': 'softmax',
-        'aten::sigmoid': 'sigmoid',
-        'aten::tanh': 'tanh'
-    }
+    return _TORCH_OP_TO_CMX.get(torch_op) or torch_op.removeprefix('aten::')
+
+# torch.nn module classes mapped to CMatrix operation types
+_FX_MODULE_TO_CMX = {
+    torch.nn.Conv1d: 'conv1d',
+    torch.nn.Conv2d: 'conv2d',
+    torch.nn.Linear: 'linear',
+    torch.nn.ReLU: 'relu',
+    torch.nn.MaxPool2d: 'max_pool2d',
+    torch.nn.AvgPool2d: 'avg_pool2d',
+    torch.nn.AdaptiveAvgPool2d: 'adaptive_avg_pool2d',
+    torch.nn.BatchNorm1d: 'batch_norm',
+    torch.nn.BatchNorm2d: 'batch_norm',
+    torch.nn.LayerNorm: 'layer_norm',
+    torch.nn.Dropout: 'dropout',
+    torch.nn.Flatten: 'flatten',
+    torch.nn.Softmax: 'softmax',
+    torch.nn.Sigmoid: 'sigmoid',
+    torch.nn.Tanh: 'tanh',
+    torch.nn.GELU: 'gelu',
+    torch.nn.Embedding: 'embedding',
+    torch.nn.Identity: 'identity'
+}
+
+# Functions reached through call_function nodes mapped to CMatrix operation types
+_FX_FUNCTION_TO_CMX = {
+    torch.relu: 'relu',
+    F.relu: 'relu',
+    torch.add: 'add',
+    operator.add: 'add',
+    torch.mul: 'mul',
+    operator.mul: 'mul',
+    torch.matmul: 'matmul',
+    operator.matmul: 'matmul',
+    torch.flatten: 'flatten',
+    torch.cat: 'concat',
+    torch.softmax: 'softmax',
+    F.softmax: 'softmax',
+    torch.sigmoid: 'sigmoid',
+    torch.tanh: 'tanh',
+    F.linear: 'linear',
+    F.conv2d: 'conv2d',
+    F.max_pool2d: 'max_pool2d',
+    F.adaptive_avg_pool2d: 'adaptive_avg_pool2d',
+    F.dropout: 'dropout',
+    operator.getitem: 'getitem'
+}
+
+# Module hyperparameters copied into the attributes of call_module nodes
+_FX_MODULE_ATTRS = (
+    'in_channels', 'out_channels', 'kernel_size', 'stride', 'padding', 'dilation', 'groups',
+    'in_features', 'out_features', 'num_features', 'normalized_shape', 'eps', 'momentum',
+    'p', 'dim', 'start_dim', 'end_dim', 'output_size', 'negative_slope'
+)
+
+def _map_fx_target_to_cmx(node: torch.fx.Node, modules: Dict[str, torch.nn.Module]) -> str:
+    """Map the target of an FX call node to a CMatrix operation type"""
+    if node.op == 'call_module':
+        module_type = type(modules[node.target])
+        return _FX_MODULE_TO_CMX.get(module_type) or module_type.__name__.lower()
+    if node.op == 'call_function':
+        return (_FX_FUNCTION_TO_CMX.get(node.target)
+                or getattr(node.target, '__name__', str(node.target)).lower())
+    # call_method targets are method names such as 'view' or 'relu'
+    return node.target
+
+def _fx_attr_value(value: Any, names: Dict[torch.fx.Node, str]) -> Any:
+    """Convert an FX call argument to a plain attribute value, naming graph values"""
+    if isinstance(value, torch.fx.Node):
+        return names[value]
+    if isinstance(value, (list, tuple)):
+        return [_fx_attr_value(item, names) for item in value]
+    if isinstance(value, dict):
+        return {key: _fx_attr_value(item, names) for key, item in value.items()}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+def _symbolic_extract(model: torch.nn.Module, aliases: Optional[Dict[str, str]] = None) -> CMXGraph:
+    """
+    Extract graph structure with torch.fx symbolic tracing
     
-    return op_mapping.get(torch_op, torch_op.replace('aten::', ''))
+    Proxy tracing records the ops without running the model on real data.
+    Raises whatever symbolic_trace raises for models it cannot trace, such
+    as those with data-dependent control flow. Parameter and buffer names
+    are mapped through aliases so tied tensors resolve to the one weight
+    _model_tensors exports for them.
+    """
+    cmx_graph = CMXGraph()
+    aliases = aliases or {}
+    
+    graph_module = torch.fx.symbolic_trace(model)
+    modules = dict(graph_module.named_modules())
+    
+    # get_attr nodes name the parameter they read, matching the weight names
+    names = {}
+    node_counter = 0
+    for node in graph_module.graph.nodes:
+        if node.op == 'placeholder':
+            names[node] = node.name
+            cmx_graph.inputs.append(node.name)
+            continue
+        if node.op == 'get_attr':
+            names[node] = aliases.get(node.target, node.target)
+            continue
+        if node.op == 'output':
+            cmx_graph.outputs = [names[arg] for arg in node.all_input_nodes]
+            continue
+        
+        names[node] = node.name
+        op_type = _map_fx_target_to_cmx(node, modules)
+        inputs = [names[arg] for arg in node.all_input_nodes]
+        
+        # Keep call arguments with graph values replaced by their names
+        attributes = _fx_attr_value(dict(node.kwargs), names)
+        if node.args:
+            attributes['args'] = _fx_attr_value(node.args, names)
+        
+        # Modules read their own parameters and buffers
+        if node.op == 'call_module':
+            module = modules[node.target]
+            for attr_name in _FX_MODULE_ATTRS:
+                if hasattr(module, attr_name):
+                    attributes[attr_name] = getattr(module, attr_name)
+            for name, _ in chain(module.named_parameters(recurse=False), module.named_buffers(recurse=False)):
+                name = f"{node.target}.{name}"
+                inputs.append(aliases.get(name, name))
+        
+        cmx_op = CMXOp(op_type, inputs, [node.name], attributes)
+        cmx_graph.nodes[f"node_{node_counter}"] = cmx_op
+        node_counter += 1
+    
+    return cmx_graph
 
-def _extract_weights(model: torch.nn.Module) -> Dict[str, np.ndarray]:
-    """Extract weights and parameters from PyTorch model"""
-    weights = {}
+def _tensors_to_numpy(named_tensors: List[Tuple[str, torch.Tensor]]) -> Dict[str, np.ndarray]:
+    """
+    Convert named tensors to numpy arrays, in order
     
-    for name, param in model.named_parameters():
-        if param.requires_grad:
-            weights[name] = param.detach().cpu().numpy()
+    CPU tensors become read-only zero-copy views of the live parameter
+    storage, so callers cannot silently modify the model through them.
+    Tensors on other devices are grouped by device and dtype, flattened on
+    the device into one buffer per group and copied to the host in a single
+    transfer; the returned arrays are views into that host buffer. CUDA
+    groups copy into pinned memory on a side stream per device, so all
+    transfers are queued before a single wait.
+    """
+    arrays = {}
+    groups = {}
     
-    # Also extract buffers (like BatchNorm running stats)
-    for name, buffer in model.named_buffers():
-        weights[name] = buffer.detach().cpu().numpy()
+    for name, tensor in named_tensors:
+        tensor = tensor.detach()
+        if tensor.device.type == 'cpu':
+            array = tensor.numpy()
+            array.flags.writeable = False
+            arrays[name] = array
+        else:
+            groups.setdefault((tensor.device, tensor.dtype), []).append((name, tensor))
+    
+    streams = {}
+    pending = []
+    for (device, dtype), members in groups.items():
+        tensors = [tensor for _, tensor in members]
+        if device.type == 'cuda':
+            stream = streams.get(device)
+            if stream is None:
+                stream = streams[device] = torch.cuda.Stream(device)
+                stream.wait_stream(torch.cuda.current_stream(device))
+            with torch.cuda.stream(stream):
+                flat = torch._utils._flatten_dense_tensors(tensors)
+                host = torch.empty(flat.numel(), dtype=dtype, pin_memory=True)
+                host.copy_(flat, non_blocking=True)
+        else:
+            flat = torch._utils._flatten_dense_tensors(tensors)
+            host = flat.cpu()
+        # Device buffers stay referenced until their copies have finished
+        pending.append((members, flat, host))
+    
+    for stream in streams.values():
+        stream.synchronize()
+    
+    for members, _, host in pending:
+        offset = 0
+        for name, tensor in members:
+            numel = tensor.numel()
+            arrays[name] = host[offset:offset + numel].view(tensor.shape).numpy()
+            offset += numel
+    
+    return {name: arrays[name] for name, _ in named_tensors}
+
+def _state_parameters(state: Dict[str, torch.Tensor]) -> List[torch.nn.Parameter]:
+    """Distinct parameters of a state_dict(keep_vars=True); tied weights count once"""
+    return list({id(tensor): tensor for tensor in state.values()
+                 if isinstance(tensor, torch.nn.Parameter)}.values())
+
+def _param_stats(params: List[torch.nn.Parameter]) -> Tuple[int, int, float]:
+    """Return (total numel, trainable numel, size in MB) of parameters in one pass"""
+    total = trainable = nbytes = 0
+    for param in params:
+        numel = param.numel()
+        total += numel
+        nbytes += numel * param.element_size()
+        if param.requires_grad:
+            trainable += numel
+    return total, trainable, nbytes / (1024 * 1024)
+
+def _model_tensors(model: torch.nn.Module) -> Tuple[List[Tuple[str, torch.Tensor]], Dict[str, str]]:
+    """
+    Distinct parameters and buffers of a model, with the name every alias maps to
     
-    return weights
+    Walks the module tree once. Unlike state_dict, non-persistent buffers are
+    included; a tensor tied under several names is listed once, under the
+    first, and aliases maps each of its names to that one. Parameters come
+    before buffers, as with named_parameters()/named_buffers().
+    """
+    params, buffers = [], []
+    aliases, first_name = {}, {}
+    for module_name, module in model.named_modules(remove_duplicate=False):
+        prefix = f"{module_name}." if module_name else ''
+        for members, named in ((module._parameters, params), (module._buffers, buffers)):
+            for attr, tensor in members.items():
+                if tensor is None:
+                    continue
+                name = prefix + attr
+                canonical = first_name.setdefault(id(tensor), name)
+                aliases[name] = canonical
+                if canonical == name:
+                    named.append((name, tensor))
+    return params + buffers, aliases
+
+def _extract_weights(named_tensors: List[Tuple[str, torch.Tensor]]) -> Dict[str, np.ndarray]:
+    """
+    Extract trainable parameters and buffers (like BatchNorm running stats)
+    from the tensors _model_tensors collected
+    """
+    return _tensors_to_numpy([(name, tensor) for name, tensor in named_tensors
+                              if not isinstance(tensor, torch.nn.Parameter) or tensor.requires_grad])
 
 def _via_onnx_export(model: torch.nn.Module, input_shape: Tuple) -> CMXGraph:
-    """Convert PyTorch model via ONNX export as fallback"""
+    """Convert PyTorch model through an in-memory ONNX export"""
+    # The exporter and ONNX are only imported when this path is taken
+    import torch.onnx
     import onnx
     from .onnx_converter import convert_from_onnx
     
     model.eval()
-    dummy_input = torch.randn(*input_shape)
+    dummy_input = _get_dummy_input(input_shape)
+    
+    # Export to ONNX in memory; no temporary file is written
+    buffer = io.BytesIO()
+    torch.onnx.export(
+        model,
+        dummy_input,
+        buffer,
+        export_params=True,
+        opset_version=11,
+        do_constant_folding=True,
+        input_names=['input'],
+        output_names=['output']
+    )
     
-    # Create temporary ONNX file
-    with tempfile.NamedTemporaryFile(suffix='.onnx', delete=False) as tmp_file:
-        tmp_path = tmp_file.name
+    # Convert the parsed proto using the ONNX converter
+    cmx_graph = convert_from_onnx(onnx.load_model_from_string(buffer.getvalue()))
+    # parameters() lists tied weights once
+    num_parameters, _, model_size_mb = _param_stats(list(model.parameters()))
+    cmx_graph.metadata.update({
+        'framework': 'pytorch',
+        'graph_capture': 'onnx',
+        'input_shape': input_shape,
+        'num_parameters': num_parameters,
+        'model_size_mb': model_size_mb
+    })
+    return cmx_graph
+
+def _capture_graph(torch_model: torch.nn.Module, input_shape: Tuple,
+                   aliases: Optional[Dict[str, str]] = None) -> Tuple[CMXGraph, str]:
+    """Capture the model graph, returning it with the capture method used"""
+    # Capture the inference graph: FX records self.training branches and
+    # dropout as they are in the current mode
+    torch_model.eval()
     
+    # Symbolic tracing needs no forward pass, models it cannot trace
+    # (data-dependent control flow) go through TorchScript
     try:
-        # Export to ONNX
-        torch.onnx.export(
-            model,
-            dummy_input,
-            tmp_path,
-            export_params=True,
-            opset_version=11,
-            do_constant_folding=True,
-            input_names=['input'],
-            output_names=['output']
-        )
-        
-        # Convert using ONNX converter
-        cmx_graph = convert_from_onnx(tmp_path)
-        return cmx_graph
-        
-    finally:
-        # Clean up temporary file
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+        return _symbolic_extract(torch_model, aliases), 'fx'
+    except Exception:
+        traced_model = _trace_model(torch_model, input_shape)
+        return _extract_graph_structure(traced_model), 'torchscript'
+
+def _convert_direct(torch_model: torch.nn.Module, input_shape: Tuple) -> CMXGraph:
+    """Convert PyTorch model by capturing its graph directly"""
+    
+    # Graph capture and weight extraction only read the module, so they run
+    # concurrently; device-to-host weight copies release the GIL
+    named_tensors, aliases = _model_tensors(torch_model)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        graph_future = executor.submit(_capture_graph, torch_model, input_shape, aliases)
+        weights_future = executor.submit(_extract_weights, named_tensors)
+        cmx_graph, graph_capture = graph_future.result()
+        cmx_graph.weights = weights_future.result()
+    
+    num_parameters, _, model_size_mb = _param_stats(
+        [tensor for _, tensor in named_tensors if isinstance(tensor, torch.nn.Parameter)])
+    
+    # Set metadata
+    cmx_graph.metadata = {
+        'framework': 'pytorch',
+        'graph_capture': graph_capture,
+        'input_shape': input_shape,
+        'num_parameters': num_parameters,
+        'model_size_mb': model_size_mb
+    }
+    
+    return cmx_graph
+
+# Converted graphs per live model: {model: {(input_shape, onnx_first): (fingerprint, graph)}};
+# entries disappear together with the model
+_CONVERT_CACHE = weakref.WeakKeyDictionary()
+
+def _state_fingerprint(torch_model: torch.nn.Module) -> Tuple:
+    """
+    Fingerprint of everything tracing depends on
+    
+    Covers the module structure and configuration (repr), each submodule's
+    class, forward function, training flag and hooks, and the identity and
+    in-place version counter of every state tensor. Forward functions are
+    recorded by id so the fingerprint holds no reference to the model.
+    """
+    modules = tuple(
+        (name, type(module), id(getattr(module.forward, '__func__', module.forward)), module.training,
+         tuple(module._forward_pre_hooks), tuple(module._forward_hooks))
+        for name, module in torch_model.named_modules()
+    )
+    state = tuple((id(tensor), tensor._version) for tensor in torch_model.state_dict(keep_vars=True).values())
+    return repr(torch_model), modules, state
+
+def clear_conversion_cache() -> None:
+    """Drop cached converted graphs and tracing inputs"""
+    _CONVERT_CACHE.clear()
+    _zeros_input.cache_clear()
+
+def _copy_graph(cmx_graph) -> Any:
+    """Copy a graph's containers so callers can modify the result without touching the cache"""
+    graph_copy = type(cmx_graph)()
+    graph_copy.nodes = dict(cmx_graph.nodes)
+    graph_copy.weights = cmx_graph.weights.copy()
+    graph_copy.inputs = list(cmx_graph.inputs)
+    graph_copy.outputs = list(cmx_graph.outputs)
+    graph_copy.metadata = dict(cmx_graph.metadata)
+    return graph_copy
+
+def _convert_with_fallback(torch_model: torch.nn.Module, input_shape: Tuple,
+                           onnx_first: bool) -> CMXGraph:
+    """Run the primary conversion path, then the other one if it fails"""
+    paths = [('ONNX export', _via_onnx_export), ('Direct conversion', _convert_direct)]
+    if not onnx_first:
+        paths.reverse()
+    (primary_name, primary), (fallback_name, fallback) = paths
+    
+    try:
+        return primary(torch_model, input_shape)
+    except Exception as e:
+        primary_error = e
+        print(f"{primary_name} failed: {str(e)}")
+        print(f"Falling back to {fallback_name.lower()}...")
+    
+    # Report both failures rather than only the fallback's
+    try:
+        return fallback(torch_model, input_shape)
+    except Exception as e:
+        raise RuntimeError(
+            f"PyTorch to CMatrix conversion failed: {primary_name.lower()}: {str(primary_error)}; "
+            f"{fallback_name.lower()}: {str(e)}"
+        ) from e
 
 def convert_from_torch(torch_model: torch.nn.Module, 
                       input_shape: Tuple = (1, 3, 224, 224),
-                      use_onnx_fallback: bool = False) -> CMXGraph:
+                      use_onnx_fallback: Optional[bool] = None,
+                      onnx_first: bool = True) -> CMXGraph:
     """
     Convert PyTorch model to CMatrix internal format
     
+    Results are cached per model, input shape and conversion order while the
+    model is alive; modifying or replacing any parameter, buffer or
+    submodule, changing a submodule's configuration, forward or hooks, or
+    switching train/eval mode invalidates the cached graph. Each call
+    returns its own copy.
+    
     Args:
         torch_model: PyTorch model to convert
         input_shape: Input tensor shape for tracing
-        use_onnx_fallback: Use ONNX export as intermediary if direct conversion fails
+        use_onnx_fallback: Deprecated alias for onnx_first; overrides it when given
+        onnx_first: Convert through ONNX export first and capture the graph
+            directly only if the export fails; False reverses the order
         
     Returns:
         CMXGraph: CMatrix internal graph representation
@@ -159,44 +553,30 @@ def convert_from_torch(torch_model: torch.nn.Module,
     if not isinstance(torch_model, torch.nn.Module):
         raise TypeError("Input must be a PyTorch nn.Module")
     
-    try:
-        if use_onnx_fallback:
-            return _via_onnx_export(torch_model, input_shape)
-        
-        # Direct conversion via TorchScript tracing
-        traced_model = _trace_model(torch_model, input_shape)
-        cmx_graph = _extract_graph_structure(traced_model)
-        
-        # Extract weights
-        cmx_graph.weights = _extract_weights(torch_model)
-        
-        # Set metadata
-        cmx_graph.metadata = {
-            'framework': 'pytorch',
-            'input_shape': input_shape,
-            'num_parameters': sum(p.numel() for p in torch_model.parameters()),
-            'model_size_mb': sum(p.numel() * p.element_size() for p in torch_model.parameters()) / (1024 * 1024)
-        }
-        
-        return cmx_graph
-        
-    except Exception as e:
-        if not use_onnx_fallback:
-            print(f"Direct conversion failed: {str(e)}")
-            print("Falling back to ONNX export...")
-            return _via_onnx_export(torch_model, input_shape)
-        else:
-            raise RuntimeError(f"PyTorch to CMatrix conversion failed: {str(e)}")
+    if use_onnx_fallback is not None:
+        warnings.warn("use_onnx_fallback is deprecated, use onnx_first instead",
+                      DeprecationWarning, stacklevel=2)
+        onnx_first = use_onnx_fallback
+    
+    key = (tuple(input_shape), onnx_first)
+    fingerprint = _state_fingerprint(torch_model)
+    cached = _CONVERT_CACHE.get(torch_model, {}).get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return _copy_graph(cached[1])
+    
+    cmx_graph = _convert_with_fallback(torch_model, input_shape, onnx_first)
+    _CONVERT_CACHE.setdefault(torch_model, {})[key] = (fingerprint, cmx_graph)
+    return _copy_graph(cmx_graph)
 
 def get_model_info(torch_model: torch.nn.Module) -> Dict[str, Any]:
     """Get information about a PyTorch model"""
-    total_params = sum(p.numel() for p in torch_model.parameters())
-    trainable_params = sum(p.numel() for p in torch_model.parameters() if p.requires_grad)
+    total_params, trainable_params, model_size_mb = _param_stats(
+        _state_parameters(torch_model.state_dict(keep_vars=True)))
     
     return {
         'total_parameters': total_params,
         'trainable_parameters': trainable_params,
-        'model_size_mb': sum(p.numel() * p.element_size() for p in torch_model.parameters()) / (1024 * 1024),
+        'model_size_mb': model_size_mb,
         'layers': len(list(torch_model.modules())),
         'framework': 'pytorch'
     }
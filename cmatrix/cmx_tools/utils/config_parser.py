@@ -6,22 +6,82 @@ configuration files used during export, compile, and optimization processes.
 """
 
 import os
+import re
+import copy
 import json
 import logging
+import importlib.util
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Union
 from pathlib import Path
+from types import MappingProxyType
 
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+# YAML and TOML backends are only imported when a file of that format is
+# actually parsed or saved; availability is checked without importing them
+HAS_YAML = importlib.util.find_spec('yaml') is not None
+HAS_TOML = importlib.util.find_spec('toml') is not None
 
 try:
-    import toml
-    HAS_TOML = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_TOML = False
+    HAS_ORJSON = False
+
+
+if HAS_ORJSON:
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON, indented with sorted keys if pretty."""
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+else:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON, indented with sorted keys if pretty."""
+        if pretty:
+            return json.dumps(obj, indent=2, sort_keys=True).encode('utf-8')
+        return json.dumps(obj).encode('utf-8')
+
+
+# Raw YAML/TOML parses keyed by abspath, as ((mtime_ns, size), config); one
+# entry per file, replaced when the file changes. JSON and .cmxconfig parse
+# faster than a deep copy, so they are not cached. Validation runs on every
+# parse since it resolves paths against the working directory and creates
+# the output directory
+_PARSED_CACHE: Dict[str, tuple] = {}
+
+# Extensions whose parses are slow enough to cache
+_CACHED_EXTENSIONS = frozenset({'.yaml', '.yml', '.toml'})
+
+# Field type/value rules with the dotted paths pre-split, as
+# (field_path, sections, expected_type, valid_values) rows
+_TYPE_VALIDATIONS = tuple(
+    (field_path, tuple(field_path.split('.')), expected_type,
+     frozenset(valid_values) if isinstance(valid_values, list) else valid_values)
+    for field_path, (expected_type, valid_values) in {
+        'target.platform': (str, ['cpu', 'gpu', 'cuda', 'opencl', 'vulkan']),
+        'target.optimization_level': (str, ['O0', 'O1', 'O2', 'O3', 'Os', 'Oz']),
+        'target.precision': (str, ['float16', 'float32', 'float64', 'int8', 'int16', 'int32']),
+        'compiler.debug_info': (bool, None),
+        'compiler.warnings_as_errors': (bool, None),
+        'memory.max_memory_mb': (int, lambda x: x > 0),
+        'memory.alignment': (int, lambda x: x > 0 and (x & (x - 1)) == 0),  # Power of 2
+        'parallelization.enable_threading': (bool, None),
+        'parallelization.max_threads': (int, lambda x: x == -1 or x > 0),
+        'optimization.quantization_type': (str, ['int8', 'int16', 'float16']),
+        'runtime.log_level': (str, ['debug', 'info', 'warning', 'error']),
+        'output.format': (str, ['library', 'executable', 'shared_library', 'static_library'])
+    }.items()
+)
+
+
+def clear_config_cache() -> None:
+    """Drop all cached parsed configurations."""
+    _PARSED_CACHE.clear()
 
 
 def parse_config(config_path: str) -> dict:
@@ -38,25 +98,37 @@ def parse_config(config_path: str) -> dict:
         FileNotFoundError: If config file doesn't exist
         ValueError: If configuration is invalid
     """
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    # A single stat serves the existence check, the cache key and the metadata
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
     
+    source_id = (stat.st_mtime_ns, stat.st_size)
     config_path = Path(config_path)
     extension = config_path.suffix.lower()
     
-    # Parse based on file extension
     try:
-        if extension == '.json':
-            config = _parse_json_config(config_path)
-        elif extension in ['.yaml', '.yml']:
-            config = _parse_yaml_config(config_path)
-        elif extension == '.toml':
-            config = _parse_toml_config(config_path)
-        elif extension == '.cmxconfig':
-            config = _parse_cmx_config(config_path)
+        cache_key = os.path.abspath(config_path) if extension in _CACHED_EXTENSIONS else None
+        cached = _PARSED_CACHE.get(cache_key)
+        if cached is not None and cached[0] == source_id:
+            config = copy.deepcopy(cached[1])
         else:
-            # Try to auto-detect format
-            config = _parse_auto_detect(config_path)
+            # Parse based on file extension
+            if extension == '.json':
+                config = _parse_json_config(config_path)
+            elif extension in ['.yaml', '.yml']:
+                config = _parse_yaml_cached(config_path, stat)
+            elif extension == '.toml':
+                config = _parse_toml_config(config_path)
+            elif extension == '.cmxconfig':
+                config = _parse_cmx_config(config_path)
+            else:
+                # Try to auto-detect format
+                config = _parse_auto_detect(config_path)
+            
+            if cache_key is not None:
+                _PARSED_CACHE[cache_key] = (source_id, copy.deepcopy(config))
         
         # Validate and apply defaults
         config = validate_config(config)
@@ -65,7 +137,9 @@ def parse_config(config_path: str) -> dict:
         config['_metadata'] = {
             'config_file': str(config_path),
             'format': extension,
-            'parsed_successfully': True
+            'parsed_successfully': True,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size
         }
         
         return config
@@ -109,141 +183,263 @@ def validate_config(config: dict) -> dict:
     return validated_config
 
 
-def _parse_json_config(config_path: Path) -> dict:
+@lru_cache(maxsize=None)
+def _yaml_backend() -> tuple:
+    """Import PyYAML on first use, preferring the libyaml-backed loader/dumper."""
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+
+@lru_cache(maxsize=None)
+def _toml_backend():
+    """Import the toml module on first use."""
+    import toml
+    return toml
+
+
+def _parse_json_config(config_path: Path, text: Optional[str] = None) -> dict:
     """Parse JSON configuration file."""
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _json_loads(config_path.read_bytes() if text is None else text)
 
 
-def _parse_yaml_config(config_path: Path) -> dict:
+def _parse_yaml_config(config_path: Path, text: Optional[str] = None) -> dict:
     """Parse YAML configuration file."""
     if not HAS_YAML:
         raise ImportError("PyYAML is required to parse YAML configuration files")
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f) or {}
+    if text is None:
+        text = config_path.read_text(encoding='utf-8')
+    yaml, loader, _ = _yaml_backend()
+    return yaml.load(text, Loader=loader) or {}
+
+
+def _parse_yaml_cached(config_path: Path, stat: os.stat_result) -> dict:
+    """
+    Parse a YAML configuration, reusing a JSON conversion of it when fresh.
+    
+    The first successful YAML parse is written to a hidden JSON sidecar
+    tagged with the source's mtime and size; later parses load the much
+    cheaper JSON until the YAML file changes.
+    """
+    source_id = [stat.st_mtime_ns, stat.st_size]
+    sidecar = config_path.with_name(f".{config_path.name}.json")
+    
+    try:
+        cached = _json_loads(sidecar.read_bytes())
+        if cached.get('source') == source_id:
+            return cached['config']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    
+    config = _parse_yaml_config(config_path)
+    
+    # Only cache data that survives a JSON round trip unchanged
+    try:
+        payload = _json_dumps({'source': source_id, 'config': config})
+        if _json_loads(payload)['config'] == config:
+            sidecar.write_bytes(payload)
+    except (TypeError, ValueError, OSError):
+        pass
+    
+    return config
 
 
-def _parse_toml_config(config_path: Path) -> dict:
+def _parse_toml_config(config_path: Path, text: Optional[str] = None) -> dict:
     """Parse TOML configuration file."""
     if not HAS_TOML:
         raise ImportError("toml is required to parse TOML configuration files")
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return toml.load(f)
+    if text is None:
+        text = config_path.read_text(encoding='utf-8')
+    return _toml_backend().loads(text)
 
 
-def _parse_cmx_config(config_path: Path) -> dict:
+# One match per meaningful line of a .cmxconfig file: a [section] header, a
+# key = value pair, or anything else (reported as invalid); blank and comment
+# lines never match, and the match's lastgroup says which kind it was. Runs
+# over the raw bytes so only the captured fields are ever decoded
+_CMX_LINE_RE = re.compile(
+    rb'^[^\S\n]*(?:'
+    rb'\[(?P<section>.*)\]'
+    rb'|(?P<key>[^\s#=][^=\n]*?)?[^\S\n]*=[^\S\n]*(?P<value>.*?)'
+    rb'|(?P<other>[^\s#].*?)'
+    rb')[^\S\n]*$',
+    re.M,
+)
+
+
+def _parse_cmx_config(config_path: Path, text: Optional[str] = None) -> dict:
     """Parse CMatrix-specific configuration file."""
     config = {}
     current_section = None
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
+    data = config_path.read_bytes() if text is None else text.encode('utf-8')
+    
+    for match in _CMX_LINE_RE.finditer(data):
+        try:
+            kind = match.lastgroup
             
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
+            # Section headers [section_name]
+            if kind == 'section':
+                current_section = match.group('section').decode('utf-8').strip()
+                if current_section not in config:
+                    config[current_section] = {}
             
-            try:
-                # Section headers [section_name]
-                if line.startswith('[') and line.endswith(']'):
-                    current_section = line[1:-1].strip()
-                    if current_section not in config:
-                        config[current_section] = {}
-                    continue
+            # Key-value pairs
+            elif kind == 'value':
+                key = (match.group('key') or b'').decode('utf-8')
+                parsed_value = _parse_config_value(match.group('value').decode('utf-8'))
                 
-                # Key-value pairs
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Parse value type
-                    parsed_value = _parse_config_value(value)
-                    
-                    if current_section:
-                        config[current_section][key] = parsed_value
-                    else:
-                        config[key] = parsed_value
+                if current_section:
+                    config[current_section][key] = parsed_value
                 else:
-                    logging.warning(f"Invalid line in {config_path}:{line_num}: {line}")
-                    
-            except Exception as e:
-                logging.warning(f"Error parsing line {line_num} in {config_path}: {e}")
-                continue
+                    config[key] = parsed_value
+            
+            else:
+                line_num = data.count(b'\n', 0, match.start()) + 1
+                line = match.group('other').decode('utf-8', errors='replace')
+                logging.warning(f"Invalid line in {config_path}:{line_num}: {line}")
+                
+        except Exception as e:
+            line_num = data.count(b'\n', 0, match.start()) + 1
+            logging.warning(f"Error parsing line {line_num} in {config_path}: {e}")
+            continue
     
     return config
 
 
+# First line that is neither blank nor a comment, used for format sniffing
+_FIRST_CONTENT_RE = re.compile(r'^[ \t]*([^\s#].*)$', re.M)
+_SECTION_HEADER_RE = re.compile(r'^\[[^\]]+\]\s*$')
+_ASSIGNMENT_RE = re.compile(r'^[^\s=:#\[{][^=:]*?\s*=')
+
+
+def _sniff_config_format(text: str) -> str:
+    """Guess the format of configuration text from its first significant line."""
+    match = _FIRST_CONTENT_RE.search(text)
+    if match is None:
+        return 'yaml'
+    
+    line = match.group(1).rstrip()
+    if line.startswith('{'):
+        return 'json'
+    if _SECTION_HEADER_RE.match(line) or _ASSIGNMENT_RE.match(line):
+        return 'ini'
+    if line.startswith('['):
+        return 'json'
+    return 'yaml'
+
+
 def _parse_auto_detect(config_path: Path) -> dict:
     """Auto-detect configuration file format."""
-    # Try parsers in order of preference
-    parsers = [
-        ('JSON', _parse_json_config),
-        ('YAML', _parse_yaml_config),
-        ('TOML', _parse_toml_config),
-        ('CMX', _parse_cmx_config)
-    ]
-    
-    for parser_name, parser_func in parsers:
+    text = config_path.read_text(encoding='utf-8')
+    detected = _sniff_config_format(text)
+    
+    # Each signature maps to one parser; JSON that fails to load may still
+    # be YAML flow syntax, and INI-style text is TOML only if it is strict
+    # enough, otherwise the more lenient CMX syntax
+    if detected == 'json':
+        parsers = [_parse_json_config, _parse_yaml_config]
+    elif detected == 'ini':
+        parsers = [_parse_toml_config, _parse_cmx_config] if HAS_TOML else [_parse_cmx_config]
+    else:
+        parsers = [_parse_yaml_config]
+    
+    for parser_func in parsers:
         try:
-            return parser_func(config_path)
+            return parser_func(config_path, text)
         except Exception:
             continue
     
     raise ValueError(f"Could not auto-detect format for {config_path}")
 
 
+_BOOL_TRUE = frozenset({'true', 'on', 'yes', '1'})
+_BOOL_FALSE = frozenset({'false', 'off', 'no', '0'})
+_NONE_VALUES = frozenset({'null', 'none', ''})
+_QUOTE_CHARS = ('"', "'")
+
+# Shape of a numeric literal; int()/float() still have the final say
+_NUMBER_RE = re.compile(r'[+-]?[\d_]*\.?[\d_]*(?:[eE][+-]?[\d_]+)?')
+
+
 def _parse_config_value(value_str: str) -> Any:
     """Parse a configuration value string to appropriate Python type."""
     value_str = value_str.strip()
     
+    # Lists are built fresh on every call so no two configs share one
+    if value_str.startswith('[') and value_str.endswith(']'):
+        list_content = value_str[1:-1].strip()
+        if not list_content:
+            return []
+        return [_parse_config_value(item) for item in _split_list_items(list_content)]
+    
+    return _parse_scalar_value(value_str)
+
+
+@lru_cache(maxsize=256)
+def _parse_scalar_value(value_str: str) -> Any:
+    """Parse a stripped non-list value; results are immutable, so cacheable."""
     # Remove quotes if present
-    if (value_str.startswith('"') and value_str.endswith('"')) or \
-       (value_str.startswith("'") and value_str.endswith("'")):
+    quote = value_str[:1]
+    if quote in _QUOTE_CHARS and value_str.endswith(quote):
         return value_str[1:-1]
     
-    # Boolean values
-    if value_str.lower() in ['true', 'on', 'yes', '1']:
+    lowered = value_str.lower()
+    if lowered in _BOOL_TRUE:
         return True
-    if value_str.lower() in ['false', 'off', 'no', '0']:
+    if lowered in _BOOL_FALSE:
         return False
-    
-    # Null/None values
-    if value_str.lower() in ['null', 'none', '']:
+    if lowered in _NONE_VALUES:
         return None
     
-    # Try to parse as number
-    try:
-        if '.' in value_str or 'e' in value_str.lower():
-            return float(value_str)
-        else:
-            return int(value_str)
-    except ValueError:
-        pass
-    
-    # Try to parse as list
-    if value_str.startswith('[') and value_str.endswith(']'):
+    if _NUMBER_RE.fullmatch(value_str):
         try:
-            list_content = value_str[1:-1].strip()
-            if not list_content:
-                return []
-            
-            items = [_parse_config_value(item.strip()) 
-                    for item in list_content.split(',')]
-            return items
-        except Exception:
+            if '.' in value_str or 'e' in lowered:
+                return float(value_str)
+            return int(value_str)
+        except ValueError:
             pass
     
-    # Return as string
     return value_str
 
 
-def _apply_default_values(config: dict) -> dict:
-    """Apply default values for missing configuration options."""
-    defaults = {
+def _split_list_items(content: str) -> List[str]:
+    """Split list contents on top-level commas, respecting quotes and nesting."""
+    if '"' not in content and "'" not in content and '[' not in content:
+        return content.split(',')
+    
+    items = []
+    start = 0
+    depth = 0
+    quote = None
+    for i, char in enumerate(content):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in _QUOTE_CHARS:
+            quote = char
+        elif char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            items.append(content[start:i])
+            start = i + 1
+    items.append(content[start:])
+    
+    return items
+
+
+# Section-level defaults applied by validate_config; read-only views so the
+# shared values cannot be modified through a merged config
+_DEFAULTS = MappingProxyType({
+    section_name: MappingProxyType(section_defaults)
+    for section_name, section_defaults in {
         'target': {
             'platform': 'cpu',
             'architecture': 'x86_64',
@@ -286,18 +482,31 @@ def _apply_default_values(config: dict) -> dict:
             'library_name': 'model',
             'generate_headers': True
         }
+    }.items()
+})
+
+# (section, key) pairs whose default is a list, copied into each config
+_MUTABLE_DEFAULTS = tuple(
+    (section_name, key)
+    for section_name, section_defaults in _DEFAULTS.items()
+    for key, value in section_defaults.items()
+    if isinstance(value, list)
+)
+
+
+def _apply_default_values(config: dict) -> dict:
+    """Apply default values for missing configuration options."""
+    # Merge defaults with provided config, section by section
+    merged_config = {
+        section_name: ({**section_defaults, **config[section_name]}
+                       if section_name in config else dict(section_defaults))
+        for section_name, section_defaults in _DEFAULTS.items()
     }
     
-    # Merge defaults with provided config
-    merged_config = {}
-    for section_name, section_defaults in defaults.items():
-        if section_name in config:
-            # Merge section-level defaults
-            merged_section = section_defaults.copy()
-            merged_section.update(config[section_name])
-            merged_config[section_name] = merged_section
-        else:
-            merged_config[section_name] = section_defaults.copy()
+    for section_name, key in _MUTABLE_DEFAULTS:
+        section = merged_config[section_name]
+        if section[key] is _DEFAULTS[section_name][key]:
+            section[key] = list(section[key])
     
     # Add any additional sections from the original config
     for section_name, section_config in config.items():
@@ -330,23 +539,7 @@ def _validate_required_fields(config: dict) -> None:
 
 def _validate_field_types(config: dict) -> None:
     """Validate configuration field types and values."""
-    type_validations = {
-        'target.platform': (str, ['cpu', 'gpu', 'cuda', 'opencl', 'vulkan']),
-        'target.optimization_level': (str, ['O0', 'O1', 'O2', 'O3', 'Os', 'Oz']),
-        'target.precision': (str, ['float16', 'float32', 'float64', 'int8', 'int16', 'int32']),
-        'compiler.debug_info': (bool, None),
-        'compiler.warnings_as_errors': (bool, None),
-        'memory.max_memory_mb': (int, lambda x: x > 0),
-        'memory.alignment': (int, lambda x: x > 0 and (x & (x - 1)) == 0),  # Power of 2
-        'parallelization.enable_threading': (bool, None),
-        'parallelization.max_threads': (int, lambda x: x == -1 or x > 0),
-        'optimization.quantization_type': (str, ['int8', 'int16', 'float16']),
-        'runtime.log_level': (str, ['debug', 'info', 'warning', 'error']),
-        'output.format': (str, ['library', 'executable', 'shared_library', 'static_library'])
-    }
-    
-    for field_path, (expected_type, valid_values) in type_validations.items():
-        sections = field_path.split('.')
+    for field_path, sections, expected_type, valid_values in _TYPE_VALIDATIONS:
         value = config
         
         # Navigate to the field
@@ -365,37 +558,82 @@ def _validate_field_types(config: dict) -> None:
             if callable(valid_values):
                 if not valid_values(value):
                     raise ValueError(f"Invalid value for {field_path}: {value}")
-            elif isinstance(valid_values, (list, tuple)):
-                if value not in valid_values:
-                    raise ValueError(f"Invalid value for {field_path}: {value} (must be one of {valid_values})")
+            elif value not in valid_values:
+                raise ValueError(f"Invalid value for {field_path}: {value} (must be one of {sorted(valid_values)})")
+
+
+# Pre-split lookup paths for _dig
+_P_PLATFORM = ('target', 'platform')
+_P_ARCHITECTURE = ('target', 'architecture')
+_P_PRECISION = ('target', 'precision')
+_P_ENABLE_GPU = ('parallelization', 'enable_gpu')
+_P_ENABLE_QUANTIZATION = ('optimization', 'enable_quantization')
+_P_ENABLE_TENSOR_CORE = ('optimization', 'enable_tensor_core')
+_P_ENABLE_MEMORY_POOL = ('memory', 'enable_memory_pool')
+_P_ALLOCATION_STRATEGY = ('memory', 'allocation_strategy')
+_P_MAX_MEMORY_MB = ('memory', 'max_memory_mb')
+_P_OUTPUT_DIRECTORY = ('output', 'output_directory')
+
+
+def _dig(config: dict, path: tuple, default: Any = None) -> Any:
+    """Look up a nested config value by a tuple of keys, or return default."""
+    value = config
+    for key in path:
+        if not isinstance(value, dict):
+            return default
+        value = value.get(key)
+        if value is None:
+            return default
+    return value
 
 
 def _validate_dependencies(config: dict) -> None:
     """Validate cross-field dependencies."""
     # GPU-specific validations
-    if config.get('target', {}).get('platform') in ['gpu', 'cuda']:
-        if not config.get('parallelization', {}).get('enable_gpu', False):
+    if _dig(config, _P_PLATFORM) in ('gpu', 'cuda'):
+        if not _dig(config, _P_ENABLE_GPU, False):
             logging.warning("GPU platform selected but GPU parallelization not enabled")
     
     # Quantization dependencies
-    if config.get('optimization', {}).get('enable_quantization', False):
-        precision = config.get('target', {}).get('precision', 'float32')
-        if precision not in ['float32', 'float16']:
+    if _dig(config, _P_ENABLE_QUANTIZATION, False):
+        precision = _dig(config, _P_PRECISION, 'float32')
+        if precision not in ('float32', 'float16'):
             raise ValueError("Quantization requires float32 or float16 base precision")
     
     # Memory pool dependencies
-    if config.get('memory', {}).get('enable_memory_pool', False):
-        if config.get('memory', {}).get('allocation_strategy') != 'static':
+    if _dig(config, _P_ENABLE_MEMORY_POOL, False):
+        if _dig(config, _P_ALLOCATION_STRATEGY) != 'static':
             logging.warning("Memory pool works best with static allocation strategy")
     
     # Output directory validation
-    output_dir = config.get('output', {}).get('output_directory', '.')
+    output_dir = _dig(config, _P_OUTPUT_DIRECTORY, '.')
     try:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
     except Exception as e:
         raise ValueError(f"Cannot create output directory {output_dir}: {e}")
 
 
+# Key shapes that get normalized, tried in priority order; the name of the
+# matching group is the kind of normalization
+_NORMALIZE_KEY_RE = re.compile(
+    r'.*_(?P<path>directory|path|file)|(?P<bool>enable_).*|.*_(?P<list>list)',
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=1024)
+def _classify_config_key(key: str) -> Optional[str]:
+    """Return how values of a config key are normalized: 'path', 'bool', 'list' or None."""
+    match = _NORMALIZE_KEY_RE.fullmatch(key)
+    return match.lastgroup if match else None
+
+
+@lru_cache(maxsize=1024)
+def _resolve_path(path: str, cwd: str) -> str:
+    """Resolve a path against cwd, memoized since the same paths recur across configs."""
+    return str(Path(cwd, path).resolve())
+
+
 def _normalize_config_values(config: dict) -> dict:
     """Normalize and sanitize configuration values."""
     normalized = {}
@@ -404,16 +642,24 @@ def _normalize_config_values(config: dict) -> dict:
         if isinstance(section_config, dict):
             normalized_section = {}
             for key, value in section_config.items():
+                # Only strings and path objects are ever rewritten
+                if not isinstance(value, (str, os.PathLike)):
+                    normalized_section[key] = value
+                    continue
+                
+                kind = _classify_config_key(key)
+                
                 # Normalize paths
-                if key.endswith('_directory') or key.endswith('_path') or key.endswith('_file'):
-                    value = str(Path(value).resolve())
+                if kind == 'path':
+                    value = os.fspath(value)
+                    value = _resolve_path(value, '' if os.path.isabs(value) else os.getcwd())
                 
                 # Normalize boolean strings
-                elif isinstance(value, str) and key.startswith('enable_'):
-                    value = value.lower() in ['true', 'on', 'yes', '1']
+                elif kind == 'bool' and isinstance(value, str):
+                    value = value.lower() in _BOOL_TRUE
                 
                 # Normalize list values
-                elif isinstance(value, str) and key.endswith('_list'):
+                elif kind == 'list' and isinstance(value, str):
                     value = [item.strip() for item in value.split(',') if item.strip()]
                 
                 normalized_section[key] = value
@@ -448,20 +694,20 @@ def save_config(config: dict, output_path: str, format_type: Optional[str] = Non
     
     try:
         if format_type == 'json':
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(config_to_save, f, indent=2, sort_keys=True)
+            output_path.write_bytes(_json_dumps(config_to_save, pretty=True))
         
         elif format_type in ['yaml', 'yml']:
             if not HAS_YAML:
                 raise ImportError("PyYAML is required to save YAML configuration")
+            yaml, _, dumper = _yaml_backend()
             with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.safe_dump(config_to_save, f, default_flow_style=False, indent=2)
+                yaml.dump(config_to_save, f, Dumper=dumper, default_flow_style=False, indent=2)
         
         elif format_type == 'toml':
             if not HAS_TOML:
                 raise ImportError("toml is required to save TOML configuration")
             with open(output_path, 'w', encoding='utf-8') as f:
-                toml.dump(config_to_save, f)
+                _toml_backend().dump(config_to_save, f)
         
         elif format_type == 'cmxconfig':
             _save_cmx_config(config_to_save, output_path)
@@ -476,30 +722,33 @@ def save_config(config: dict, output_path: str, format_type: Optional[str] = Non
         raise
 
 
+_CMX_BOOL_STRINGS = {True: 'true', False: 'false'}
+
+
 def _save_cmx_config(config: dict, output_path: Path) -> None:
     """Save configuration in CMX format."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("# CMatrix Configuration File\n")
-        f.write(f"# Generated automatically\n\n")
-        
-        for section_name, section_config in config.items():
-            if isinstance(section_config, dict):
-                f.write(f"[{section_name}]\n")
-                for key, value in sorted(section_config.items()):
-                    if isinstance(value, bool):
-                        value_str = 'true' if value else 'false'
-                    elif isinstance(value, list):
-                        value_str = '[' + ', '.join(str(item) for item in value) + ']'
-                    elif value is None:
-                        value_str = 'null'
-                    else:
-                        value_str = str(value)
-                    
-                    f.write(f"{key} = {value_str}\n")
-                f.write("\n")
-            else:
-                # Handle non-section values
-                f.write(f"{section_name} = {section_config}\n")
+    parts = ["# CMatrix Configuration File\n# Generated automatically\n\n"]
+    
+    for section_name, section_config in config.items():
+        if isinstance(section_config, dict):
+            parts.append(f"[{section_name}]\n")
+            for key, value in sorted(section_config.items()):
+                if isinstance(value, bool):
+                    value_str = _CMX_BOOL_STRINGS[value]
+                elif isinstance(value, list):
+                    value_str = '[' + ', '.join(str(item) for item in value) + ']'
+                elif value is None:
+                    value_str = 'null'
+                else:
+                    value_str = str(value)
+                
+                parts.append(f"{key} = {value_str}\n")
+            parts.append("\n")
+        else:
+            # Handle non-section values
+            parts.append(f"{section_name} = {section_config}\n")
+    
+    output_path.write_text(''.join(parts), encoding='utf-8')
 
 
 def merge_configs(base_config: dict, override_config: dict) -> dict:
@@ -516,11 +765,10 @@ def merge_configs(base_config: dict, override_config: dict) -> dict:
     merged = base_config.copy()
     
     for section_name, section_config in override_config.items():
-        if section_name in merged and isinstance(merged[section_name], dict) and isinstance(section_config, dict):
+        base_section = merged.get(section_name)
+        if isinstance(base_section, dict) and isinstance(section_config, dict):
             # Merge section dictionaries
-            merged_section = merged[section_name].copy()
-            merged_section.update(section_config)
-            merged[section_name] = merged_section
+            merged[section_name] = {**base_section, **section_config}
         else:
             # Replace entire section
             merged[section_name] = section_config
@@ -528,6 +776,125 @@ def merge_configs(base_config: dict, override_config: dict) -> dict:
     return merged
 
 
+# Built-in configuration templates; get_config_template hands out deep copies
+_TEMPLATES = {
+    'default': {
+        'target': {
+            'platform': 'cpu',
+            'architecture': 'x86_64',
+            'optimization_level': 'O2',
+            'precision': 'float32'
+        },
+        'compiler': {
+            'backend': 'llvm',
+            'debug_info': False,
+            'optimization_flags': ['-ffast-math', '-funroll-loops']
+        },
+        'memory': {
+            'allocation_strategy': 'static',
+            'max_memory_mb': 1024,
+            'enable_memory_pool': True
+        },
+        'parallelization': {
+            'enable_threading': True,
+            'max_threads': -1,
+            'enable_vectorization': True
+        },
+        'optimization': {
+            'enable_fusion': True,
+            'enable_quantization': False
+        },
+        'output': {
+            'format': 'library',
+            'output_directory': './output',
+            'library_name': 'model'
+        }
+    },
+    
+    'gpu': {
+        'target': {
+            'platform': 'cuda',
+            'architecture': 'sm_70',
+            'optimization_level': 'O3',
+            'precision': 'float32'
+        },
+        'compiler': {
+            'backend': 'nvcc',
+            'debug_info': False,
+            'optimization_flags': ['-use_fast_math', '--maxrregcount=64']
+        },
+        'memory': {
+            'allocation_strategy': 'dynamic',
+            'max_memory_mb': 8192,
+            'enable_memory_pool': True,
+            'gpu_memory_fraction': 0.8
+        },
+        'parallelization': {
+            'enable_threading': True,
+            'enable_gpu': True,
+            'gpu_block_size': 256,
+            'gpu_grid_size': 'auto'
+        },
+        'optimization': {
+            'enable_fusion': True,
+            'enable_quantization': False,
+            'enable_tensor_core': True
+        },
+        'output': {
+            'format': 'shared_library',
+            'output_directory': './output',
+            'library_name': 'model_gpu'
+        }
+    },
+    
+    'quantized': {
+        'target': {
+            'platform': 'cpu',
+            'architecture': 'x86_64',
+            'optimization_level': 'Os',
+            'precision': 'float32'
+        },
+        'compiler': {
+            'backend': 'llvm',
+            'debug_info': False,
+            'optimization_flags': ['-ffast-math']
+        },
+        'memory': {
+            'allocation_strategy': 'static',
+            'max_memory_mb': 256,
+            'enable_memory_pool': True
+        },
+        'parallelization': {
+            'enable_threading': True,
+            'max_threads': 4,
+            'enable_vectorization': True
+        },
+        'optimization': {
+            'enable_fusion': True,
+            'enable_quantization': True,
+            'quantization_type': 'int8',
+            'quantization_mode': 'dynamic'
+        },
+        'output': {
+            'format': 'static_library',
+            'output_directory': './output',
+            'library_name': 'model_quantized'
+        }
+    },
+    
+    'minimal': {
+        'target': {
+            'platform': 'cpu',
+            'optimization_level': 'O2'
+        },
+        'output': {
+            'format': 'library',
+            'output_directory': './output'
+        }
+    }
+}
+
+
 def get_config_template(template_type: str = 'default') -> dict:
     """
     Get a configuration template for common use cases.
@@ -538,127 +905,49 @@ def get_config_template(template_type: str = 'default') -> dict:
     Returns:
         dict: Configuration template
     """
-    templates = {
-        'default': {
-            'target': {
-                'platform': 'cpu',
-                'architecture': 'x86_64',
-                'optimization_level': 'O2',
-                'precision': 'float32'
-            },
-            'compiler': {
-                'backend': 'llvm',
-                'debug_info': False,
-                'optimization_flags': ['-ffast-math', '-funroll-loops']
-            },
-            'memory': {
-                'allocation_strategy': 'static',
-                'max_memory_mb': 1024,
-                'enable_memory_pool': True
-            },
-            'parallelization': {
-                'enable_threading': True,
-                'max_threads': -1,
-                'enable_vectorization': True
-            },
-            'optimization': {
-                'enable_fusion': True,
-                'enable_quantization': False
-            },
-            'output': {
-                'format': 'library',
-                'output_directory': './output',
-                'library_name': 'model'
-            }
-        },
-        
-        'gpu': {
-            'target': {
-                'platform': 'cuda',
-                'architecture': 'sm_70',
-                'optimization_level': 'O3',
-                'precision': 'float32'
-            },
-            'compiler': {
-                'backend': 'nvcc',
-                'debug_info': False,
-                'optimization_flags': ['-use_fast_math', '--maxrregcount=64']
-            },
-            'memory': {
-                'allocation_strategy': 'dynamic',
-                'max_memory_mb': 8192,
-                'enable_memory_pool': True,
-                'gpu_memory_fraction': 0.8
-            },
-            'parallelization': {
-                'enable_threading': True,
-                'enable_gpu': True,
-                'gpu_block_size': 256,
-                'gpu_grid_size': 'auto'
-            },
-            'optimization': {
-                'enable_fusion': True,
-                'enable_quantization': False,
-                'enable_tensor_core': True
-            },
-            'output': {
-                'format': 'shared_library',
-                'output_directory': './output',
-                'library_name': 'model_gpu'
-            }
-        },
-        
-        'quantized': {
-            'target': {
-                'platform': 'cpu',
-                'architecture': 'x86_64',
-                'optimization_level': 'Os',
-                'precision': 'float32'
-            },
-            'compiler': {
-                'backend': 'llvm',
-                'debug_info': False,
-                'optimization_flags': ['-ffast-math']
-            },
-            'memory': {
-                'allocation_strategy': 'static',
-                'max_memory_mb': 256,
-                'enable_memory_pool': True
-            },
-            'parallelization': {
-                'enable_threading': True,
-                'max_threads': 4,
-                'enable_vectorization': True
-            },
-            'optimization': {
-                'enable_fusion': True,
-                'enable_quantization': True,
-                'quantization_type': 'int8',
-                'quantization_mode': 'dynamic'
-            },
-            'output': {
-                'format': 'static_library',
-                'output_directory': './output',
-                'library_name': 'model_quantized'
-            }
-        },
-        
-        'minimal': {
-            'target': {
-                'platform': 'cpu',
-                'optimization_level': 'O2'
-            },
-            'output': {
-                'format': 'library',
-                'output_directory': './output'
-            }
-        }
-    }
-    
-    if template_type not in templates:
+    if template_type not in _TEMPLATES:
         raise ValueError(f"Unknown template type: {template_type}")
     
-    return templates[template_type].copy()
+    return copy.deepcopy(_TEMPLATES[template_type])
+
+
+_TENSOR_CORE_PRECISION = frozenset({'float16', 'bfloat16', 'int8'})
+
+
+def _check_cuda(config: dict, architecture: str, precision: str, warnings: List[str]) -> None:
+    """CUDA architecture and Tensor Core precision checks."""
+    if not architecture.startswith('sm_'):
+        warnings.append("CUDA platform requires SM architecture specification (e.g., sm_70)")
+    
+    # Check precision compatibility
+    if precision not in _TENSOR_CORE_PRECISION and _dig(config, _P_ENABLE_TENSOR_CORE):
+        warnings.append(f"Tensor Core optimization requires {sorted(_TENSOR_CORE_PRECISION)} precision, got {precision}")
+
+
+def _check_gpu(config: dict, architecture: str, precision: str, warnings: List[str]) -> None:
+    """Generic GPU memory checks."""
+    if _dig(config, _P_MAX_MEMORY_MB, 1024) > 16384:
+        warnings.append("GPU memory allocation >16GB may not be supported on all devices")
+
+
+def _check_opencl(config: dict, architecture: str, precision: str, warnings: List[str]) -> None:
+    """OpenCL precision checks."""
+    if precision == 'float64':
+        warnings.append("Double precision may not be supported on all OpenCL devices")
+
+
+def _check_cpu(config: dict, architecture: str, precision: str, warnings: List[str]) -> None:
+    """CPU architecture/precision checks."""
+    if architecture == 'arm64' and precision == 'float64':
+        warnings.append("ARM64 may have limited float64 performance compared to float32")
+
+
+_PLATFORM_CHECKERS = {
+    'cuda': _check_cuda,
+    'gpu': _check_gpu,
+    'opencl': _check_opencl,
+    'cpu': _check_cpu,
+}
 
 
 def validate_target_compatibility(config: dict) -> List[str]:
@@ -673,39 +962,16 @@ def validate_target_compatibility(config: dict) -> List[str]:
     """
     warnings = []
     
-    target_config = config.get('target', {})
-    platform = target_config.get('platform', 'cpu')
-    architecture = target_config.get('architecture', '')
-    precision = target_config.get('precision', 'float32')
+    platform = _dig(config, _P_PLATFORM, 'cpu')
+    precision = _dig(config, _P_PRECISION, 'float32')
     
     # Platform-specific checks
-    if platform == 'cuda':
-        if not architecture.startswith('sm_'):
-            warnings.append("CUDA platform requires SM architecture specification (e.g., sm_70)")
-        
-        # Check precision compatibility
-        tensor_core_precision = ['float16', 'bfloat16', 'int8']
-        if precision not in tensor_core_precision and config.get('optimization', {}).get('enable_tensor_core'):
-            warnings.append(f"Tensor Core optimization requires {tensor_core_precision} precision, got {precision}")
-    
-    elif platform == 'opencl':
-        if precision == 'float64':
-            warnings.append("Double precision may not be supported on all OpenCL devices")
-    
-    elif platform == 'cpu':
-        if architecture == 'arm64' and precision == 'float64':
-            warnings.append("ARM64 may have limited float64 performance compared to float32")
-    
-    # Memory checks
-    memory_config = config.get('memory', {})
-    max_memory = memory_config.get('max_memory_mb', 1024)
-    
-    if platform == 'gpu' and max_memory > 16384:
-        warnings.append("GPU memory allocation >16GB may not be supported on all devices")
+    checker = _PLATFORM_CHECKERS.get(platform)
+    if checker is not None:
+        checker(config, _dig(config, _P_ARCHITECTURE, ''), precision, warnings)
     
     # Optimization compatibility
-    opt_config = config.get('optimization', {})
-    if opt_config.get('enable_quantization') and precision not in ['float32', 'float16']:
+    if _dig(config, _P_ENABLE_QUANTIZATION) and precision not in ('float32', 'float16'):
         warnings.append(f"Quantization from {precision} may not be optimal")
     
     return warnings
@@ -778,6 +1044,8 @@ def export_config_documentation(config: dict, output_path: str) -> None:
         config: Configuration dictionary
         output_path: Output markdown file path
     """
+    descriptions = _get_config_descriptions()
+    
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write("# CMatrix Configuration Documentation\n\n")
         f.write("This document describes the current configuration settings.\n\n")
@@ -793,8 +1061,8 @@ def export_config_documentation(config: dict, output_path: str) -> None:
                     f.write(f"- **{key}**: `{value}`\n")
                     
                     # Add descriptions for common settings
-                    if key in _get_config_descriptions():
-                        f.write(f"  - {_get_config_descriptions()[key]}\n")
+                    if key in descriptions:
+                        f.write(f"  - {descriptions[key]}\n")
                 
                 f.write("\n")
             else:
@@ -808,6 +1076,7 @@ def export_config_documentation(config: dict, output_path: str) -> None:
                 f.write(f"- **{key}**: `{value}`\n")
 
 
+@lru_cache(maxsize=1)
 def _get_config_descriptions() -> dict:
     """Get descriptions for configuration options."""
     return {
@@ -824,29 +1093,32 @@ def _get_config_descriptions() -> dict:
     }
 
 
-def check_config_updates(config_path: str) -> dict:
+def check_config_updates(config_path: str, previous: Optional[dict] = None) -> dict:
     """
     Check if configuration file has been updated since last parse.
     
     Args:
         config_path: Path to configuration file
+        previous: Config returned by parse_config, or its '_metadata' dict.
+            Without it the file is reported as updated.
     
     Returns:
         dict: Update status information
     """
-    config_path = Path(config_path)
-    
-    if not config_path.exists():
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
         return {'exists': False, 'updated': False}
     
-    # Get file modification time
-    mtime = config_path.stat().st_mtime
+    updated = True
+    if previous is not None:
+        metadata = previous.get('_metadata', previous)
+        updated = (metadata.get('mtime_ns'), metadata.get('size')) != (stat.st_mtime_ns, stat.st_size)
     
-    # Store/retrieve last check time (in practice, this would be persistent)
-    # For now, just return current status
     return {
         'exists': True,
-        'updated': True,  # Assume updated for now
-        'modification_time': mtime,
-        'size_bytes': config_path.stat().st_size
+        'updated': updated,
+        'modification_time': stat.st_mtime,
+        'mtime_ns': stat.st_mtime_ns,
+        'size_bytes': stat.st_size
     }
@@ -6,9 +6,15 @@ model testing, validation, and benchmarking processes.
 """
 
 import os
+import sys
 import json
+import mmap
 import struct
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Optional, Tuple, List, Any
 from pathlib import Path
 
@@ -26,48 +32,240 @@ try:
 except ImportError:
     HAS_CV2 = False
 
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Opt-in on-disk cache of loaded arrays (load_data(..., cache=True)), stored
+# as .npy so hits are a memory map instead of a re-decode. It lives in the
+# user's cache directory rather than a shared, world-writable temp dir
+_DISK_CACHE_DIR = Path(os.environ.get('CMX_DATA_CACHE') or
+                       Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'cmatrix' / 'data')
+_DISK_CACHE_MAX_BYTES = int(os.environ.get('CMX_DATA_CACHE_MB', '4096')) * 1024 * 1024
+
+# Running size of the disk cache; None until the directory is first scanned,
+# after which writes add to it and only exceeding the cap triggers a rescan
+_disk_cache_bytes = None
+_disk_cache_lock = threading.Lock()
+
+
+class _LRUCache:
+    """Byte-bounded, thread-safe LRU of read-only arrays."""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple) -> Optional[np.ndarray]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+    
+    def put(self, key: tuple, data: np.ndarray) -> None:
+        # A single huge entry would evict everything else
+        if data.nbytes > self.max_bytes // 4:
+            return
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous.nbytes
+            
+            self._entries[key] = data
+            self.current_bytes += data.nbytes
+            
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+# In-process cache consulted before the disk cache when cache=True
+_MEMORY_CACHE = _LRUCache(int(os.environ.get('CMX_CACHE_MB', '2048')) * 1024 * 1024)
+
+
+def clear_data_cache() -> None:
+    """Drop all arrays held by the in-memory data cache."""
+    _MEMORY_CACHE.clear()
+
+
+def _data_cache_key(file_path: str, stat: os.stat_result, dtype: str) -> tuple:
+    """Identity of a source file's current contents loaded as dtype."""
+    return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, np.dtype(dtype).str)
+
+
+def _disk_cache_path(key: tuple) -> Path:
+    """Cache file for a data cache key."""
+    identity = ':'.join(str(part) for part in key)
+    digest = hashlib.blake2b(identity.encode('utf-8'), digest_size=16).hexdigest()
+    return _DISK_CACHE_DIR / f"{digest}.npy"
+
+
+def _read_disk_cache(cache_path: Path) -> Optional[np.ndarray]:
+    """Memory-map a cached array, or return None on a miss."""
+    try:
+        data = _open_npy(cache_path)
+    except (OSError, ValueError):
+        return None
+    
+    # Refresh the mtime so eviction drops the least recently used entries
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return data
+
+
+def _write_disk_cache(cache_path: Path, data: np.ndarray) -> None:
+    """Atomically store an array in the disk cache, then enforce its size cap."""
+    global _disk_cache_bytes
+    
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        _DISK_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            np.save(f, data)
+            size = f.tell()
+        try:
+            replaced = os.stat(cache_path).st_size
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logging.debug(f"Could not write data cache {cache_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+    
+    with _disk_cache_lock:
+        if _disk_cache_bytes is None:
+            _disk_cache_bytes = _evict_disk_cache()
+        else:
+            _disk_cache_bytes += size - replaced
+            if _disk_cache_bytes > _DISK_CACHE_MAX_BYTES:
+                _disk_cache_bytes = _evict_disk_cache()
+
+
+def _evict_disk_cache() -> int:
+    """Delete least recently used cache files once over the size cap; return the remaining size."""
+    entries = []
+    for entry in os.scandir(_DISK_CACHE_DIR):
+        if entry.name.endswith('.npy'):
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+    
+    # Trim to 90% of the cap so the next few writes do not rescan again
+    total = sum(size for _, size, _ in entries)
+    target = _DISK_CACHE_MAX_BYTES if total <= _DISK_CACHE_MAX_BYTES else _DISK_CACHE_MAX_BYTES * 9 // 10
+    for _, size, path in sorted(entries):
+        if total <= target:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+    
+    return total
 
-def load_data(file_path: str, dtype: str = 'float32') -> np.ndarray:
+
+def load_data(file_path: str, dtype: str = 'float32', cache: bool = False) -> np.ndarray:
     """
     Load input data from file (binary, CSV, image, or numpy format).
     
     Args:
         file_path: Path to the data file
         dtype: Target data type ('float32', 'float64', 'int32', etc.)
+        cache: Keep the loaded array in an in-memory LRU (capped at
+            CMX_CACHE_MB) and an on-disk cache (CMX_DATA_CACHE, default
+            ~/.cache/cmatrix/data, capped at CMX_DATA_CACHE_MB), and reuse it while
+            the file's mtime and size are unchanged
     
     Returns:
-        np.ndarray: Loaded data array
+        np.ndarray: Loaded data array. .npy files already stored in the target
+        dtype, .bin files and all cached loads come back read-only
+        (memory-mapped, or read with direct I/O when large); copy them before
+        modifying in place.
     
     Raises:
         FileNotFoundError: If file doesn't exist
         ValueError: If file format is unsupported
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Data file not found: {file_path}")
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Data file not found: {file_path}") from None
+    
+    cache_key = cache_path = None
+    if cache:
+        cache_key = _data_cache_key(file_path, stat, dtype)
+        data = _MEMORY_CACHE.get(cache_key)
+        if data is not None:
+            return data.view()
+        
+        cache_path = _disk_cache_path(cache_key)
+        data = _read_disk_cache(cache_path)
+        if data is not None:
+            _MEMORY_CACHE.put(cache_key, data)
+            return data.view()
     
     file_path = Path(file_path)
     extension = file_path.suffix.lower()
     
     try:
         if extension == '.npy':
-            return _load_numpy_file(file_path, dtype)
+            data = _load_numpy_file(file_path, dtype)
         elif extension == '.npz':
-            return _load_numpy_archive(file_path, dtype)
+            data = _load_numpy_archive(file_path, dtype)
         elif extension in ['.csv', '.txt']:
-            return _load_text_file(file_path, dtype)
+            data = _load_text_file(file_path, dtype)
         elif extension == '.bin':
-            return _load_binary_file(file_path, dtype)
+            data = _load_binary_file(file_path, dtype)
         elif extension in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']:
-            return _load_image_file(file_path, dtype)
+            data = _load_image_file(file_path, dtype)
         elif extension == '.json':
-            return _load_json_file(file_path, dtype)
+            data = _load_json_file(file_path, dtype)
         else:
             # Try to infer format from content
-            return _load_auto_detect(file_path, dtype)
+            data = _load_auto_detect(file_path, dtype)
             
     except Exception as e:
         logging.error(f"Failed to load data from {file_path}: {e}")
         raise ValueError(f"Unable to load data from {file_path}: {e}")
+    
+    if cache:
+        _write_disk_cache(cache_path, data)
+        
+        # The caller gets the same read-only view the memory cache keeps,
+        # so no one can modify the cached array in place
+        data = data.view()
+        data.setflags(write=False)
+        _MEMORY_CACHE.put(cache_key, data)
+        return data.view()
+    
+    return data
 
 
 def load_test_data(data_type: str, shape: Tuple[int, ...], 
@@ -137,52 +335,166 @@ def save_data(data: np.ndarray, file_path: str, format_type: Optional[str] = Non
     if format_type is None:
         format_type = file_path.suffix.lower().lstrip('.')
     
+    # np.save / np.savez_compressed add these extensions when missing
+    if format_type in ('npy', 'npz') and not file_path.name.endswith(f'.{format_type}'):
+        file_path = file_path.with_name(f"{file_path.name}.{format_type}")
+    
     # Ensure output directory exists
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
+    # Write beside the target and swap it in: data loaded from file_path may
+    # still be memory-mapped from it, and truncating it in place would
+    # destroy the source mid-write
+    tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    
     try:
-        if format_type == 'npy':
-            np.save(file_path, data)
-        
-        elif format_type == 'npz':
-            np.savez_compressed(file_path, data=data)
-        
-        elif format_type == 'csv':
-            if data.ndim > 2:
-                # Flatten high-dimensional arrays for CSV
-                data_2d = data.reshape(data.shape[0], -1)
-                np.savetxt(file_path, data_2d, delimiter=',', fmt='%.6f')
-            else:
-                np.savetxt(file_path, data, delimiter=',', fmt='%.6f')
-        
-        elif format_type == 'bin':
-            data.astype(np.float32).tobytes()
-            with open(file_path, 'wb') as f:
+        with open(tmp_path, 'wb') as f:
+            if format_type == 'npy':
+                np.save(f, data)
+            
+            elif format_type == 'npz':
+                np.savez_compressed(f, data=data)
+            
+            elif format_type == 'csv':
+                if data.ndim > 2:
+                    # Flatten high-dimensional arrays for CSV
+                    data_2d = data.reshape(data.shape[0], -1)
+                    np.savetxt(f, data_2d, delimiter=',', fmt='%.6f')
+                else:
+                    np.savetxt(f, data, delimiter=',', fmt='%.6f')
+            
+            elif format_type == 'bin':
+                data.astype(np.float32).tobytes()
                 f.write(data.tobytes())
-        
-        elif format_type == 'json':
-            data_list = data.tolist()
-            with open(file_path, 'w') as f:
-                json.dump({
-                    'data': data_list,
-                    'shape': list(data.shape),
-                    'dtype': str(data.dtype)
-                }, f, indent=2)
-        
-        else:
-            raise ValueError(f"Unsupported save format: {format_type}")
             
+            elif format_type == 'json':
+                payload = _encode_json_array(data)
+                if payload is None:
+                    payload = json.dumps({
+                        'data': data.tolist(),
+                        'shape': list(data.shape),
+                        'dtype': str(data.dtype)
+                    }, indent=2).encode('utf-8')
+                f.write(payload)
+            
+            else:
+                raise ValueError(f"Unsupported save format: {format_type}")
+        
+        os.replace(tmp_path, file_path)
         logging.info(f"Data saved to {file_path} in {format_type} format")
         
     except Exception as e:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         logging.error(f"Failed to save data to {file_path}: {e}")
         raise
 
 
+def _encode_json_array(data: np.ndarray) -> Optional[bytes]:
+    """
+    Serialize an array straight from its buffer with orjson.
+    
+    Returns None when orjson is unavailable, the dtype is unsupported, or
+    the data holds NaN/Inf (orjson would write null), leaving the caller to
+    use the json.dump path.
+    """
+    if not HAS_ORJSON:
+        return None
+    if np.issubdtype(data.dtype, np.floating) and not np.isfinite(data).all():
+        return None
+    
+    try:
+        # orjson needs C-contiguous, native byte order buffers
+        native = np.ascontiguousarray(data, dtype=data.dtype.newbyteorder('='))
+        return orjson.dumps({
+            'data': native,
+            'shape': list(data.shape),
+            'dtype': str(data.dtype)
+        }, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2)
+    except TypeError:
+        return None
+
+
+def _open_npy(file_path: Path) -> np.ndarray:
+    """Open a .npy file read-only, memory-mapping it only when it is large."""
+    if os.path.getsize(file_path) < _MMAP_MIN_BYTES:
+        data = np.load(file_path)
+        data.setflags(write=False)
+        return data
+    return np.load(file_path, mmap_mode='r')
+
+
 def _load_numpy_file(file_path: Path, dtype: str) -> np.ndarray:
-    """Load NumPy .npy file."""
-    data = np.load(file_path)
-    return data.astype(dtype)
+    """Load NumPy .npy file, read-only when no cast is needed."""
+    data = _open_npy(file_path)
+    
+    # Large files: pull the whole payload in with direct I/O and lay the
+    # array over it using the header the memory map already parsed
+    if data.nbytes >= _DIRECT_IO_MIN_BYTES:
+        buffer = _read_direct(file_path, data.offset + data.nbytes)
+        if buffer is not None:
+            order = 'F' if data.flags.f_contiguous and not data.flags.c_contiguous else 'C'
+            data = np.ndarray(data.shape, data.dtype, buffer, offset=data.offset, order=order)
+            data.setflags(write=False)
+    
+    return data.astype(dtype, copy=False)
+
+
+# Files at least this large are read with O_DIRECT on Linux, bypassing the
+# page cache and its extra copy; smaller ones are memory-mapped
+_DIRECT_IO_MIN_BYTES = 64 * 1024 * 1024
+_DIRECT_IO_ALIGN = 4096
+_DIRECT_IO_CHUNK = 16 * 1024 * 1024
+_DIRECT_IO_WORKERS = 4
+# Every live memory map keeps a duplicate file descriptor open, so files
+# below this size are read into memory instead; otherwise holding many
+# small arrays (e.g. load_from_manifest) runs out of descriptors
+_MMAP_MIN_BYTES = 16 * 1024 * 1024
+_HAS_DIRECT_IO = sys.platform.startswith('linux') and hasattr(os, 'O_DIRECT') and hasattr(os, 'preadv')
+
+
+def _read_direct(file_path: Path, file_size: int) -> Optional[mmap.mmap]:
+    """
+    Read the first file_size bytes of a file with O_DIRECT.
+    
+    The destination is an anonymous (page-aligned) mapping, filled in
+    aligned chunks by a few threads so several reads are in flight at once.
+    Returns None where direct I/O is unavailable or refused (e.g. tmpfs,
+    some network filesystems) so the caller can fall back to mmap.
+    """
+    if not _HAS_DIRECT_IO:
+        return None
+    
+    try:
+        fd = os.open(file_path, os.O_RDONLY | os.O_DIRECT)
+    except OSError:
+        return None
+    
+    try:
+        buffer_size = -(-file_size // _DIRECT_IO_ALIGN) * _DIRECT_IO_ALIGN
+        buffer = mmap.mmap(-1, buffer_size)
+        view = memoryview(buffer)
+        
+        def read_chunk(offset: int) -> None:
+            end = min(offset + _DIRECT_IO_CHUNK, buffer_size)
+            position = offset
+            while position < min(end, file_size):
+                count = os.preadv(fd, [view[position:end]], position)
+                if count == 0:
+                    break
+                position += count
+        
+        with ThreadPoolExecutor(max_workers=_DIRECT_IO_WORKERS) as pool:
+            list(pool.map(read_chunk, range(0, buffer_size, _DIRECT_IO_CHUNK)))
+        
+        return buffer
+    except OSError as e:
+        logging.debug(f"Direct I/O read of {file_path} failed, using mmap: {e}")
+        return None
+    finally:
+        os.close(fd)
 
 
 def _load_numpy_archive(file_path: Path, dtype: str) -> np.ndarray:
@@ -203,31 +515,56 @@ def _load_numpy_archive(file_path: Path, dtype: str) -> np.ndarray:
     return data.astype(dtype)
 
 
+def _sniff_text_delimiter(file_path: Path) -> Optional[str]:
+    """Return ',' for comma-separated text or None for whitespace-separated."""
+    with open(file_path, 'r', errors='replace') as f:
+        head = f.read(4096)
+    
+    for line in head.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if line:
+            return ',' if ',' in line else None
+    
+    return None
+
+
 def _load_text_file(file_path: Path, dtype: str) -> np.ndarray:
     """Load CSV or text file."""
-    try:
-        # Try comma-separated first
-        data = np.loadtxt(file_path, delimiter=',', dtype=dtype)
-    except ValueError:
-        try:
-            # Try space/tab separated
-            data = np.loadtxt(file_path, dtype=dtype)
-        except ValueError:
-            # Try as single column
-            data = np.loadtxt(file_path, dtype=dtype, ndmin=1)
+    # Decide the delimiter up front so the file is parsed exactly once
+    delimiter = _sniff_text_delimiter(file_path)
     
-    return data
+    if HAS_PANDAS:
+        # C tokenizer with a fixed dtype converts straight to numbers;
+        # squeeze to match np.loadtxt's handling of single rows/columns
+        frame = pd.read_csv(file_path, sep=delimiter or r'\s+', header=None,
+                            dtype=np.dtype(dtype), comment='#', engine='c')
+        return np.squeeze(frame.to_numpy(dtype=dtype))
+    
+    return np.loadtxt(file_path, delimiter=delimiter, dtype=dtype)
 
 
 def _load_binary_file(file_path: Path, dtype: str, shape: Optional[Tuple[int, ...]] = None) -> np.ndarray:
-    """Load binary file."""
+    """Load raw binary file as a read-only array."""
     np_dtype = np.dtype(dtype)
-    
-    with open(file_path, 'rb') as f:
-        data_bytes = f.read()
-    
-    # Convert bytes to numpy array
-    data = np.frombuffer(data_bytes, dtype=np_dtype)
+    file_size = os.path.getsize(file_path)
+    
+    if file_size % np_dtype.itemsize:
+        raise ValueError(f"File size {file_size} is not a multiple of {np_dtype} element size")
+    
+    data = None
+    if file_size >= _DIRECT_IO_MIN_BYTES:
+        buffer = _read_direct(file_path, file_size)
+        if buffer is not None:
+            data = np.frombuffer(buffer, dtype=np_dtype, count=file_size // np_dtype.itemsize)
+            data.setflags(write=False)
+    
+    # Otherwise map large files read-only instead of copying them into memory
+    if data is None:
+        if file_size < _MMAP_MIN_BYTES:
+            data = np.fromfile(file_path, dtype=np_dtype)
+            data.setflags(write=False)
+        else:
+            data = np.memmap(file_path, dtype=np_dtype, mode='r')
     
     if shape is not None:
         data = data.reshape(shape)
@@ -246,27 +583,27 @@ def _load_image_file(file_path: Path, dtype: str) -> np.ndarray:
 
 
 def _load_image_pil(file_path: Path, dtype: str) -> np.ndarray:
-    """Load image using PIL."""
-    image = Image.open(file_path)
-    
-    # Convert to RGB if necessary
-    if image.mode != 'RGB':
-        image = image.convert('RGB')
-    
-    # Convert to numpy array
-    data = np.array(image, dtype=dtype)
+    """Load image using PIL (or a Pillow-SIMD drop-in, if installed)."""
+    with Image.open(file_path) as image:
+        # Convert to RGB if necessary
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        
+        # Convert to numpy array
+        data = np.array(image, dtype=dtype)
     
-    # Normalize to 0-1 range if float type
-    if np.issubdtype(np.dtype(dtype), np.floating):
-        data = data / 255.0
+    # Normalize to 0-1 range if float type, reusing the converted buffer
+    if np.issubdtype(data.dtype, np.floating):
+        np.divide(data, 255.0, out=data)
     
     return data
 
 
 def _load_image_cv2(file_path: Path, dtype: str) -> np.ndarray:
     """Load image using OpenCV."""
-    # OpenCV loads as BGR by default
-    image = cv2.imread(str(file_path), cv2.IMREAD_COLOR)
+    # Decode from the raw bytes (one read, and safe for non-ASCII paths);
+    # OpenCV decodes as BGR by default
+    image = cv2.imdecode(np.fromfile(file_path, dtype=np.uint8), cv2.IMREAD_COLOR)
     
     if image is None:
         raise ValueError(f"Could not load image: {file_path}")
@@ -277,17 +614,28 @@ def _load_image_cv2(file_path: Path, dtype: str) -> np.ndarray:
     # Convert to specified dtype
     data = image.astype(dtype)
     
-    # Normalize to 0-1 range if float type
-    if np.issubdtype(np.dtype(dtype), np.floating):
-        data = data / 255.0
+    # Normalize to 0-1 range if float type, in place on the converted copy
+    if np.issubdtype(data.dtype, np.floating):
+        np.divide(data, 255.0, out=data)
     
     return data
 
 
+def _parse_json_bytes(raw: bytes) -> Any:
+    """Parse JSON with orjson when available, else the standard library."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals (as written by json.dump) are not strict
+            # JSON; only the standard parser accepts them
+            pass
+    return json.loads(raw)
+
+
 def _load_json_file(file_path: Path, dtype: str) -> np.ndarray:
     """Load JSON file containing array data."""
-    with open(file_path, 'r') as f:
-        json_data = json.load(f)
+    json_data = _parse_json_bytes(file_path.read_bytes())
     
     # Handle different JSON structures
     if isinstance(json_data, dict):
@@ -335,15 +683,29 @@ def _load_auto_detect(file_path: Path, dtype: str) -> np.ndarray:
     raise ValueError(f"Could not auto-detect format for {file_path}")
 
 
+def _load_or_skip(file_path: str, dtype: str, kwargs: dict) -> Optional[np.ndarray]:
+    """Load one file for a batch, logging and returning None on failure."""
+    try:
+        return load_data(file_path, dtype=dtype, **kwargs)
+    except Exception as e:
+        logging.warning(f"Skipping {file_path} due to error: {e}")
+        return None
+
+
 def load_batch_data(file_paths: List[str], batch_size: int = 32, 
-                   dtype: str = 'float32', **kwargs) -> List[np.ndarray]:
+                   dtype: str = 'float32', num_workers: Optional[int] = None,
+                   **kwargs) -> List[np.ndarray]:
     """
     Load multiple data files as batches.
     
+    Files are read concurrently by a thread pool (file I/O and decoding
+    release the GIL) while completed batches are stacked in order.
+    
     Args:
         file_paths: List of file paths to load
         batch_size: Number of samples per batch
         dtype: Target data type
+        num_workers: Loader threads (None = ThreadPoolExecutor default)
         **kwargs: Additional arguments for load_data
     
     Returns:
@@ -352,20 +714,28 @@ def load_batch_data(file_paths: List[str], batch_size: int = 32,
     batches = []
     current_batch = []
     
-    for file_path in file_paths:
-        try:
-            data = load_data(file_path, dtype=dtype, **kwargs)
-            current_batch.append(data)
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        # map() submits every file up front and yields results in input
+        # order, so stacking batch N overlaps with reading batch N+1
+        results = pool.map(_load_or_skip, file_paths,
+                           [dtype] * len(file_paths), [kwargs] * len(file_paths))
+        
+        for file_path, data in zip(file_paths, results):
+            if data is None:
+                continue
             
-            if len(current_batch) >= batch_size:
-                # Stack current batch
-                batch_array = np.stack(current_batch, axis=0)
-                batches.append(batch_array)
-                current_batch = []
+            try:
+                current_batch.append(data)
                 
-        except Exception as e:
-            logging.warning(f"Skipping {file_path} due to error: {e}")
-            continue
+                if len(current_batch) >= batch_size:
+                    # Stack current batch
+                    batch_array = np.stack(current_batch, axis=0)
+                    batches.append(batch_array)
+                    current_batch = []
+                    
+            except Exception as e:
+                logging.warning(f"Skipping {file_path} due to error: {e}")
+                continue
     
     # Handle remaining samples
     if current_batch: